@@ -1,7 +1,7 @@
 import numpy as np
 import math
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+
+from metnum.integrator import DormandPrince
 
 # ======================================================
 # 1. PARAMETER FISIS
@@ -48,86 +48,138 @@ def PID_control(theta, theta_dot, dt):
 # ======================================================
 dt = 0.02              # Time step
 t_max = 10             # Durasi simulasi (detik)
-t = np.arange(0, t_max, dt)
-
-# Array kosong untuk menampung data
-theta = np.zeros(len(t))
-theta_dot = np.zeros(len(t))
-
-# Kondisi Awal
-theta[0] = math.radians(90) # Mulai dari 90 derajat
-theta_dot[0] = 0.0
-
-print("Sedang menghitung fisika...")
-for i in range(len(t) - 1):
-    # Hitung Torsi dari PID
-    tau = 0.0
-
-    # Rumus Gerak (F=ma versi putar): 
-    # Percepatan Sudut = (TorsiPID - TorsiGravitasi - Gesekan) / Inersia
-    theta_ddot = (tau - B * math.sin(theta[i]) - c * theta_dot[i]) / A
-
-    # Update Kecepatan & Posisi (Euler Method)
-    theta_dot[i+1] = theta_dot[i] + theta_ddot * dt
-    theta[i+1] = theta[i] + theta_dot[i+1] * dt
-
-# Konversi ke Koordinat X, Y untuk gambar
-# (Menggunakan ujung batang sebagai posisi bola)
-x = l * np.sin(theta)
-y = -l * np.cos(theta)
 
-print("Selesai menghitung. Membuka animasi...")
-
-# ======================================================
-# 4. SETUP ANIMASI & GRAFIK (GUI)
-# ======================================================
-fig = plt.figure(figsize=(10, 8))
-
-# --- Plot Animasi (Atas) ---
-ax_anim = fig.add_subplot(2, 1, 1)
-# Kasih batas lebih lebar (1.5x panjang tali) biar gak mentok pinggir
-ax_anim.set_xlim(-l*1.5, l*1.5)
-ax_anim.set_ylim(-l*1.5, l*1.5)
-ax_anim.set_aspect('equal')
-ax_anim.grid(True)
-ax_anim.set_title("Simulasi Pendulum (Pre-Calculated)")
-
-# Garis batang dan Bola
-line, = ax_anim.plot([], [], 'o-', lw=3, color='black')
-mass_point, = ax_anim.plot([], [], 'o', markersize=20, color='red')
-time_template = 'Waktu = %.1fs'
-time_text = ax_anim.text(0.05, 0.9, '', transform=ax_anim.transAxes)
-
-# --- Plot Grafik (Bawah) ---
-ax_graph = fig.add_subplot(2, 1, 2)
-ax_graph.set_title("Grafik Respon PID")
-ax_graph.set_xlabel("Waktu (detik)")
-ax_graph.set_ylabel("Sudut (radian)")
-ax_graph.grid(True)
-ax_graph.plot(t, theta, color='blue') # Plot semua data sekaligus
-ax_graph.axhline(0, color='black', linestyle='--') # Garis target
-
-# Penanda posisi waktu di grafik (Garis merah berjalan)
-time_line, = ax_graph.plot([], [], 'r|', markersize=15, markeredgewidth=2)
-
-# ======================================================
-# 5. FUNGSI UPDATE ANIMASI
-# ======================================================
-def update(frame):
-    # Update posisi Garis: Dari (0,0) ke (x,y)
-    line.set_data([0, x[frame]], [0, y[frame]])
-    
-    # Update posisi Bola: [x], [y] -> HARUS PAKAI KURUNG SIKU []
-    mass_point.set_data([x[frame]], [y[frame]])
-    
-    # Update teks waktu
-    time_text.set_text(time_template % (frame * dt))
-    
-    # Update garis penanda di grafik bawah
-    time_line.set_data([t[frame]], [theta[frame]])
-
-    return line, mass_point, time_text, time_line
-
-# Jalankan Animasi
-ani = FuncAnimation(fig, update, frames=len(t), interval=dt*1000, blit=True)
-plt.show()
\ No newline at end of file
+# True = dinamika diintegrasi Dormand-Prince adaptif (RK45) di antara sampel kontrol,
+# torsi PID ditahan konstan selama satu dt (zero-order hold)
+PAKAI_RK45 = False
+TOLERANSI_RK45 = 1e-6
+
+# False = tanpa kontrol (tau = 0, bandul berayun bebas, seperti semula); True = torsi dari PID_control
+PAKAI_PID = False
+# Tuning banyak Kp/Ki/Kd & sudut awal sekaligus dengan PID (tanpa GUI): python -m metnum.sweep_pid
+
+def turunan(y, tau):
+    """Rumus gerak yang sama dalam bentuk dy/dt, y = [theta, theta_dot]."""
+    return [y[1], (tau - B * math.sin(y[0]) - c * y[1]) / A]
+
+def simulasi(sudut_awal_derajat=90.0, pakai_pid=None):
+    """
+    Hitung seluruh lintasan dulu; mengembalikan (t, theta, theta_dot).
+    pakai_pid: True/False untuk satu pemanggilan, None = ikut PAKAI_PID.
+    """
+    if pakai_pid is None:
+        pakai_pid = PAKAI_PID
+    global integral, prev_error
+    integral = 0.0
+    prev_error = 0.0
+
+    t = np.arange(0, t_max, dt)
+
+    # Array kosong untuk menampung data
+    theta = np.zeros(len(t))
+    theta_dot = np.zeros(len(t))
+
+    # Kondisi Awal
+    theta[0] = math.radians(sudut_awal_derajat) # Default mulai dari 90 derajat
+    theta_dot[0] = 0.0
+
+    print("Sedang menghitung fisika...")
+    if PAKAI_RK45:
+        ode = DormandPrince(lambda t_, y: turunan(y, 0.0), t[0], [theta[0], theta_dot[0]],
+                            rtol=TOLERANSI_RK45, atol=TOLERANSI_RK45 * 1e-3)
+        tau_lama = 0.0
+
+    for i in range(len(t) - 1):
+        # Hitung Torsi dari PID
+        tau = PID_control(theta[i], theta_dot[i], dt) if pakai_pid else 0.0
+
+        if PAKAI_RK45:
+            # rumus hanya diganti kalau torsinya berubah; selama torsi tetap langkahnya bebas membesar
+            if tau != tau_lama:
+                ode.ganti_rhs(lambda t_, y, tau=tau: turunan(y, tau), t[i])
+                tau_lama = tau
+            theta[i+1], theta_dot[i+1] = ode.maju_ke(t[i+1])
+            continue
+
+        # Rumus Gerak (F=ma versi putar): 
+        # Percepatan Sudut = (TorsiPID - TorsiGravitasi - Gesekan) / Inersia
+        theta_ddot = (tau - B * math.sin(theta[i]) - c * theta_dot[i]) / A
+
+        # Update Kecepatan & Posisi (Euler Method)
+        theta_dot[i+1] = theta_dot[i] + theta_ddot * dt
+        theta[i+1] = theta[i] + theta_dot[i+1] * dt
+
+    if PAKAI_RK45:
+        print(f"RK45: {ode.n_langkah} langkah, {ode.n_tolak} ditolak, {ode.n_eval} evaluasi")
+    return t, theta, theta_dot
+
+def main():
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
+    t, theta, theta_dot = simulasi()
+
+    # Konversi ke Koordinat X, Y untuk gambar
+    # (Menggunakan ujung batang sebagai posisi bola)
+    x = l * np.sin(theta)
+    y = -l * np.cos(theta)
+
+    print("Selesai menghitung. Membuka animasi...")
+
+    # ======================================================
+    # 4. SETUP ANIMASI & GRAFIK (GUI)
+    # ======================================================
+    fig = plt.figure(figsize=(10, 8))
+
+    # --- Plot Animasi (Atas) ---
+    ax_anim = fig.add_subplot(2, 1, 1)
+    # Kasih batas lebih lebar (1.5x panjang tali) biar gak mentok pinggir
+    ax_anim.set_xlim(-l*1.5, l*1.5)
+    ax_anim.set_ylim(-l*1.5, l*1.5)
+    ax_anim.set_aspect('equal')
+    ax_anim.grid(True)
+    ax_anim.set_title("Simulasi Pendulum (Pre-Calculated)")
+
+    # Garis batang dan Bola
+    line, = ax_anim.plot([], [], 'o-', lw=3, color='black')
+    mass_point, = ax_anim.plot([], [], 'o', markersize=20, color='red')
+    time_template = 'Waktu = %.1fs'
+    time_text = ax_anim.text(0.05, 0.9, '', transform=ax_anim.transAxes)
+
+    # --- Plot Grafik (Bawah) ---
+    ax_graph = fig.add_subplot(2, 1, 2)
+    ax_graph.set_title("Grafik Respon PID")
+    ax_graph.set_xlabel("Waktu (detik)")
+    ax_graph.set_ylabel("Sudut (radian)")
+    ax_graph.grid(True)
+    ax_graph.plot(t, theta, color='blue') # Plot semua data sekaligus
+    ax_graph.axhline(0, color='black', linestyle='--') # Garis target
+
+    # Penanda posisi waktu di grafik (Garis merah berjalan)
+    time_line, = ax_graph.plot([], [], 'r|', markersize=15, markeredgewidth=2)
+
+    # ======================================================
+    # 5. FUNGSI UPDATE ANIMASI
+    # ======================================================
+    def update(frame):
+        # Update posisi Garis: Dari (0,0) ke (x,y)
+        line.set_data([0, x[frame]], [0, y[frame]])
+
+        # Update posisi Bola: [x], [y] -> HARUS PAKAI KURUNG SIKU []
+        mass_point.set_data([x[frame]], [y[frame]])
+
+        # Update teks waktu
+        time_text.set_text(time_template % (frame * dt))
+
+        # Update garis penanda di grafik bawah
+        time_line.set_data([t[frame]], [theta[frame]])
+
+        return line, mass_point, time_text, time_line
+
+    # Jalankan Animasi
+    ani = FuncAnimation(fig, update, frames=len(t), interval=dt*1000, blit=True)
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""remove_baseline: fit polinomial per sampel (tempCodeRunnerFile.py) vs metnum.baseline,
+ditambah semua estimator baseline pada Person_*.txt."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from metnum.baseline import (
+    baseline_als, baseline_median, baseline_morfologi, baseline_whittaker, remove_baseline_fast,
+)
+from metnum.detrend import poly_detrend
+from tempCodeRunnerFile import remove_baseline
+
+WINDOW = 200
+ORDE = 3
+
+
+@pytest.mark.parametrize("n", [500, 2000])
+def bench_remove_baseline_asli(benchmark, fetal, n):
+    """Fungsi asli tempCodeRunnerFile.py, O(N * window) di Python murni, jadi hanya ukuran kecil."""
+    t, y = fetal
+    benchmark.group = f"remove_baseline:{n}"
+    benchmark.pedantic(remove_baseline, args=(t[:n].tolist(), y[:n].tolist(), WINDOW, ORDE), rounds=1)
+
+
+@pytest.mark.parametrize("n", [500, 2000, 9999])
+def bench_remove_baseline_fast(benchmark, fetal, n):
+    t, y = fetal
+    benchmark.group = f"remove_baseline:{n}"
+    benchmark(remove_baseline_fast, t[:n], y[:n], WINDOW, ORDE)
+
+
+# ---------- estimator baseline pada semua Person_*.txt ----------
+
+def _semua(fungsi, rekaman, *args):
+    return [fungsi(t, y, *args) for t, y in rekaman]
+
+
+def _polinomial_global(t, y, orde=15):
+    """Cara code2.py: satu polinomial orde 15 untuk seluruh rekaman."""
+    hasil = poly_detrend(t, y, orde)
+    return hasil.y_detrended, hasil.baseline
+
+
+PERSON = {
+    "polinomial_global_15": _polinomial_global,
+    "lokal_kubik_fast": lambda t, y: remove_baseline_fast(t, y, WINDOW, ORDE)[:2],
+    "whittaker": baseline_whittaker,
+    "als": baseline_als,
+    "median": baseline_median,
+    "morfologi": baseline_morfologi,
+}
+
+
+@pytest.mark.parametrize("metode", list(PERSON))
+def bench_baseline_person(benchmark, person, metode):
+    benchmark.group = f"baseline:Person_*x{len(person)}"
+    benchmark(_semua, PERSON[metode], person)
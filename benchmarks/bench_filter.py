@@ -0,0 +1,48 @@
+"""Jalur firwin/lfilter testdps.py: desain filter, filtering, dan deteksi R-peak."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+signal = pytest.importorskip("scipy.signal")
+
+from metnum.qrs_detect import detect_r_peaks
+from metnum.qrs_filter import design_bandpass, filter_signal
+
+FS = 500.0
+M = 50
+UKURAN = [1000, 4999, 50000]
+
+
+def _sinyal(ekg_dps, n):
+    """n sampel dataset.txt; lebih panjang dari file = rekaman diulang."""
+    _, y = ekg_dps
+    return np.resize(y, n)
+
+
+def bench_design_bandpass(benchmark):
+    # __wrapped__: ukur firwin-nya, bukan lookup lru_cache
+    benchmark(design_bandpass.__wrapped__, FS, 8.0, 20.0, M, "hamming")
+
+
+@pytest.mark.parametrize("n", UKURAN)
+def bench_lfilter_roll(benchmark, ekg_dps, n):
+    """Kode asli testdps.py: lfilter lalu np.roll untuk koreksi delay."""
+    x = _sinyal(ekg_dps, n)
+    b = np.array(design_bandpass(FS, 8.0, 20.0, M, "hamming"))
+    benchmark.group = f"filter:{n}"
+    benchmark(lambda: np.roll(signal.lfilter(b, 1.0, x), -M))
+
+
+@pytest.mark.parametrize("n", UKURAN)
+def bench_filter_signal(benchmark, ekg_dps, n):
+    x = _sinyal(ekg_dps, n)
+    b = design_bandpass(FS, 8.0, 20.0, M, "hamming")
+    benchmark.group = f"filter:{n}"
+    benchmark(filter_signal, b, x)
+
+
+@pytest.mark.parametrize("n", UKURAN)
+def bench_detect_r_peaks(benchmark, ekg_dps, n):
+    x = filter_signal(design_bandpass(FS, 8.0, 20.0, M, "hamming"), _sinyal(ekg_dps, n))
+    benchmark(detect_r_peaks, x, FS)
@@ -0,0 +1,52 @@
+"""
+Pembacaan dataset: parsing teks (pandas / NumPy) vs cache .npy (metnum.ecg_io).
+
+Parser tangan load_data yang asli (split per baris, list float) sudah diganti di
+user-004: tempCodeRunnerFile.load_data sekarang memanggil load_ecg, jadi yang
+diukur di bench_load_data adalah fungsi itu apa adanya (dengan cache).
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from metnum.ecg_io import _parse_numpy, _parse_pandas, load_array, sniff_format
+
+from conftest import data_path
+from tempCodeRunnerFile import load_data
+
+# dari yang terkecil: dataset.txt 4999, Person_00 5000, FetalECG 9999, abdomen1 20000 baris
+DATASET = ["dataset.txt", "Person_00.txt", "FetalECG.txt", "abdomen1.txt"]
+
+
+@pytest.mark.parametrize("nama", DATASET)
+def bench_parse_pandas(benchmark, nama):
+    path = data_path(nama)
+    fmt = sniff_format(path)
+    benchmark.group = "load:" + nama
+    benchmark(_parse_pandas, path, fmt)
+
+
+@pytest.mark.parametrize("nama", DATASET)
+def bench_parse_numpy(benchmark, nama):
+    path = data_path(nama)
+    fmt = sniff_format(path)
+    benchmark.group = "load:" + nama
+    benchmark(_parse_numpy, path, fmt)
+
+
+@pytest.mark.parametrize("nama", DATASET)
+def bench_load_cache(benchmark, nama, tmp_path):
+    path = data_path(nama)
+    load_array(path, cache_dir=str(tmp_path))          # isi cache dulu
+    benchmark.group = "load:" + nama
+    benchmark(load_array, path, cache_dir=str(tmp_path))
+
+
+@pytest.mark.parametrize("nama", DATASET)
+def bench_load_data(benchmark, nama):
+    """tempCodeRunnerFile.load_data, cache di folder default seperti saat skripnya dijalankan."""
+    path = data_path(nama)
+    load_data(path)
+    benchmark.group = "load:" + nama
+    benchmark(load_data, path)
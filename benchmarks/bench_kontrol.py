@@ -0,0 +1,144 @@
+"""
+Loop simulasi kontrol: fuzzy (fuzzy.py), RK4 (newone.py), Euler (aqil.py,
+finalprojectsms3.py). Skripnya aman di-import (GUI hanya di main()), jadi entri
+"asli" memanggil fungsi skripnya langsung: angka pembandingnya tidak bergantung
+pada numba atau kernel lain. Versi batch di metnum diukur di sebelahnya.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import aqil
+import finalprojectsms3
+import newone
+from fuzzy import mikir_pakai_fuzzy
+from metnum.kendali_fuzzy import TabelFuzzy, mikir_pakai_fuzzy_batch
+from metnum.simulasi_fuzzy import simulasi_batch
+from metnum.sweep_pid import simulasi_pid_batch
+
+LANGKAH = [1000, 10000, 100000]
+N_TITIK = [100, 10000, 1000000]
+
+
+def _titik_fuzzy(n):
+    rng = np.random.default_rng(0)
+    return rng.uniform(-60, 60, n), rng.uniform(-300, 300, n)
+
+
+@pytest.mark.parametrize("n", N_TITIK[:2])
+def bench_fuzzy_skalar(benchmark, n):
+    sudut, kec = (a.tolist() for a in _titik_fuzzy(n))
+    benchmark.group = f"fuzzy:{n}"
+    benchmark(lambda: [mikir_pakai_fuzzy(s, k) for s, k in zip(sudut, kec)])
+
+
+@pytest.mark.parametrize("n", N_TITIK)
+def bench_fuzzy_batch(benchmark, n):
+    sudut, kec = _titik_fuzzy(n)
+    benchmark.group = f"fuzzy:{n}"
+    benchmark(mikir_pakai_fuzzy_batch, sudut, kec)
+
+
+@pytest.mark.parametrize("n", N_TITIK)
+def bench_fuzzy_tabel(benchmark, n):
+    sudut, kec = _titik_fuzzy(n)
+    tabel = TabelFuzzy()
+    benchmark.group = f"fuzzy:{n}"
+    benchmark(tabel, sudut, kec)
+
+
+@pytest.mark.parametrize("n", [1, 100, 10000])
+def bench_simulasi_fuzzy(benchmark, n):
+    """10 detik fuzzy.py untuk n sudut awal sekaligus."""
+    benchmark(simulasi_batch, np.linspace(-60, 60, n))
+
+
+def _rk4_newone(n):
+    newone.theta, newone.omega, newone.t, newone.dt = math.radians(170), 0.0, 0.0, 0.001
+    for _ in range(n):
+        newone.rk4_step_manual()
+    return newone.theta, newone.omega
+
+
+@pytest.mark.parametrize("n", LANGKAH)
+def bench_rk4_newone(benchmark, n):
+    """newone.rk4_step_manual (dan hitung_percepatan_manual), h = 0.001, dengan gesekan."""
+    benchmark.group = f"rk4_newone:{n}"
+    benchmark(_rk4_newone, n)
+
+
+class _CanvasPalsu:
+    """Pengganti tk.Canvas secukupnya untuk update_graph tanpa layar."""
+
+    def __init__(self, lebar=800, tinggi=300):
+        self.lebar, self.tinggi = lebar, tinggi
+        self.item = {}
+
+    def winfo_width(self):
+        return self.lebar
+
+    def winfo_height(self):
+        return self.tinggi
+
+    def _buat(self, *coords, **opsi):
+        self.item[len(self.item) + 1] = list(coords)
+        return len(self.item)
+
+    create_line = create_text = _buat
+
+    def coords(self, item, *coords):
+        self.item[item] = list(coords[0]) if len(coords) == 1 else list(coords)
+
+    def itemconfig(self, item, **opsi):
+        pass
+
+
+@pytest.mark.parametrize("n", LANGKAH)
+def bench_update_graph_newone(benchmark, monkeypatch, n):
+    """newone.update_graph (canvas palsu) setelah n langkah langkah_fisika."""
+    canvas = _CanvasPalsu()
+    monkeypatch.setattr(newone, "canvas_graph", canvas)
+    monkeypatch.setattr(newone, "garis_grafik", None)
+    monkeypatch.setattr(newone, "label_waktu", None)
+    monkeypatch.setattr(newone, "ringkasan_grafik", newone.DecimasiMinMax(4096))
+    newone.theta, newone.omega, newone.t, newone.dt = math.radians(170), 0.0, 0.0, 0.001
+    for _ in range(n):
+        newone.langkah_fisika()
+    benchmark.group = f"update_graph_newone:{n}"
+    benchmark(newone.update_graph)
+    garis = canvas.item[newone.garis_grafik]
+    assert len(garis) >= 4 and len(garis) % 2 == 0
+    assert np.all(np.isfinite(garis))
+
+
+def _euler_finalproject(n):
+    sim = finalprojectsms3.PendulumSederhana()
+    for _ in range(n):
+        sim.update_fisika(sim.get_pid())
+    return sim.sudut, sim.kecepatan
+
+
+@pytest.mark.parametrize("n", LANGKAH)
+def bench_euler_finalproject(benchmark, n):
+    """PendulumSederhana.update_fisika + get_pid (finalprojectsms3.py): DT = 0.05, g = 9.8, J = m l^2 / 3."""
+    benchmark.group = f"euler_finalproject:{n}"
+    benchmark(_euler_finalproject, n)
+
+
+@pytest.mark.parametrize("t_max", [10.0, 100.0, 1000.0])
+def bench_euler_pid_aqil_asli(benchmark, monkeypatch, t_max):
+    """aqil.simulasi (PID + Euler, dt = 0.02) untuk satu sudut awal, t_max detik."""
+    monkeypatch.setattr(aqil, "t_max", t_max)
+    benchmark.group = "euler_pid_aqil"
+    benchmark(aqil.simulasi, 90.0, pakai_pid=True)
+
+
+@pytest.mark.parametrize("n", [1, 100, 10000])
+def bench_euler_pid_aqil(benchmark, n):
+    """Loop PID + Euler aqil.py (10 detik, dt = 0.02) untuk n set gain sekaligus."""
+    Kp = np.linspace(0, 50, n)
+    benchmark(simulasi_pid_batch, Kp, 1.0, 5.0, math.radians(90))
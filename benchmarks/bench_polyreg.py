@@ -0,0 +1,49 @@
+"""Regresi polinomial dan detrend global (tempCodeRunnerFile.py, code2.py, tugas1.py)."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from metnum.detrend import poly_detrend
+from metnum.polyreg import poly_regression
+from tempCodeRunnerFile import poly_regression as poly_regression_asli
+
+UKURAN = [1000, 5000, 9999]
+ORDE = 3
+ORDE_DETREND = [5, 15]      # tugas1.py (orde 5) dan code2.py (orde 15)
+
+
+@pytest.mark.parametrize("n", UKURAN)
+def bench_poly_regression_asli(benchmark, fetal, n):
+    """Persamaan normal + eliminasi Gauss dalam Python murni (fungsi asli tempCodeRunnerFile.py)."""
+    t, y = fetal
+    xv, yv = t[:n].tolist(), y[:n].tolist()
+    benchmark.group = f"poly_regression:{n}"
+    benchmark(poly_regression_asli, xv, yv, ORDE)
+
+
+@pytest.mark.parametrize("n", UKURAN)
+def bench_poly_regression_qr(benchmark, fetal, n):
+    t, y = fetal
+    benchmark.group = f"poly_regression:{n}"
+    benchmark(poly_regression, t[:n], y[:n], ORDE)
+
+
+@pytest.mark.parametrize("orde", ORDE_DETREND)
+@pytest.mark.parametrize("n", [2000, 10000, 20000])
+def bench_polyfit_detrend(benchmark, abdomen, n, orde):
+    """Baseline np.polyfit seperti di tugas1.py (dan code2.py)."""
+    y = abdomen[:n]
+    t = np.arange(n) / 1000.0
+    benchmark.group = f"detrend:{n}:orde{orde}"
+    benchmark(lambda: y - np.polyval(np.polyfit(t, y, orde), t))
+
+
+@pytest.mark.parametrize("orde", ORDE_DETREND)
+@pytest.mark.parametrize("n", [2000, 10000, 20000])
+def bench_poly_detrend(benchmark, abdomen, n, orde):
+    y = abdomen[:n]
+    t = np.arange(n) / 1000.0
+    benchmark.group = f"detrend:{n}:orde{orde}"
+    benchmark(poly_detrend, t, y, orde)
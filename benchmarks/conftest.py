@@ -0,0 +1,56 @@
+"""Fixture bersama untuk suite benchmark: lokasi dataset dan pembaca data tanpa cache."""
+
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from metnum.ecg_io import load_ecg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def data_path(nama):
+    return os.path.join(ROOT, nama)
+
+
+def pytest_configure(config):
+    """Simpan hasil tiap run sebagai JSON di benchmarks/.benchmarks (kecuali diatur lewat opsi)."""
+    if not hasattr(config.option, "benchmark_autosave"):
+        return      # pytest-benchmark tidak terpasang
+    if not config.option.benchmark_save:
+        config.option.benchmark_autosave = True
+    if config.option.benchmark_storage == "file://./.benchmarks":
+        config.option.benchmark_storage = "file://" + os.path.join(os.path.dirname(__file__), ".benchmarks")
+
+
+@pytest.fixture(scope="session")
+def fetal():
+    """(t, y) FetalECG.txt, 9999 sampel dengan t dalam detik."""
+    t, y = load_ecg(data_path("FetalECG.txt"))
+    return np.array(t), np.array(y)
+
+
+@pytest.fixture(scope="session")
+def abdomen():
+    """y abdomen1.txt, 20000 sampel (satu kolom)."""
+    _, y = load_ecg(data_path("abdomen1.txt"))
+    return np.array(y)
+
+
+@pytest.fixture(scope="session")
+def ekg_dps():
+    """(t, y) dataset.txt, format ';' desimal ',' seperti di testdps.py."""
+    t, y = load_ecg(data_path("dataset.txt"))
+    return np.array(t), np.array(y)
+
+
+@pytest.fixture(scope="session")
+def person():
+    """[(t, y), ...] semua Person_*.txt (500 Hz, 5000 sampel per rekaman)."""
+    rekaman = []
+    for path in sorted(glob.glob(data_path("Person_*.txt"))):
+        t, y = load_ecg(path)
+        rekaman.append((np.array(t), np.array(y)))
+    return rekaman
@@ -1,54 +1,68 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+from metnum.ecg_store import load_segment
+from metnum.polyreg import poly_fit, fit_eval, to_polyfit_order, select_order
 
-data = pd.read_csv("Person_07.txt", sep=",", header=None ) #buat file yang di dapet dari kaggle
-#data = pd.read_csv("FetalECG.txt", sep="\t", header=None) #buat file dari Pak Fauzan
 
-t = data.iloc[:, 0].values      
-y = data.iloc[:, 1].values      
+def main():
+    import matplotlib.pyplot as plt
 
-start = 0
-end = 10000
-t = t[start:end]
-y = y[start:end]
+    start = 0
+    end = 10000
+    #cuma sampel [start, end) yang dibaca; dari store memory-mapped kalau sudah dibangun (python -m metnum.ecg_store build *.txt)
+    t, y = load_segment("Person_07.txt", start, end) #buat file yang di dapet dari kaggle (format koma/tab/titik koma dideteksi otomatis)
+    #t, y = load_segment("FetalECG.txt", start, end) #buat file dari Pak Fauzan
+    #kalau mau semua file sekaligus tanpa plot: python -m metnum.batch "Person_*.txt" "abdomen*.txt" FetalECG.txt
+    #rekaman yang lebih besar dari RAM (dibaca per chunk): python -m metnum.detrend rekaman.npy hasil.npy --order 15
 
-order = 15
+    order = 15
+    pilih_orde = None #isi "bic" / "aic" / "r2" / "cv" biar orde dipilih otomatis (order di atas jadi orde maksimum)
 
-coeffs = np.polyfit(t, y, order) #mencari koefisien polinomial dengan error minimum (cari rumus baseline)
-baseline = np.polyval(coeffs, t) #polyval itu menghitung nilai y dari polinomial yang sudah ditemukan (hitung baseline di setiap t)
-y_detrended = y - baseline #hilangin baseline dari sinyal asli (detrended signal)
-#pake cara dania dlu deh
-Sr = np.sum((y - baseline) ** 2)#selisih sinyal asli dan baseline
-St = np.sum((y - np.mean(y)) ** 2)#total variasi sinyal terhdap rata-rata sinyal
-r2 = 1 - Sr / St #Persentase variasi sinyal yang bisa dijelaskan oleh baseline
+    if pilih_orde:
+        #semua orde 0..order dicek sekaligus dari satu faktorisasi QR, jadi gak perlu edit-run berkali-kali
+        pilihan = select_order(t, y, order, criterion=pilih_orde)
+        print("Skor", pilih_orde, "per orde =", pilihan.scores)
+        order = pilihan.order
+        fit = pilihan.fit
+    else:
+        fit = poly_fit(t, y, order) #mencari koefisien polinomial dengan error minimum (t di-center & di-scale dulu biar orde 15 tetap stabil)
+    baseline = fit_eval(fit, t) #hitung nilai baseline di setiap t (Horner, di koordinat yang sudah di-scale)
+    coeffs = to_polyfit_order(fit) #koefisien untuk t asli, urutannya sama kayak np.polyfit
+    y_detrended = y - baseline #hilangin baseline dari sinyal asli (detrended signal)
+    #pake cara dania dlu deh
+    Sr = np.sum((y - baseline) ** 2)#selisih sinyal asli dan baseline
+    St = np.sum((y - np.mean(y)) ** 2)#total variasi sinyal terhdap rata-rata sinyal
+    r2 = 1 - Sr / St #Persentase variasi sinyal yang bisa dijelaskan oleh baseline
 
-print("Order polynomial =", order)
-print("Koefisien regresi =", coeffs)
-print("Nilai r^2 =", r2)
+    print("Order polynomial =", order)
+    print("Koefisien regresi =", coeffs)
+    print("Nilai r^2 =", r2)
 
 
-plt.figure(figsize=(13,8))
+    plt.figure(figsize=(13,8))
 
-plt.subplot(3,1,1)
-plt.plot(t, y, label="Original Fetal ECG")
-plt.title("Original Fetal ECG")
-plt.legend()
-plt.grid(True)
+    plt.subplot(3,1,1)
+    plt.plot(t, y, label="Original Fetal ECG")
+    plt.title("Original Fetal ECG")
+    plt.legend()
+    plt.grid(True)
 
-plt.subplot(3,1,2)
-plt.plot(t, y, label="Original")
-plt.plot(t, baseline, linewidth=2, label=f"Baseline Polyfit (Order {order})")
-plt.title(f"Baseline Fitting (order={order}) - R²={r2:.4f}")
-plt.legend()
-plt.grid(True)
+    plt.subplot(3,1,2)
+    plt.plot(t, y, label="Original")
+    plt.plot(t, baseline, linewidth=2, label=f"Baseline Polyfit (Order {order})")
+    plt.title(f"Baseline Fitting (order={order}) - R²={r2:.4f}")
+    plt.legend()
+    plt.grid(True)
 
 
-plt.subplot(3,1,3)
-plt.plot(t, y_detrended, label="Detrended Fetal ECG")
-plt.title("Detrended ECG")
-plt.legend()
-plt.grid(True)
+    plt.subplot(3,1,3)
+    plt.plot(t, y_detrended, label="Detrended Fetal ECG")
+    plt.title("Detrended ECG")
+    plt.legend()
+    plt.grid(True)
 
-plt.tight_layout()
-plt.show()
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
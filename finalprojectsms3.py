@@ -1,12 +1,21 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import math
 
+from metnum.integrator import DormandPrince
+from metnum.live_plot import PlotLive
+
 # --- KONFIGURASI ---
 DT = 0.05          # Kecepatan waktu
 DURASI = 1000      # Lama simulasi
 
+# True = integrasi Dormand-Prince adaptif (RK45) per frame, gesekan *0.995 per DT
+# diganti redaman kontinu yang setara: dv/dt = -LAJU_REDAMAN * v
+PAKAI_RK45 = False
+TOLERANSI_RK45 = 1e-6
+LAJU_REDAMAN = -math.log(0.995) / DT
+
+JENDELA_GRAFIK = 10.0   # Lebar grafik respon (detik terakhir)
+
 class PendulumSederhana:
     def __init__(self):
         #default parameter fisika (real life)
@@ -24,6 +33,12 @@ class PendulumSederhana:
         self.error_sebelumnya = 0.0
         self.tabungan_error = 0.0
 
+        # Integrator adaptif (dipakai kalau PAKAI_RK45)
+        self.ode = DormandPrince(lambda t, y: self.turunan(y, 0.0), self.waktu,
+                                 [self.sudut, self.kecepatan],
+                                 rtol=TOLERANSI_RK45, atol=TOLERANSI_RK45 * 1e-3)
+        self.kekuatan_lama = 0.0
+
     def get_pid(self):
         # What we want
         target = 0.0 
@@ -55,51 +70,78 @@ class PendulumSederhana:
         # Kalau mau "Without Friction" murni, kasih # di baris bawah ini:
         self.kecepatan = self.kecepatan * 0.995 
 
-# for setup
-simulasi = PendulumSederhana()
-fig, (ax_kiri, ax_kanan) = plt.subplots(1, 2, figsize=(10, 5))
-
-# animasi
-ax_kiri.set_xlim(-1.5, 1.5); ax_kiri.set_ylim(-1.5, 1.5)
-ax_kiri.set_aspect('equal'); ax_kiri.grid(True)
-ax_kiri.set_title("Animasi Pendulum")
-garis, = ax_kiri.plot([], [], 'o-', lw=3, color='black')
-bola, = ax_kiri.plot([], [], 'o', markersize=20, color='red')
-
-# graph
-ax_kanan.set_xlim(0, 10); ax_kanan.set_ylim(-600, 600)
-ax_kanan.set_title("Grafik Respon")
-ax_kanan.grid(True)
-ax_kanan.axhline(0, color='black', linestyle='--')
-grafik, = ax_kanan.plot([], [], color='blue')
-
-data_waktu, data_sudut = [], []
-
-def update_gambar(frame):
-    
-    #1
-    #kekuatan = simulasi.get_pid()
-    
-    #2
-    kekuatan = 0.0
-    
-    #declarate paramater fisika tadi wak
-    simulasi.update_fisika(kekuatan)
-    
-    # realtime update gambar
-    x = simulasi.l * math.sin(simulasi.sudut)
-    y = -simulasi.l * math.cos(simulasi.sudut)
-    garis.set_data([0, x], [0, y])
-    bola.set_data([x], [y])
-    
-    data_waktu.append(simulasi.waktu)
-    data_sudut.append(math.degrees(simulasi.sudut))
-    grafik.set_data(data_waktu, data_sudut)
-    
-    if simulasi.waktu > 10:
-        ax_kanan.set_xlim(simulasi.waktu - 10, simulasi.waktu)
-        
-    return garis, bola, grafik
+    def turunan(self, y, kekuatan_dorong):
+        """Rumus yang sama dengan update_fisika dalam bentuk dy/dt, y = [sudut, kecepatan]."""
+        sudut, kecepatan = y
+        torsi_gravitasi = self.m * self.g * (self.l / 2) * math.sin(sudut)
+        percepatan = (kekuatan_dorong - torsi_gravitasi) / self.J
+        return [kecepatan, percepatan - LAJU_REDAMAN * kecepatan]
+
+    def update_fisika_rk45(self, kekuatan_dorong):
+        # kekuatan ditahan konstan selama satu DT (zero-order hold); rumusnya hanya
+        # diganti kalau kekuatan berubah, selama tetap langkah internal bebas membesar
+        if kekuatan_dorong != self.kekuatan_lama:
+            self.ode.ganti_rhs(lambda t, y: self.turunan(y, kekuatan_dorong), self.waktu)
+            self.kekuatan_lama = kekuatan_dorong
+        self.sudut, self.kecepatan = self.ode.maju_ke(self.waktu + DT)
+        self.waktu = self.waktu + DT
+
+
+def main():
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+
+    # for setup
+    simulasi = PendulumSederhana()
+    fig, (ax_kiri, ax_kanan) = plt.subplots(1, 2, figsize=(10, 5))
+
+    # animasi
+    ax_kiri.set_xlim(-1.5, 1.5); ax_kiri.set_ylim(-1.5, 1.5)
+    ax_kiri.set_aspect('equal'); ax_kiri.grid(True)
+    ax_kiri.set_title("Animasi Pendulum")
+    garis, = ax_kiri.plot([], [], 'o-', lw=3, color='black')
+    bola, = ax_kiri.plot([], [], 'o', markersize=20, color='red')
+
+    # graph
+    ax_kanan.set_ylim(-600, 600)
+    ax_kanan.set_title("Grafik Respon (10 detik terakhir)")
+    ax_kanan.set_xlabel("Waktu relatif (s)")
+    ax_kanan.grid(True)
+    ax_kanan.axhline(0, color='black', linestyle='--')
+    grafik, = ax_kanan.plot([], [], color='blue')
+
+    # riwayat 10 detik terakhir (kapasitas tetap), sumbu x menggulung: -10 .. 0 detik
+    plot_sudut = PlotLive(grafik, kapasitas=int(round(JENDELA_GRAFIK / DT)) + 1, jendela=JENDELA_GRAFIK)
+
+    def update_gambar(frame):
+
+        #1
+        #kekuatan = simulasi.get_pid()
+
+        #2
+        kekuatan = 0.0
+
+        #declarate paramater fisika tadi wak
+        if PAKAI_RK45:
+            simulasi.update_fisika_rk45(kekuatan)
+        else:
+            simulasi.update_fisika(kekuatan)
+
+        # realtime update gambar
+        x = simulasi.l * math.sin(simulasi.sudut)
+        y = -simulasi.l * math.cos(simulasi.sudut)
+        garis.set_data([0, x], [0, y])
+        bola.set_data([x], [y])
+
+        plot_sudut.tambah(simulasi.waktu, math.degrees(simulasi.sudut))
+        plot_sudut.perbarui()
+
+        return garis, bola, grafik
+
+    # blit=True: xlim grafik tetap, jadi cukup garis & bola yang digambar ulang tiap frame
+    animasi = animation.FuncAnimation(fig, update_gambar, interval=30, blit=True, cache_frame_data=False)
+    plt.show()
+
 
-animasi = animation.FuncAnimation(fig, update_gambar, interval=30, blit=False)
-plt.show()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
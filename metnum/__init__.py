@@ -0,0 +1,8 @@
+"""
+Kernel numerik untuk skrip-skrip metnum (baseline ECG, filter, simulasi).
+Modul di sini aman di-import: tidak membuka jendela dan tidak memanggil plt.show().
+scipy/pandas hanya di-import di dalam fungsi yang membutuhkannya.
+
+Skrip di root repo (fuzzy.py, newone.py, aqil.py, ...) juga aman di-import: GUI dan
+plot-nya ada di main() dan hanya jalan kalau skripnya dijalankan langsung.
+"""
@@ -0,0 +1,301 @@
+"""
+Estimasi baseline wander dengan regresi polinomial lokal (sliding window).
+
+Versi lama (`remove_baseline` di tempCodeRunnerFile.py) menyusun dan menyelesaikan
+persamaan normal baru untuk SETIAP sampel -> O(N * window * degree) di Python murni.
+Di sini hasil yang sama dihitung dalam waktu (hampir) linear:
+
+- sampling seragam  : jendela interior selalu punya bentuk yang sama, jadi nilai
+  fit di titik tengah = konvolusi dengan satu kernel tetap (Savitzky-Golay).
+- sampling tidak seragam : semua jendela dibentuk sekaligus (per blok) dalam
+  koordinat lokal, lalu semua sistem normal diselesaikan sekaligus (batched).
+
+Estimator lain dengan waktu linear (sampling seragam), semuanya mengembalikan
+(corrected, baseline):
+
+    baseline_whittaker  spline penalti (Whittaker), sistem band lebar d -> solveh_banded
+    baseline_als        asymmetric least squares, beberapa solve band berbobot
+    baseline_median     median bergerak 200 ms + 600 ms (running median heap, scipy >= 1.13)
+    baseline_morfologi  opening/closing dengan min/max bergerak
+
+Parameternya dalam detik/Hz. fs diambil dari t kalau tidak diberikan; file satu kolom
+(abdomen*.txt) dimuat dengan t = indeks sampel, jadi untuk itu fs harus diisi
+(mis. fs=1000.0). fs di bawah FS_MIN dianggap salah dan ditolak (ValueError).
+Benchmark terhadap remove_baseline_fast dan polinomial global orde 15 (code2.py):
+    cd benchmarks && python -m pytest bench_baseline.py
+"""
+
+import numpy as np
+
+
+def _is_uniform(t, rtol=1e-6):
+    if len(t) < 3:
+        return True
+    dt = np.diff(t)
+    return dt[0] > 0 and np.allclose(dt, dt[0], rtol=rtol, atol=0.0)
+
+
+def _center_weight(u, degree):
+    """
+    Bobot h sehingga sum(h * x) = nilai polinomial least-squares di u = 0.
+    (baris pertama pseudo-inverse matriks Vandermonde)
+    """
+    scale = np.max(np.abs(u))
+    if scale == 0:
+        scale = 1.0
+    V = np.vander(u / scale, degree + 1, increasing=True)
+    return np.linalg.pinv(V)[0]
+
+
+def savgol_kernel(window, degree):
+    """
+    Kernel Savitzky-Golay untuk jendela [i-half, i+half) yang dipakai remove_baseline.
+    Untuk window genap, jendelanya tidak simetris (kiri half sampel, kanan half-1).
+    """
+    half = window // 2
+    j = np.arange(-half, half, dtype=float)
+    return _center_weight(j, degree)
+
+
+def _window_bounds(N, half):
+    i = np.arange(N)
+    L = np.maximum(0, i - half)
+    R = np.minimum(N, i + half)
+    return L, R
+
+
+def _edge_fit(t, x, i, L, R, degree):
+    u = t[L:R] - t[i]
+    return np.dot(_center_weight(u, degree), x[L:R])
+
+
+def _baseline_uniform(t, x, window, degree, edge):
+    N = len(x)
+    half = window // 2
+    width = 2 * half
+    baseline = np.zeros(N)
+
+    if width > N:
+        # jendela lebih lebar dari sinyal: semua titik adalah "tepi"
+        interior = np.arange(0)
+    else:
+        h = savgol_kernel(window, degree)
+        # correlate(x, h, 'valid')[k] = sum_j x[k+j] h[j]  ->  baseline di i = k + half
+        baseline[half:N - half + 1] = np.correlate(x, h, mode="valid")
+        interior = np.arange(half, N - half + 1)
+
+    tepi = np.setdiff1d(np.arange(N), interior, assume_unique=True)
+    L, R = _window_bounds(N, half)
+    if edge == "shift" and width <= N:
+        # jendela digeser ke dalam supaya ukurannya tetap penuh
+        L = np.clip(L, 0, N - width)
+        R = L + width
+
+    for i in tepi:
+        if R[i] - L[i] < degree + 1:
+            continue
+        baseline[i] = _edge_fit(t, x, i, L[i], R[i], degree)
+
+    return baseline
+
+
+def _baseline_batched(t, x, window, degree, edge, chunk=4096):
+    N = len(x)
+    n = degree + 1
+    half = window // 2
+    width = 2 * half
+
+    L, R = _window_bounds(N, half)
+    if edge == "shift" and width <= N:
+        L = np.clip(L, 0, N - width)
+        R = L + width
+
+    # Semua jendela di-pad ke lebar tetap; sampel di luar [L, R) diberi bobot 0.
+    # Koordinat lokal (t - t_i) / skala dipakai agar sistemnya tetap well-conditioned.
+    lebar = min(width, N)
+    baseline = np.zeros(N)
+    k = np.arange(lebar)
+    for a in range(0, N, chunk):
+        i = np.arange(a, min(a + chunk, N))
+        L_i, R_i = L[i], R[i]
+        idx = np.minimum(L_i[:, None] + k[None, :], N - 1)
+        w = (idx < R_i[:, None]) & (L_i[:, None] + k[None, :] < N)
+
+        u = np.where(w, t[idx] - t[i][:, None], 0.0)
+        skala = np.max(np.abs(u), axis=1)
+        skala[skala == 0] = 1.0
+        u /= skala[:, None]
+
+        V = u[..., None] ** np.arange(n) * w[..., None]   # (m, lebar, n)
+        A = np.einsum("mjk,mjl->mkl", V, V)
+        B = np.einsum("mjk,mj->mk", V, np.where(w, x[idx], 0.0))
+
+        valid = (R_i - L_i) >= n
+        if np.any(valid):
+            coeff = np.linalg.solve(A[valid], B[valid][..., None])[..., 0]
+            # nilai di u = 0 (titik i sendiri) = koefisien ke-0
+            baseline[i[valid]] = coeff[:, 0]
+    return baseline
+
+
+def remove_baseline_fast(t, x, window, degree, edge="shrink"):
+    """
+    Pengganti cepat remove_baseline(t, x, window, degree).
+
+    Output sama: (corrected, baseline, half), jendela untuk sampel i adalah
+    [i-half, i+half). Parameter edge mengatur jendela di tepi sinyal:
+      "shrink" : jendela terpotong seperti versi lama (default)
+      "shift"  : jendela digeser ke dalam sehingga lebarnya tetap penuh
+    Titik dengan jendela < degree+1 sampel diberi baseline 0 (sama seperti versi lama).
+    """
+    if edge not in ("shrink", "shift"):
+        raise ValueError("edge harus 'shrink' atau 'shift'")
+
+    t = np.asarray(t, dtype=float)
+    x = np.asarray(x, dtype=float)
+    half = window // 2
+
+    if len(x) == 0 or 2 * half < degree + 1:
+        # tidak ada jendela yang cukup sampel untuk fit
+        return x.copy(), np.zeros(len(x)), half
+
+    if _is_uniform(t):
+        baseline = _baseline_uniform(t, x, window, degree, edge)
+    else:
+        baseline = _baseline_batched(t, x, window, degree, edge)
+
+    corrected = x - baseline
+    return corrected, baseline, half
+
+
+# ==========================================
+# Estimator baseline linear-time lain: (corrected, baseline)
+# ==========================================
+
+# fs lebih kecil dari ini hampir pasti berarti t = indeks sampel (fs = 1), bukan detik
+FS_MIN = 50.0
+
+
+def _fs_seragam(t, fs=None):
+    """
+    Sampling rate: `fs` kalau diberikan, kalau tidak dari t. Estimator di bawah bekerja
+    per sampel, jadi t harus seragam.
+    """
+    if fs is None:
+        t = np.asarray(t, dtype=float)
+        if not _is_uniform(t):
+            raise ValueError("t harus seragam (jarak antar sampel sama)")
+        fs = 1.0 / (t[1] - t[0]) if len(t) > 1 else 1.0
+    if fs < FS_MIN:
+        raise ValueError(f"fs = {fs:g} Hz terlalu rendah untuk ECG; kalau t adalah indeks "
+                         f"sampel (file satu kolom), isi fs= secara eksplisit")
+    return float(fs)
+
+
+def _ganjil(n):
+    """Panjang jendela ganjil >= 1 (median/morfologi simetris di sekitar sampel)."""
+    return max(1, int(round(n)) | 1)
+
+
+def lam_dari_cutoff(fs, f_c, d=2):
+    """
+    lambda Whittaker dengan frekuensi -3 dB ~ f_c Hz:
+    respons 1 / (1 + lam * (2 sin(w/2))^(2d)) setengah daya di lam * w^(2d) = 1.
+    """
+    return (fs / (2 * np.pi * f_c)) ** (2 * d)
+
+
+def _penalti_banded(N, d):
+    """D'D (D = operator selisih orde d, (N-d) x N) dalam format band atas solveh_banded."""
+    c = np.diff(np.eye(d + 1), d, axis=0)[0]       # d=2 -> [1, -2, 1]
+    ab = np.zeros((d + 1, N))
+    for k in range(d + 1):
+        diag = ab[d - k, k:]
+        for j in range(d + 1 - k):
+            diag[j:N - d + j] += c[j] * c[j + k]
+    return ab
+
+
+def _whittaker(x, lam, penalti, w):
+    """Selesaikan (W + lam D'D) z = W x; sistem band lebar d, O(N d^2)."""
+    from scipy.linalg import solveh_banded
+
+    ab = lam * penalti
+    ab[-1] += w
+    return solveh_banded(ab, w * x, check_finite=False)
+
+
+def baseline_whittaker(t, x, f_c=0.5, d=2, lam=None, fs=None):
+    """
+    Baseline spline penalti (Whittaker / P-spline diskrit): z minimum dari
+    |x - z|^2 + lam |D_d z|^2. Tanpa osilasi tepi seperti polinomial global orde tinggi.
+    lam default dari cutoff f_c (Hz), lihat lam_dari_cutoff; fs default dari t.
+    """
+    x = np.asarray(x, dtype=float)
+    if len(x) <= d:
+        return x - x, x.copy()
+    if lam is None:
+        lam = lam_dari_cutoff(_fs_seragam(t, fs), f_c, d)
+    baseline = _whittaker(x, lam, _penalti_banded(len(x), d), np.ones(len(x)))
+    return x - baseline, baseline
+
+
+def baseline_als(t, x, f_c=0.5, p=0.05, d=2, lam=None, iterasi=10, fs=None):
+    """
+    Asymmetric least squares (Eilers & Boelens): Whittaker berbobot, bobot p untuk
+    sampel di atas baseline dan 1 - p di bawahnya, diulang sampai bobotnya tetap.
+    Puncak positif (R, T) hampir tidak menarik baseline ke atas; akibatnya baseline
+    mengikuti tepi bawah sinyal (termasuk noise), bukan garis isoelektrik.
+    """
+    x = np.asarray(x, dtype=float)
+    if len(x) <= d:
+        return x - x, x.copy()
+    if lam is None:
+        lam = lam_dari_cutoff(_fs_seragam(t, fs), f_c, d)
+    penalti = _penalti_banded(len(x), d)
+    w = np.ones(len(x))
+    for _ in range(iterasi):
+        baseline = _whittaker(x, lam, penalti, w)
+        w_baru = np.where(x > baseline, p, 1.0 - p)
+        if np.array_equal(w_baru, w):
+            break
+        w = w_baru
+    return x - baseline, baseline
+
+
+def baseline_median(t, x, jendela_s=(0.2, 0.6), fs=None):
+    """
+    Median bergerak dua tahap: 200 ms membuang QRS/P, 600 ms membuang gelombang T.
+    Running median heap O(N log w) hanya di scipy >= 1.13, yang punya jalur 1-D
+    scipy.ndimage._rank_filter_1d untuk median_filter; di scipy lebih lama
+    median_filter memilih ulang tiap jendela, O(N * w).
+    """
+    from scipy.ndimage import median_filter
+
+    x = np.asarray(x, dtype=float)
+    if len(x) == 0:
+        return x.copy(), x.copy()
+    fs = _fs_seragam(t, fs)
+    baseline = x
+    for s in jendela_s:
+        baseline = median_filter(baseline, size=_ganjil(s * fs), mode="nearest")
+    return x - baseline, baseline
+
+
+def baseline_morfologi(t, x, jendela_s=0.2, fs=None):
+    """
+    Baseline morfologi: opening (elemen jendela_s) memotong puncak, closing (1.5x)
+    mengisi lembah; rata-rata urutan open-close dan close-open supaya tidak bias.
+    Erosi/dilasi adalah min/max bergerak (van Herk), O(N) berapapun lebar elemennya.
+    """
+    from scipy.ndimage import grey_closing, grey_opening
+
+    x = np.asarray(x, dtype=float)
+    if len(x) == 0:
+        return x.copy(), x.copy()
+    fs = _fs_seragam(t, fs)
+    Lo, Lc = _ganjil(jendela_s * fs), _ganjil(1.5 * jendela_s * fs)
+    oc = grey_closing(grey_opening(x, size=Lo, mode="nearest"), size=Lc, mode="nearest")
+    co = grey_opening(grey_closing(x, size=Lo, mode="nearest"), size=Lc, mode="nearest")
+    baseline = 0.5 * (oc + co)
+    return x - baseline, baseline
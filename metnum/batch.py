@@ -0,0 +1,105 @@
+"""
+Batch detrend banyak rekaman sekaligus, headless (tanpa plt.show()).
+
+Contoh:
+    python -m metnum.batch "Person_*.txt" "abdomen*.txt" FetalECG.txt --order 15 --out hasil_detrend
+
+Untuk setiap file ditulis <out>/<nama>_detrended.csv (t, y, baseline, y_detrended),
+dan ringkasan koefisien + r^2 semua file ke <out>/summary.csv.
+Kalau satu file gagal, file lain tetap diproses.
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from metnum.detrend import poly_detrend
+from metnum.ecg_io import load_ecg
+
+
+def proses_file(path, order, start, end, out_dir, criterion=None):
+    """Detrend satu file dan tulis hasilnya. Dijalankan di proses worker."""
+    t, y = load_ecg(path)
+    t = t[start:end]
+    y = y[start:end]
+    if len(y) <= order:
+        raise ValueError(f"hanya {len(y)} sampel, kurang untuk orde {order}")
+
+    hasil = poly_detrend(t, y, order, criterion)
+
+    nama = os.path.splitext(os.path.basename(path))[0]
+    np.savetxt(
+        os.path.join(out_dir, f"{nama}_detrended.csv"),
+        np.column_stack([t, y, hasil.baseline, hasil.y_detrended]),
+        delimiter=",", header="t,y,baseline,y_detrended", comments="",
+    )
+    return len(y), hasil.coeffs, hasil.r2
+
+
+def jalankan_batch(paths, order=15, start=0, end=None, out_dir="hasil_detrend", workers=None,
+                   criterion=None):
+    """
+    Proses semua file di `paths` memakai ProcessPoolExecutor.
+    Mengembalikan list baris ringkasan (dict) dan list (path, pesan_error).
+    Dengan criterion, `order` menjadi orde maksimum dan orde dipilih per file.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    ringkasan = []
+    gagal = []
+    with ProcessPoolExecutor(max_workers=min(workers, max(len(paths), 1))) as pool:
+        tugas = {pool.submit(proses_file, p, order, start, end, out_dir, criterion): p for p in paths}
+        for i, fut in enumerate(as_completed(tugas), 1):
+            path = tugas[fut]
+            try:
+                n, coeffs, r2 = fut.result()
+            except Exception as e:
+                gagal.append((path, str(e)))
+                print(f"[{i}/{len(paths)}] GAGAL {path}: {e}", file=sys.stderr, flush=True)
+                continue
+            baris = {"file": os.path.basename(path), "n": n, "order": len(coeffs) - 1, "r2": r2}
+            baris.update({f"c_{k}": c for k, c in enumerate(coeffs)})
+            ringkasan.append(baris)
+            print(f"[{i}/{len(paths)}] ok {path}  orde={len(coeffs) - 1} r2={r2:.4f}", flush=True)
+
+    ringkasan.sort(key=lambda b: b["file"])
+    with open(os.path.join(out_dir, "summary.csv"), "w", newline="") as f:
+        kolom = ["file", "n", "order", "r2"] + [f"c_{k}" for k in range(order + 1)]
+        w = csv.DictWriter(f, fieldnames=kolom, restval="")
+        w.writeheader()
+        w.writerows(ringkasan)
+    return ringkasan, gagal
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Batch detrend polinomial untuk banyak rekaman ECG")
+    ap.add_argument("pola", nargs="+", help="glob file input, misal 'Person_*.txt'")
+    ap.add_argument("--order", type=int, default=15, help="orde (atau orde maksimum kalau --select dipakai)")
+    ap.add_argument("--select", choices=["aic", "bic", "r2", "cv"], default=None,
+                    help="pilih orde otomatis per file")
+    ap.add_argument("--start", type=int, default=0)
+    ap.add_argument("--end", type=int, default=None)
+    ap.add_argument("--out", default="hasil_detrend")
+    ap.add_argument("--workers", type=int, default=None, help="default: jumlah core CPU")
+    args = ap.parse_args(argv)
+
+    paths = sorted({p for pola in args.pola for p in glob.glob(pola)})
+    if not paths:
+        ap.error("tidak ada file yang cocok")
+
+    t0 = time.perf_counter()
+    ringkasan, gagal = jalankan_batch(paths, args.order, args.start, args.end, args.out, args.workers,
+                                      args.select)
+    print(f"Selesai: {len(ringkasan)} ok, {len(gagal)} gagal, {time.perf_counter() - t0:.2f} s")
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
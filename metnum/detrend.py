@@ -0,0 +1,237 @@
+"""
+Detrend polinomial global (inti dari code2.py dan tugas1.py) tanpa plotting.
+
+poly_detrend bekerja pada array di memori. Untuk rekaman yang lebih besar dari RAM,
+detrend_file membaca file per chunk (ecg_io.iter_chunks) dan tidak pernah membangun
+matriks Vandermonde N x (orde+1) utuh:
+
+    lintasan 0 : rentang waktu (min/max t) untuk scaling ke [-1, 1]
+                 (dilewati kalau `rentang` diberikan)
+    lintasan 1 : TSQR, R (orde+1 x orde+1) dan Q^T y di-update per chunk (Q tidak dibentuk)
+    lintasan 2 : baseline dievaluasi per chunk, dikurangkan, lalu langsung ditulis
+
+Memori puncak O(chunk * orde) berapapun panjang rekamannya.
+
+Contoh:
+    python -m metnum.detrend rekaman_panjang.npy hasil.npy --order 15 --chunk 65536
+"""
+
+import argparse
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from metnum.polyreg import (
+    PolyFit, _scaling, fit_eval, pilih_dari_sse, poly_fit, select_order, to_polyfit_order, vandermonde,
+)
+
+HasilDetrend = namedtuple("HasilDetrend", ["y_detrended", "baseline", "coeffs", "r2"])
+# detrend_file: jumlah sampel yang ditulis, koefisien (urutan np.polyfit), r^2
+HasilDetrendFile = namedtuple("HasilDetrendFile", ["n", "coeffs", "r2"])
+
+
+def r_squared(y, baseline):
+    """r^2 = 1 - Sr/St, sama seperti di code2.py (per baris kalau y 2-D)."""
+    Sr = np.sum((y - baseline) ** 2, axis=-1)                               # selisih sinyal asli dan baseline
+    St = np.sum((y - np.mean(y, axis=-1, keepdims=True)) ** 2, axis=-1)     # total variasi terhadap rata-rata
+    return 1 - Sr / St
+
+
+def poly_detrend(t, y, order, criterion=None):
+    """
+    Fit baseline polinomial orde `order` lalu kurangkan dari sinyal.
+    coeffs dikembalikan dengan urutan np.polyfit (pangkat tertinggi dulu) untuk t asli.
+    Kalau criterion diisi ("aic", "bic", "r2", "cv"), orde dipilih otomatis dari
+    0..order; orde terpilih = len(coeffs) - 1.
+
+    y boleh 2-D (n_kanal, n_sampel) dengan sumbu waktu t yang sama: basis Vandermonde
+    difaktorkan sekali dan semua kanal diselesaikan sebagai satu least squares multi-RHS.
+    Hasilnya baseline/y_detrended (n_kanal, n_sampel), coeffs (n_kanal, order+1), r2 (n_kanal,).
+    """
+    t = np.asarray(t, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if y.ndim == 2:
+        if criterion:
+            raise ValueError("pemilihan orde otomatis hanya untuk satu kanal")
+        fit = poly_fit(t, y.T, order)
+        baseline = fit_eval(fit, t).T
+        return HasilDetrend(y - baseline, baseline, to_polyfit_order(fit).T, r_squared(y, baseline))
+    if criterion:
+        fit = select_order(t, y, order, criterion).fit
+    else:
+        fit = poly_fit(t, y, order)
+    baseline = fit_eval(fit, t)
+    return HasilDetrend(y - baseline, baseline, to_polyfit_order(fit), r_squared(y, baseline))
+
+
+class PolyFitStream:
+    """
+    Least squares polinomial global yang diakumulasi per chunk (TSQR).
+    Yang disimpan hanya R dari QR matriks augmented [V | y] ((p+1) x (p+1)):
+    blok kiri atas = R, kolom terakhir = Q^T y. Tiap tambah() cukup QR mode "r"
+    dari [R_lama; V_chunk | y_chunk] (Q tidak pernah dibentuk), ditambah rata-rata
+    dan M2 berjalan (Welford/Chan) untuk r^2. center/scale harus diketahui di depan.
+    """
+
+    def __init__(self, degree, center, scale):
+        self.degree = degree
+        self.center = center
+        self.scale = scale
+        self._Rz = np.zeros((0, degree + 2))
+        self.n = 0
+        self.rata_y = 0.0
+        self.m2_y = 0.0         # sum (y - rata_y)^2
+
+    @property
+    def R(self):
+        return self._Rz[:self.degree + 1, :self.degree + 1]
+
+    @property
+    def z(self):
+        return self._Rz[:self.degree + 1, -1]
+
+    def tambah(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if len(y) == 0:
+            return
+        Vy = np.empty((len(y), self.degree + 2))
+        Vy[:, :-1] = vandermonde((x - self.center) / self.scale, self.degree)
+        Vy[:, -1] = y
+        self._Rz = np.linalg.qr(np.vstack([self._Rz, Vy]), mode="r")
+        # gabung rata-rata/M2 chunk ke total (Chan et al.): tanpa sum(y^2) - (sum y)^2 / n,
+        # yang kehilangan digit untuk rekaman panjang dengan offset besar
+        n_lama = self.n
+        rata_chunk = float(np.mean(y))
+        d = y - rata_chunk
+        selisih = rata_chunk - self.rata_y
+        self.n += len(y)
+        self.rata_y += selisih * len(y) / self.n
+        self.m2_y += float(np.dot(d, d)) + selisih * selisih * n_lama * len(y) / self.n
+
+    def _sst(self):
+        return self.m2_y
+
+    def sse(self):
+        """
+        SSE untuk orde 0..degree sekaligus (kolom Vandermonde bersarang, seperti select_order).
+        Residu orde penuh sudah ada di R augmented (elemen terakhir diagonalnya), jadi
+        SSE_k = rho^2 + sum_{j>k} z_j^2 dijumlah dari ekor, tanpa mengurangkan dari sum(y^2).
+        """
+        p = self.degree + 1
+        rho = self._Rz[p, p] if self._Rz.shape[0] > p else 0.0
+        zz = np.zeros(p)
+        z = self._Rz[:p, -1]
+        zz[:len(z)] = z * z
+        ekor = np.concatenate([np.cumsum(zz[::-1])[::-1][1:], [0.0]])
+        return rho * rho + ekor
+
+    def fit(self, order=None):
+        """PolyFit orde `order` (default: degree)."""
+        k = self.degree if order is None else order
+        if self.n <= k:
+            raise ValueError(f"hanya {self.n} sampel, kurang untuk orde {k}")
+        coeff = np.linalg.solve(self.R[:k + 1, :k + 1], self.z[:k + 1])
+        return PolyFit(coeff, self.center, self.scale)
+
+    def r2(self, order=None):
+        k = self.degree if order is None else order
+        return 1 - self.sse()[k] / self._sst()
+
+    def pilih_orde(self, criterion="bic", r2_tol=1e-3):
+        """Orde 0..degree terbaik menurut "aic" / "bic" / "r2" (cv butuh data mentah)."""
+        return pilih_dari_sse(self.sse(), self.n, self._sst(), criterion, r2_tol)[0]
+
+
+def _chunk_ty(chunk, n_masuk):
+    """(t, y) dari satu chunk; file satu kolom memakai indeks sampel sebagai t (seperti load_ecg)."""
+    if chunk.shape[1] == 1:
+        return np.arange(n_masuk, n_masuk + len(chunk), dtype=float), chunk[:, 0]
+    return chunk[:, 0], chunk[:, 1]
+
+
+def _iter_ty(src, chunk_size):
+    from metnum.ecg_io import iter_chunks
+
+    n_masuk = 0
+    for chunk in iter_chunks(src, chunk_size):
+        yield _chunk_ty(chunk, n_masuk)
+        n_masuk += len(chunk)
+
+
+def rentang_waktu(src, chunk_size=65536):
+    """(t_min, t_max) seluruh file, dibaca per chunk."""
+    t_min, t_max = np.inf, -np.inf
+    for t, _ in _iter_ty(src, chunk_size):
+        if len(t):
+            t_min = min(t_min, float(np.min(t)))
+            t_max = max(t_max, float(np.max(t)))
+    if t_min > t_max:
+        raise ValueError(f"{src}: tidak ada sampel")
+    return t_min, t_max
+
+
+def fit_file(src, order, chunk_size=65536, criterion=None, rentang=None):
+    """
+    Fit polinomial global untuk file `src` tanpa memuat seluruh isinya.
+    Mengembalikan (PolyFitStream, PolyFit). Dengan criterion ("aic" / "bic" / "r2"),
+    `order` menjadi orde maksimum.
+    """
+    center, scale = _scaling(np.asarray(rentang or rentang_waktu(src, chunk_size), dtype=float))
+    acc = PolyFitStream(order, center, scale)
+    for t, y in _iter_ty(src, chunk_size):
+        acc.tambah(t, y)
+    if acc.n == 0:
+        raise ValueError(f"{src}: tidak ada sampel")
+    return acc, acc.fit(acc.pilih_orde(criterion) if criterion else None)
+
+
+def detrend_file(src, dst, order, chunk_size=65536, criterion=None, rentang=None):
+    """
+    Detrend global out-of-core: fit (lintasan 0-1), lalu baseline dikurangkan per chunk
+    dan ditulis ke dst (lintasan 2). dst .npy -> array (n, 4) yang ditulis per chunk;
+    selain itu CSV "t,y,baseline,y_detrended" (kolom sama dengan metnum.batch).
+    """
+    acc, fit = fit_file(src, order, chunk_size, criterion, rentang)
+    k = len(fit.coeff) - 1
+
+    if dst.endswith(".npy"):
+        # header .npy dulu (n sudah diketahui dari lintasan 1), lalu baris ditulis per chunk
+        with open(dst, "wb") as f:
+            np.lib.format.write_array_header_1_0(
+                f, {"descr": "<f8", "fortran_order": False, "shape": (acc.n, 4)})
+            for t, y in _iter_ty(src, chunk_size):
+                baseline = fit_eval(fit, t)
+                np.column_stack([t, y, baseline, y - baseline]).astype("<f8").tofile(f)
+    else:
+        with open(dst, "w") as f:
+            f.write("t,y,baseline,y_detrended\n")
+            for t, y in _iter_ty(src, chunk_size):
+                baseline = fit_eval(fit, t)
+                np.savetxt(f, np.column_stack([t, y, baseline, y - baseline]), delimiter=",", fmt="%.17g")
+    return HasilDetrendFile(acc.n, to_polyfit_order(fit), acc.r2(k))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Detrend polinomial global per chunk (memori konstan)")
+    ap.add_argument("src", help="file data (format ecg_io, atau .npy)")
+    ap.add_argument("dst", help="output .npy (n, 4) atau CSV t,y,baseline,y_detrended")
+    ap.add_argument("--order", type=int, default=15)
+    ap.add_argument("--criterion", choices=["aic", "bic", "r2"], default=None,
+                    help="pilih orde otomatis (--order jadi orde maksimum)")
+    ap.add_argument("--chunk", type=int, default=65536)
+    ap.add_argument("--rentang", type=float, nargs=2, default=None, metavar=("T_MIN", "T_MAX"),
+                    help="rentang waktu kalau sudah diketahui (melewati lintasan 0)")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    hasil = detrend_file(args.src, args.dst, args.order, args.chunk, args.criterion, args.rentang)
+    print(f"{hasil.n} sampel, orde {len(hasil.coeffs) - 1}, r2 = {hasil.r2:.6f}, "
+          f"{time.perf_counter() - t0:.2f} s -> {args.dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
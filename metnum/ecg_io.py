@@ -0,0 +1,175 @@
+"""
+Loader tunggal untuk semua format data ECG di repo ini.
+
+Format yang dikenali otomatis (dari beberapa baris pertama):
+    Person_*.txt        "0.002,-0.115"         (koma, desimal titik)
+    dataset*.txt        "0,002;-0,115"         (titik koma, desimal koma)
+    FetalECG.txt        "0.001<TAB>26.7"       (tab)
+    abdomen*.txt        "  -1.2000000e+01"     (satu kolom, spasi)
+
+Hasil parsing disimpan sebagai file .npy di folder cache (.ecg_cache/ di sebelah
+file sumber), dengan kunci ukuran + mtime file sumber. Pemanggilan berikutnya
+langsung membuka .npy itu secara memory-mapped tanpa parsing teks lagi.
+"""
+
+import os
+import re
+
+import numpy as np
+
+CACHE_DIR = ".ecg_cache"
+
+
+def sniff_format(path, n_baris=20):
+    """
+    Tebak pemisah kolom dan tanda desimal dari beberapa baris pertama.
+    Mengembalikan dict: sep (None = spasi/whitespace), decimal, ncols.
+    """
+    contoh = []
+    with open(path, "r") as f:
+        for baris in f:
+            baris = baris.strip()
+            if baris:
+                contoh.append(baris)
+            if len(contoh) >= n_baris:
+                break
+    if not contoh:
+        raise ValueError(f"{path}: file kosong")
+
+    teks = "\n".join(contoh)
+    if ";" in teks:
+        sep = ";"
+    elif "\t" in teks:
+        sep = "\t"
+    elif "," in teks:
+        sep = ","
+    else:
+        sep = None
+
+    # desimal koma hanya mungkin kalau koma bukan pemisah kolom
+    decimal = "," if sep != "," and "," in teks else "."
+    ncols = len(contoh[0].split(sep))
+    return {"sep": sep, "decimal": decimal, "ncols": ncols}
+
+
+def _parse_pandas(path, fmt):
+    import pandas as pd
+
+    sep = r"\s+" if fmt["sep"] is None else fmt["sep"]
+    df = pd.read_csv(path, sep=sep, decimal=fmt["decimal"], header=None,
+                     engine="c", dtype=np.float64)
+    return df.to_numpy(dtype=np.float64)
+
+
+def _parse_numpy(path, fmt):
+    if fmt["decimal"] == ",":
+        with open(path, "r") as f:
+            baris = [b.replace(",", ".") for b in f if b.strip()]
+        return np.loadtxt(baris, delimiter=fmt["sep"], dtype=np.float64, ndmin=2)
+    return np.loadtxt(path, delimiter=fmt["sep"], dtype=np.float64, ndmin=2)
+
+
+def parse_text(path, fmt=None):
+    """Parse file teks jadi array float64 (n_sampel, n_kolom), tanpa cache."""
+    fmt = fmt or sniff_format(path)
+    try:
+        data = _parse_pandas(path, fmt)
+    except ImportError:
+        data = _parse_numpy(path, fmt)
+    return np.ascontiguousarray(data, dtype=np.float64)
+
+
+def cache_path(path, cache_dir=None):
+    """Lokasi file cache .npy untuk `path`, kuncinya ukuran dan mtime file sumber."""
+    st = os.stat(path)
+    folder = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), CACHE_DIR)
+    nama = os.path.basename(path)
+    return os.path.join(folder, f"{nama}.{st.st_size}-{st.st_mtime_ns}.npy")
+
+
+def _tulis_cache(target, data):
+    folder = os.path.dirname(target)
+    os.makedirs(folder, exist_ok=True)
+
+    # buang cache lama dari file sumber yang sama: nama persis "<sumber>.<ukuran>-<mtime>.npy"
+    # dengan kunci lain (bukan sekadar awalan sama, jadi cache a.txt.bak tidak ikut terhapus,
+    # dan target yang mungkin baru di-replace proses lain tidak disentuh)
+    baru = os.path.basename(target)
+    pola = re.compile(re.escape(baru.rsplit(".", 2)[0]) + r"\.\d+-\d+\.npy")
+    for lama in os.listdir(folder):
+        if lama != baru and pola.fullmatch(lama):
+            try:
+                os.remove(os.path.join(folder, lama))
+            except OSError:
+                pass
+
+    # tulis ke file sementara dulu lalu rename, aman kalau beberapa proses jalan bareng
+    sementara = f"{target}.{os.getpid()}.tmp"
+    with open(sementara, "wb") as f:
+        np.save(f, data)
+    os.replace(sementara, target)
+
+
+def load_array(path, cache=True, cache_dir=None, mmap=True):
+    """
+    Baca file data jadi array float64 2-D (n_sampel, n_kolom).
+    Dengan cache=True, hasil parsing disimpan/dibaca dari sidecar .npy.
+    Array dari cache bersifat read-only (memory-mapped) kalau mmap=True.
+    """
+    if not cache:
+        return parse_text(path)
+
+    target = cache_path(path, cache_dir)
+    if os.path.exists(target):
+        try:
+            return np.load(target, mmap_mode="r" if mmap else None)
+        except (OSError, ValueError):
+            pass  # cache rusak, parse ulang
+
+    data = parse_text(path)
+    try:
+        _tulis_cache(target, data)
+    except OSError:
+        return data  # folder tidak bisa ditulis: tetap jalan tanpa cache
+    if not mmap:
+        return data
+    try:
+        return np.load(target, mmap_mode="r")
+    except (OSError, ValueError):
+        return data  # cache dihapus/ditimpa proses lain di antaranya: pakai hasil parse
+
+
+def load_ecg(path, cache=True, cache_dir=None):
+    """
+    Baca rekaman ECG jadi (t, y) float64.
+    File satu kolom (abdomen*.txt) tidak punya waktu, jadi t = indeks sampel.
+    """
+    data = load_array(path, cache=cache, cache_dir=cache_dir)
+    if data.shape[1] == 1:
+        y = data[:, 0]
+        return np.arange(len(y), dtype=np.float64), y
+    return data[:, 0], data[:, 1]
+
+
+def iter_chunks(path, chunk_size=65536):
+    """
+    Baca file per potongan (chunk) tanpa memuat seluruh isi file.
+    Menghasilkan array float64 (n <= chunk_size, n_kolom) satu per satu.
+    File .npy dibaca memory-mapped; file teks dibaca bertahap dengan pandas.
+    """
+    if path.endswith(".npy"):
+        data = np.load(path, mmap_mode="r")
+        if data.ndim == 1:
+            data = data[:, None]
+        for a in range(0, len(data), chunk_size):
+            yield np.array(data[a:a + chunk_size], dtype=np.float64)
+        return
+
+    import pandas as pd
+
+    fmt = sniff_format(path)
+    sep = r"\s+" if fmt["sep"] is None else fmt["sep"]
+    with pd.read_csv(path, sep=sep, decimal=fmt["decimal"], header=None, engine="c",
+                     dtype=np.float64, chunksize=chunk_size) as reader:
+        for df in reader:
+            yield df.to_numpy(dtype=np.float64)
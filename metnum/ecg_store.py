@@ -0,0 +1,292 @@
+"""
+Store dataset ECG terkonsolidasi: satu folder berisi kolom-kolom .npy + index.json.
+
+Semua rekaman teks (Person_*.txt, abdomen*.txt, FetalECG.txt, Data_ECG.txt,
+dataset*.txt) di-parse sekali lalu disimpan per kolom:
+
+    ecg_store/
+        index.json              nama -> sumber, n, fs, t0, file kolom, sha1
+        Person_00/t.npy         waktu asli dari file (float64)
+        Person_00/y.npy         sinyal (float64)
+        abdomen1/y.npy          file satu kolom: tidak ada t.npy, t = t0 + i / fs
+
+Rekaman yang isinya identik (dataset.txt dan dataset2dps.txt) disimpan sekali;
+entri duplikatnya menunjuk ke file kolom yang sama ("duplikat_dari").
+
+Kolom dibuka memory-mapped, jadi y[start:end] hanya menyentuh halaman file yang
+dibutuhkan dan hasilnya view tanpa salinan (read-only). Potongan berdasarkan
+waktu memakai searchsorted di t.npy (atau aritmetika fs kalau tidak ada t.npy).
+
+Contoh:
+    python -m metnum.ecg_store build *.txt --fs abdomen1=1000 abdomen2=1000 abdomen3=1000
+    python -m metnum.ecg_store list
+
+    store = EcgStore()
+    t, y = store.ambil("abdomen1", 1, 1000)          # sampel [1, 1000)
+    t, y = store.ambil_waktu("Person_07", 2.0, 4.0)  # detik [2, 4)
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from metnum.ecg_io import load_ecg, parse_text
+
+STORE_DIR = "ecg_store"
+INDEX = "index.json"
+
+
+def nama_rekaman(path):
+    """Nama rekaman di store: nama file tanpa folder dan ekstensi."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _simpan_atomik(target, tulis, mode="wb"):
+    """Tulis ke file sementara lalu rename, aman kalau ada proses lain yang sedang membaca."""
+    sementara = f"{target}.{os.getpid()}.tmp"
+    with open(sementara, mode) as f:
+        tulis(f)
+    os.replace(sementara, target)
+
+
+def _perkiraan_fs(t):
+    """fs dari median selisih waktu, dibulatkan supaya 0.002 -> 500.0 (bukan 500.00000000028)."""
+    if len(t) < 2:
+        return 1.0
+    dt = float(np.median(np.diff(t)))
+    if dt <= 0:
+        raise ValueError("kolom waktu tidak naik")
+    return float(round(1.0 / dt, 6))
+
+
+class EcgStore:
+    """Akses baca (dan bangun/perbarui) store di `folder`."""
+
+    def __init__(self, folder=STORE_DIR):
+        self.folder = folder
+        self._mmap = {}
+        path = os.path.join(folder, INDEX)
+        if os.path.exists(path):
+            with open(path) as f:
+                self.index = json.load(f)
+        else:
+            self.index = {}
+
+    def __contains__(self, nama):
+        return nama in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def nama(self):
+        return sorted(self.index)
+
+    def info(self, nama):
+        """Entri index: sumber, n, fs, t0, kolom, sha1 (dan duplikat_dari kalau ada)."""
+        return self.index[nama]
+
+    def masih_baru(self, nama, path=None):
+        """True kalau file sumbernya tidak berubah sejak disimpan (ukuran + mtime)."""
+        info = self.index.get(nama)
+        path = path or (info and info["sumber"])
+        if info is None or not os.path.exists(path):
+            return False
+        st = os.stat(path)
+        if info["ukuran_sumber"] != st.st_size or info["mtime_ns"] != st.st_mtime_ns:
+            return False
+        # duplikat ikut basi kalau rekaman yang ditunjuknya sudah berisi data lain
+        asal = self.index.get(info.get("duplikat_dari"), info)
+        return asal["sha1"] == info["sha1"]
+
+    # ---------- baca ----------
+
+    def kolom(self, nama, k):
+        """Kolom `k` ("t" / "y") sebagai memmap read-only; None kalau kolomnya tidak disimpan."""
+        file = self.index[nama]["kolom"].get(k)
+        if file is None:
+            return None
+        path = os.path.join(self.folder, file)
+        if path not in self._mmap:
+            self._mmap[path] = np.load(path, mmap_mode="r")
+        return self._mmap[path]
+
+    def _rentang(self, nama, start, end):
+        n = self.index[nama]["n"]
+        return slice(start, end).indices(n)[:2]
+
+    def waktu(self, nama, start=None, end=None):
+        start, end = self._rentang(nama, start, end)
+        t = self.kolom(nama, "t")
+        if t is not None:
+            return t[start:end]
+        info = self.index[nama]
+        return info["t0"] + np.arange(start, end, dtype=np.float64) / info["fs"]
+
+    def ambil(self, nama, start=None, end=None):
+        """(t, y) untuk sampel [start, end); y (dan t kalau disimpan) adalah view memmap."""
+        start, end = self._rentang(nama, start, end)
+        return self.waktu(nama, start, end), self.kolom(nama, "y")[start:end]
+
+    def indeks_waktu(self, nama, t_awal=None, t_akhir=None):
+        """Rentang sampel (start, end) dengan t_awal <= t < t_akhir."""
+        info = self.index[nama]
+        t = self.kolom(nama, "t")
+        n = info["n"]
+
+        def cari(nilai, default):
+            if nilai is None:
+                return default
+            if t is not None:
+                return int(np.searchsorted(t, nilai, side="left"))
+            i = math.ceil((nilai - info["t0"]) * info["fs"] - 1e-9)
+            return min(max(i, 0), n)
+
+        return cari(t_awal, 0), cari(t_akhir, n)
+
+    def ambil_waktu(self, nama, t_awal=None, t_akhir=None):
+        """(t, y) untuk t_awal <= t < t_akhir (detik, atau satuan kolom waktu aslinya)."""
+        return self.ambil(nama, *self.indeks_waktu(nama, t_awal, t_akhir))
+
+    # ---------- tulis ----------
+
+    def tambah(self, path, fs=None, paksa=False):
+        """
+        Parse `path` dan simpan ke store. Dilewati kalau sumbernya tidak berubah.
+        fs hanya dipakai untuk file tanpa kolom waktu (default 1.0: t = indeks sampel,
+        sama dengan load_ecg); file dengan kolom waktu memakai fs dari kolom itu.
+        Mengembalikan status: "baru", "duplikat", atau "sama".
+        """
+        nama = nama_rekaman(path)
+        if not paksa and self.masih_baru(nama, path) and \
+                (fs is None or "t" in self.index[nama]["kolom"] or self.index[nama]["fs"] == fs):
+            return "sama"
+
+        st = os.stat(path)
+        data = parse_text(path)
+        sha1 = hashlib.sha1(data.tobytes()).hexdigest()
+        entri = {"sumber": path, "ukuran_sumber": st.st_size, "mtime_ns": st.st_mtime_ns,
+                 "n": int(data.shape[0]), "sha1": sha1}
+        if data.shape[1] == 1:
+            entri["fs"] = float(fs) if fs else 1.0
+            entri["t0"] = 0.0
+        else:
+            entri["fs"] = _perkiraan_fs(data[:, 0])
+            entri["t0"] = float(data[0, 0]) if len(data) else 0.0
+
+        # isi sama persis dengan rekaman lain: pakai file kolomnya
+        for lain, info in self.index.items():
+            if lain != nama and info["sha1"] == sha1 and "duplikat_dari" not in info:
+                entri["kolom"] = info["kolom"]
+                entri["duplikat_dari"] = lain
+                self.index[nama] = entri
+                return "duplikat"
+
+        os.makedirs(os.path.join(self.folder, nama), exist_ok=True)
+        entri["kolom"] = {}
+        if data.shape[1] == 1:
+            kolom = {"y": data[:, 0]}
+        else:
+            # lebih dari satu kanal: y disimpan (n, n_kanal)
+            kolom = {"t": data[:, 0], "y": data[:, 1] if data.shape[1] == 2 else data[:, 1:]}
+        for k, nilai in kolom.items():
+            file = f"{nama}/{k}.npy"
+            _simpan_atomik(os.path.join(self.folder, file),
+                           lambda f, nilai=nilai: np.save(f, np.ascontiguousarray(nilai)))
+            entri["kolom"][k] = file
+        self._mmap = {p: m for p, m in self._mmap.items() if not p.startswith(os.path.join(self.folder, nama))}
+        self.index[nama] = entri
+        return "baru"
+
+    def simpan_index(self):
+        os.makedirs(self.folder, exist_ok=True)
+        _simpan_atomik(os.path.join(self.folder, INDEX),
+                       lambda f: json.dump(self.index, f, indent=1, sort_keys=True), mode="w")
+
+
+def bangun_store(paths, folder=STORE_DIR, fs=None, paksa=False):
+    """
+    Tambahkan semua file di `paths` ke store lalu tulis index.json.
+    fs: dict nama rekaman -> sampling rate untuk file tanpa kolom waktu.
+    Mengembalikan (store, {nama: status}).
+    """
+    fs = fs or {}
+    store = EcgStore(folder)
+    status = {}
+    # rekaman asli didahulukan dari salinannya (dataset.txt sebelum dataset2dps.txt)
+    for path in sorted(paths, key=lambda p: (len(nama_rekaman(p)), p)):
+        nama = nama_rekaman(path)
+        status[nama] = store.tambah(path, fs=fs.get(nama), paksa=paksa)
+    store.simpan_index()
+    return store, status
+
+
+def load_segment(path, start=None, end=None, folder=STORE_DIR):
+    """
+    (t, y) sampel [start, end) dari `path`. Kalau rekamannya ada di store dan
+    sumbernya belum berubah, dibaca dari memmap store; kalau tidak, lewat load_ecg.
+    """
+    store = EcgStore(folder)
+    nama = nama_rekaman(path)
+    if nama in store and store.masih_baru(nama, path):
+        return store.ambil(nama, start, end)
+    t, y = load_ecg(path)
+    return t[start:end], y[start:end]
+
+
+def _parse_fs(daftar):
+    fs = {}
+    for item in daftar or []:
+        nama, _, nilai = item.partition("=")
+        fs[nama_rekaman(nama)] = float(nilai)
+    return fs
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Store .npy kolom + index.json untuk dataset ECG")
+    ap.add_argument("--store", default=STORE_DIR, help="folder store")
+    sub = ap.add_subparsers(dest="perintah", required=True)
+
+    b = sub.add_parser("build", help="parse file teks dan simpan ke store")
+    b.add_argument("files", nargs="+", help="file atau pola glob")
+    b.add_argument("--fs", nargs="+", metavar="NAMA=FS", help="sampling rate file tanpa kolom waktu")
+    b.add_argument("--paksa", action="store_true", help="parse ulang walaupun sumber tidak berubah")
+
+    sub.add_parser("list", help="tampilkan isi store")
+    args = ap.parse_args(argv)
+
+    if args.perintah == "build":
+        paths = sorted({p for pola in args.files for p in (glob.glob(pola) or [pola])})
+        t0 = time.perf_counter()
+        store, status = bangun_store(paths, args.store, fs=_parse_fs(args.fs), paksa=args.paksa)
+        for nama in sorted(status):
+            info = store.info(nama)
+            catatan = f" (= {info['duplikat_dari']})" if "duplikat_dari" in info else ""
+            print(f"{nama:<16} {status[nama]:<9} n={info['n']:<7} fs={info['fs']:g}{catatan}")
+        print(f"{len(status)} rekaman, {time.perf_counter() - t0:.2f} s -> {args.store}/{INDEX}")
+        return 0
+
+    store = EcgStore(args.store)
+    if not len(store):
+        print(f"store {args.store} kosong", file=sys.stderr)
+        return 1
+    print(f"{'nama':<16} {'n':>7} {'fs':>8} {'durasi':>9} {'kolom':<10} sumber")
+    for nama in store.nama():
+        info = store.info(nama)
+        durasi = info["n"] / info["fs"]
+        kolom = ",".join(sorted(info["kolom"]))
+        catatan = f" (= {info['duplikat_dari']})" if "duplikat_dari" in info else ""
+        basi = "" if store.masih_baru(nama) else " [sumber berubah]"
+        print(f"{nama:<16} {info['n']:7d} {info['fs']:8g} {durasi:9.2f} {kolom:<10} "
+              f"{info['sumber']}{catatan}{basi}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
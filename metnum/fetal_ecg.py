@@ -0,0 +1,325 @@
+"""
+Pemisahan ECG ibu (maternal) dan janin (fetal) dari kanal abdomen, per blok.
+
+Tahap sesudah detrend untuk abdomen1/2/3 (fs 1000 Hz). Rekaman panjang diproses
+per blok `blok_s` detik (ditambah `tepi_s` detik konteks di kiri-kanan supaya filter
+dan beat di batas blok tidak terpotong), semua langkah di dalam blok vektorisasi
+NumPy untuk semua kanal sekaligus:
+
+    1. bandpass lebar 3-100 Hz           : buang baseline (detrend lokal per blok)
+    2. R ibu  : energi 8-20 Hz dijumlah antar kanal -> find_peaks (refractory 0.3 s),
+                lalu digeser ke maksimum energi +-60 ms
+    3. template: semua beat ibu diambil sekaligus lewat matriks indeks (n_beat, L),
+                template = median beat per kanal; tiap beat dikurangi a * template
+                dengan a = skala least squares per beat
+    4. R janin: residu difilter 10-45 Hz, puncak dicari per kanal; dipilih kanal
+                dengan RR paling teratur (MAD/median RR terkecil)
+
+metode="ica": sebelum langkah 3, kanal blok diganti sumber FastICA (whitening +
+iterasi fixed-point simetris, tanh). Template ibu tetap dikurangkan dari tiap
+sumber, karena komponen ibu jarang terpisah bersih hanya dengan 3 kanal.
+Urutan/tanda sumber ICA bebas, jadi antar blok dibuat konsisten: iterasi blok
+berikutnya dimulai dari matriks unmixing blok sebelumnya (juga lebih cepat
+konvergen) lalu sumbernya dicocokkan ke urutan dan tanda blok sebelumnya.
+`kanal` = indeks sumber; `fetal` diproyeksikan balik ke ruang kanal (pinv unmixing),
+jadi tetap dalam satuan kanal dan menyambung antar blok.
+
+HR per blok = 60 / median RR (bpm) untuk beat yang jatuh di dalam blok.
+
+Butuh kanal abdomen yang memuat ECG ibu dan janin sekaligus (abdomen1/2/3). Pada
+rekaman yang hanya berisi satu jantung, misalnya FetalECG.txt (satu lead janin), R
+"ibu" dan R "janin" adalah beat yang sama; blok seperti itu ditandai `sama_ibu`
+(lebih dari separuh puncak janin berjarak <= JARAK_SAMA dari puncak ibu) dan
+hr_janin-nya NaN, bukan fHR.
+
+Contoh:
+    python -m metnum.fetal_ecg abdomen1.txt abdomen2.txt abdomen3.txt --fs 1000 \\
+        --blok 10 --out fetal_hr.csv --fetal fetal.npy
+
+    for b in pisahkan_blok(Y, 1000.0):
+        print(b.t_awal, b.hr_ibu, b.hr_janin)
+"""
+
+import argparse
+import csv
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from metnum.multikanal import load_kanal
+from metnum.qrs_filter import design_bandpass, filter_signal
+
+# Pita dan jarak antar beat (detik)
+PITA_LEBAR = (3.0, 100.0)
+PITA_IBU = (8.0, 20.0)
+PITA_JANIN = (10.0, 45.0)
+REFRACTORY_IBU = 0.3
+REFRACTORY_JANIN = 0.3      # fHR sampai 200 bpm
+TEMPLATE_PRE = 0.25
+TEMPLATE_POST = 0.45
+JARAK_SAMA = 0.03           # puncak janin sedekat ini ke puncak ibu = beat yang sama
+
+# t_awal/t_akhir dalam detik; puncak dalam indeks sampel absolut; fetal (n_kanal, n_sampel blok)
+# selalu dalam ruang kanal; kanal = kanal (template) atau indeks sumber ICA terpilih;
+# sama_ibu = puncak janin ternyata beat ibu (hr_janin NaN)
+HasilBlok = namedtuple("HasilBlok", ["t_awal", "t_akhir", "hr_ibu", "hr_janin", "n_ibu", "n_janin",
+                                     "kanal", "fetal", "puncak_ibu", "puncak_janin", "sama_ibu"])
+HasilFetal = namedtuple("HasilFetal", ["fetal", "puncak_ibu", "puncak_janin", "blok"])
+
+
+def _bandpass(X, fs, pita, M=100):
+    b = design_bandpass(float(fs), pita[0], pita[1], M)
+    return np.array([filter_signal(b, x) for x in X])
+
+
+def _energi(X, fs, jendela_s):
+    """Energi dijumlah antar kanal lalu dirata-rata bergerak (cumsum), panjang tetap N."""
+    e = np.einsum("kn,kn->n", X, X) if X.ndim == 2 else X * X
+    w = max(1, int(round(jendela_s * fs)))
+    c = np.concatenate([np.zeros(w - w // 2), np.cumsum(e), np.full(w // 2, np.sum(e))])
+    return (c[w:] - c[:-w]) / w
+
+
+def _puncak(energi, fs, refractory_s, ambang=0.3, persentil=98):
+    from scipy.signal import find_peaks
+
+    tinggi = ambang * np.percentile(energi, persentil)
+    p, _ = find_peaks(energi, height=tinggi, distance=max(1, int(refractory_s * fs)))
+    return p
+
+
+def _geser_ke_maksimum(p, energi, r):
+    """Pindahkan tiap puncak ke argmax energi di [p - r, p + r] (vektorisasi)."""
+    if len(p) == 0:
+        return p
+    jendela = np.clip(p[:, None] + np.arange(-r, r + 1), 0, len(energi) - 1)
+    return jendela[np.arange(len(p)), np.argmax(energi[jendela], axis=1)]
+
+
+def deteksi_ibu(X, fs):
+    """Indeks R ibu dari X (n_kanal, N) yang sudah di-bandpass lebar."""
+    B = _bandpass(X, fs, PITA_IBU)
+    p = _puncak(_energi(B, fs, 0.1), fs, REFRACTORY_IBU)
+    # energi rata-rata 100 ms puncaknya tumpul; posisi R dari energi per sampel
+    return np.unique(_geser_ke_maksimum(p, np.einsum("kn,kn->n", B, B), int(0.06 * fs)))
+
+
+def kurangi_template(X, puncak, fs, pre_s=TEMPLATE_PRE, post_s=TEMPLATE_POST):
+    """
+    Kurangkan template beat ibu dari X (n_kanal, N). Template dibangun dari beat
+    yang jendelanya utuh di dalam X; beat di tepi X ikut dikurangi, hanya bagian
+    jendelanya yang ada di X. Mengembalikan (residu, template (n_kanal, L)).
+    """
+    pre, post = int(pre_s * fs), int(post_s * fs)
+    N = X.shape[1]
+    residu = np.array(X, dtype=np.float64)
+    utuh = (puncak - pre >= 0) & (puncak + post <= N)
+    if not np.any(utuh):
+        return residu, np.zeros((X.shape[0], pre + post))
+    idx = puncak[:, None] + np.arange(-pre, post)          # (n_beat, L)
+    ada = (idx >= 0) & (idx < N)
+    idx = np.clip(idx, 0, N - 1)
+    beat = residu[:, idx] * ada                             # (n_kanal, n_beat, L), nol di luar X
+    template = np.median(beat[:, utuh], axis=1)
+    # skala least squares per beat, hanya atas sampel yang ada di X
+    energi_t = np.einsum("kl,bl,kl->kb", template, ada, template)
+    skala = np.einsum("kbl,kl->kb", beat, template) / np.where(energi_t > 0, energi_t, 1.0)
+    # np.subtract.at: jendela beat yang bertumpuk (HR ibu tinggi) dikurangkan dua-duanya
+    kurang = skala[:, :, None] * template[:, None, :] * ada
+    for k in range(residu.shape[0]):
+        np.subtract.at(residu[k], idx.ravel(), kurang[k].ravel())
+    return residu, template
+
+
+def fastica(X, iterasi=200, tol=1e-8, seed=0, unmixing_awal=None):
+    """
+    FastICA simetris (tanh) untuk X (n_kanal, N). Mengembalikan (S, B) dengan
+    S = B @ (X - rata-rata); urutan dan tanda sumber bebas. unmixing_awal: B dari
+    blok sebelumnya sebagai titik awal iterasi (default: matriks ortogonal acak).
+    """
+    Xc = X - X.mean(axis=1, keepdims=True)
+    d, E = np.linalg.eigh(np.cov(Xc))
+    d = np.maximum(d, np.finfo(float).eps * d.max())
+    whitening = (E / np.sqrt(d)).T
+    Z = whitening @ Xc
+    K, N = Z.shape
+    if unmixing_awal is None:
+        W = np.linalg.qr(np.random.default_rng(seed).standard_normal((K, K)))[0]
+    else:
+        # B = W @ whitening  ->  W = B @ inverse whitening (= E sqrt(d)), lalu diortogonalkan
+        u, _, vt = np.linalg.svd(unmixing_awal @ (E * np.sqrt(d)))
+        W = u @ vt
+    for _ in range(iterasi):
+        g = np.tanh(W @ Z)
+        W_baru = (g @ Z.T) / N - np.mean(1 - g * g, axis=1)[:, None] * W
+        u, _, vt = np.linalg.svd(W_baru)
+        W_baru = u @ vt                                     # dekorelasi simetris
+        selesai = np.max(np.abs(np.abs(np.einsum("ij,ij->i", W_baru, W)) - 1)) < tol
+        W = W_baru
+        if selesai:
+            break
+    return W @ Z, W @ whitening
+
+
+def samakan_sumber(B, B_lama):
+    """
+    Urutkan dan balik tanda baris B (unmixing) supaya tiap sumber cocok dengan
+    sumber blok sebelumnya (korelasi baris B ternormalisasi terbesar, greedy).
+    """
+    Bn = B / np.linalg.norm(B, axis=1, keepdims=True)
+    Ln = B_lama / np.linalg.norm(B_lama, axis=1, keepdims=True)
+    C = Ln @ Bn.T                                   # (lama, baru)
+    urutan = np.full(len(B), -1)
+    skor = np.abs(C)
+    for _ in range(len(B)):
+        i, j = np.unravel_index(np.argmax(skor), skor.shape)
+        urutan[i] = j
+        skor[i, :] = -1.0
+        skor[:, j] = -1.0
+    tanda = np.sign(C[np.arange(len(B)), urutan])
+    return B[urutan] * np.where(tanda == 0, 1.0, tanda)[:, None]
+
+
+def deteksi_janin(residu, fs):
+    """
+    Puncak janin per kanal residu; kembalikan (kanal, puncak) untuk kanal dengan
+    RR paling teratur. kanal = -1 kalau tidak ada kanal dengan >= 3 beat.
+    """
+    F = _bandpass(residu, fs, PITA_JANIN)
+    terbaik, skor_terbaik, puncak_terbaik = -1, np.inf, np.array([], dtype=int)
+    for k in range(F.shape[0]):
+        p = _puncak(_energi(F[k], fs, 0.04), fs, REFRACTORY_JANIN)
+        if len(p) < 3:
+            continue
+        rr = np.diff(p)
+        skor = np.median(np.abs(rr - np.median(rr))) / np.median(rr)
+        if skor < skor_terbaik:
+            terbaik, skor_terbaik, puncak_terbaik = k, skor, p
+    return terbaik, puncak_terbaik
+
+
+def _sama_dengan_ibu(janin, ibu, fs):
+    """True kalau lebih dari separuh puncak janin berjarak <= JARAK_SAMA dari puncak ibu."""
+    if len(janin) == 0 or len(ibu) == 0:
+        return False
+    ibu = np.concatenate(([-np.inf], ibu, [np.inf]))
+    i = np.searchsorted(ibu, janin)
+    jarak = np.minimum(janin - ibu[i - 1], ibu[i] - janin)
+    return np.mean(jarak <= JARAK_SAMA * fs) > 0.5
+
+
+def _hr_blok(puncak, a, b, fs):
+    """(HR bpm, jumlah beat) dari RR yang beat keduanya ada di [a, b)."""
+    di_blok = (puncak >= a) & (puncak < b)
+    rr = np.diff(puncak)[di_blok[1:]]
+    hr = 60.0 * fs / np.median(rr) if len(rr) else np.nan
+    return hr, int(np.count_nonzero(di_blok))
+
+
+def pisahkan_blok(Y, fs, blok_s=10.0, tepi_s=1.0, metode="template"):
+    """
+    Generator HasilBlok untuk Y (n_kanal, N), boleh memmap: hanya satu blok
+    (plus tepi) yang dibaca ke memori sekaligus.
+    """
+    if metode not in ("template", "ica"):
+        raise ValueError("metode harus 'template' atau 'ica'")
+    Y = np.atleast_2d(Y)
+    if metode == "ica" and Y.shape[0] < 2:
+        raise ValueError(f"metode 'ica' butuh minimal 2 kanal, didapat {Y.shape[0]}")
+    N = Y.shape[1]
+    blok = max(1, int(round(blok_s * fs)))
+    tepi = int(round(tepi_s * fs))
+    B_lama = None
+    for a in range(0, N, blok):
+        b = min(a + blok, N)
+        lo, hi = max(0, a - tepi), min(N, b + tepi)
+        X = _bandpass(np.asarray(Y[:, lo:hi], dtype=np.float64), fs, PITA_LEBAR)
+        ibu = deteksi_ibu(X, fs)
+        if metode == "ica":
+            _, B = fastica(X, unmixing_awal=B_lama)
+            if B_lama is not None:
+                B = samakan_sumber(B, B_lama)
+            B_lama = B
+            X = B @ (X - X.mean(axis=1, keepdims=True))
+        residu, _ = kurangi_template(X, ibu, fs)
+        kanal, janin = deteksi_janin(residu, fs)
+        if metode == "ica":
+            residu = np.linalg.pinv(B) @ residu         # kembali ke ruang kanal
+
+        hr_ibu, n_ibu = _hr_blok(ibu, a - lo, b - lo, fs)
+        hr_janin, n_janin = _hr_blok(janin, a - lo, b - lo, fs)
+        sama_ibu = _sama_dengan_ibu(janin, ibu, fs)
+        if sama_ibu:
+            hr_janin = np.nan
+        ibu, janin = ibu + lo, janin + lo
+        yield HasilBlok(a / fs, b / fs, hr_ibu, hr_janin, n_ibu, n_janin, kanal,
+                        residu[:, a - lo:b - lo],
+                        ibu[(ibu >= a) & (ibu < b)], janin[(janin >= a) & (janin < b)], sama_ibu)
+
+
+def pisahkan(Y, fs, blok_s=10.0, tepi_s=1.0, metode="template"):
+    """Semua blok sekaligus: HasilFetal(fetal (n_kanal, N), puncak_ibu, puncak_janin, blok)."""
+    semua = list(pisahkan_blok(Y, fs, blok_s, tepi_s, metode))
+    return HasilFetal(np.concatenate([b.fetal for b in semua], axis=1),
+                      np.concatenate([b.puncak_ibu for b in semua]),
+                      np.concatenate([b.puncak_janin for b in semua]),
+                      semua)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Pisahkan ECG ibu/janin dari kanal abdomen dan hitung fHR per blok")
+    ap.add_argument("files", nargs="+",
+                    help="kanal abdomen (ibu + janin) dengan sumbu waktu yang sama, mis. abdomen1/2/3; "
+                         "rekaman satu jantung seperti FetalECG.txt tidak bermakna (blok ditandai sama_ibu)")
+    ap.add_argument("--fs", type=float, default=1000.0)
+    ap.add_argument("--blok", type=float, default=10.0, help="panjang blok (detik)")
+    ap.add_argument("--tepi", type=float, default=1.0, help="konteks kiri-kanan tiap blok (detik)")
+    ap.add_argument("--metode", choices=["template", "ica"], default="template")
+    ap.add_argument("--start", type=int, default=None)
+    ap.add_argument("--end", type=int, default=None)
+    ap.add_argument("--out", default=None, help="CSV HR per blok")
+    ap.add_argument("--fetal", default=None, help=".npy sinyal janin (n_sampel, n_kanal)")
+    args = ap.parse_args(argv)
+
+    _, Y = load_kanal(args.files, args.start, args.end)
+    if args.metode == "ica" and Y.shape[0] < 2:
+        ap.error(f"--metode ica butuh minimal 2 kanal, didapat {Y.shape[0]}")
+    N = Y.shape[1]
+    f = open(args.fetal, "wb") if args.fetal else None
+    if f is not None:
+        np.lib.format.write_array_header_1_0(
+            f, {"descr": "<f8", "fortran_order": False, "shape": (N, Y.shape[0])})
+
+    # desain filter (dan import scipy) di luar pengukuran waktu proses
+    for pita in (PITA_LEBAR, PITA_IBU, PITA_JANIN):
+        design_bandpass(args.fs, pita[0], pita[1], 100)
+    import scipy.signal  # noqa: F401  (find_peaks)
+
+    baris = []
+    t0 = time.perf_counter()
+    print(f"{'t_awal':>7} {'t_akhir':>7} {'HR ibu':>7} {'HR janin':>8} {'n_ibu':>5} {'n_janin':>7} {'kanal':>5} "
+          f"{'sama_ibu':>8}")
+    for b in pisahkan_blok(Y, args.fs, args.blok, args.tepi, args.metode):
+        print(f"{b.t_awal:7.1f} {b.t_akhir:7.1f} {b.hr_ibu:7.1f} {b.hr_janin:8.1f} "
+              f"{b.n_ibu:5d} {b.n_janin:7d} {b.kanal:5d} {int(b.sama_ibu):8d}")
+        baris.append([b.t_awal, b.t_akhir, b.hr_ibu, b.hr_janin, b.n_ibu, b.n_janin, b.kanal, int(b.sama_ibu)])
+        if f is not None:
+            b.fetal.T.astype("<f8").tofile(f)
+    durasi = time.perf_counter() - t0
+    if f is not None:
+        f.close()
+    print(f"{N / args.fs:.1f} s rekaman, {Y.shape[0]} kanal, {durasi:.3f} s proses "
+          f"({N / args.fs / durasi:.0f}x real time)")
+
+    if args.out:
+        with open(args.out, "w", newline="") as fo:
+            w = csv.writer(fo)
+            w.writerow(["t_awal", "t_akhir", "hr_ibu", "hr_janin", "n_ibu", "n_janin", "kanal", "sama_ibu"])
+            w.writerows(baris)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+Integrator ODE adaptif Dormand-Prince 5(4) (RK45) dengan dense output.
+
+Model pendulum di repo ini (newone.py: RK4 langkah tetap, aqil.py dan
+finalprojectsms3.py: Euler langkah tetap) butuh dt kecil supaya akurat untuk
+simulasi panjang. Di sini ukuran langkah diatur otomatis dari estimasi error
+lokal (selisih solusi orde 5 dan orde 4), jadi langkah membesar saat gerakan
+halus dan mengecil saat berubah cepat.
+
+- f(t, y) -> dy/dt, y array 1-D (misal [theta, omega]).
+- FSAL: tahap terakhir satu langkah = tahap pertama langkah berikutnya,
+  jadi satu langkah diterima = 6 evaluasi f.
+- Dense output orde 4: nilai di antara titik langkah tanpa evaluasi f tambahan,
+  sehingga frame animasi / titik sampling tidak memaksa langkah kecil.
+- Statistik langkah diterima, ditolak, dan jumlah evaluasi f dicatat.
+
+Pemakaian bertahap (loop animasi / kontrol):
+    ode = DormandPrince(f, 0.0, [theta0, omega0], rtol=1e-6)
+    theta, omega = ode.maju_ke(t_frame)
+
+Sekali jalan:
+    hasil = dopri45(f, (0, 60), y0, t_eval=np.arange(0, 60, 0.01))
+
+Perbandingan dengan RK4 langkah tetap (pendulum newone.py):
+    python -m metnum.integrator
+"""
+
+import math
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+# --- Tableau Dormand-Prince 5(4) ---
+C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+A = [
+    np.array([]),
+    np.array([1 / 5]),
+    np.array([3 / 40, 9 / 40]),
+    np.array([44 / 45, -56 / 15, 32 / 9]),
+    np.array([19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729]),
+    np.array([9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656]),
+]
+B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+# E = b* (orde 4) - b (orde 5), termasuk tahap ke-7 (FSAL)
+E = np.array([-71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40])
+# Koefisien dense output orde 4: y(t + s h) = y + h * K^T P [s, s^2, s^3, s^4]
+P = np.array([
+    [1, -8048581381 / 2820520608, 8663915743 / 2820520608, -12715105075 / 11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200 / 32700410799, -68118460800 / 10900136933, 87487479700 / 32700410799],
+    [0, -1754552775 / 470086768, 14199869525 / 1410260304, -10690763975 / 1880347072],
+    [0, 127303824393 / 49829197408, -318862633887 / 49829197408, 701980252875 / 199316789632],
+    [0, -282668133 / 205662961, 2019193451 / 616988883, -1453857185 / 822651844],
+    [0, 40617522 / 29380423, -110615467 / 29380423, 69997945 / 29380423],
+])
+
+FAKTOR_AMAN = 0.9
+FAKTOR_MIN = 0.2
+FAKTOR_MAKS = 10.0
+
+# Hasil dopri45: t dan y (len(t), dim) di t_eval (atau di titik langkah), plus statistik
+HasilODE = namedtuple("HasilODE", ["t", "y", "n_langkah", "n_tolak", "n_eval"])
+
+
+class DormandPrince:
+    """
+    Stepper RK45 adaptif. Keadaan internal bisa sedikit di depan waktu yang diminta
+    (nilai di antaranya diambil dari dense output langkah terakhir).
+    """
+
+    def __init__(self, f, t0, y0, rtol=1e-6, atol=1e-9, h_maks=np.inf, h_awal=None):
+        self.f = f
+        self.rtol = rtol
+        self.atol = atol
+        self.h_maks = h_maks
+        self.t = float(t0)
+        self.y = np.array(y0, dtype=float)
+        self.n_langkah = 0
+        self.n_tolak = 0
+        self.n_eval = 0
+
+        self._k0 = self._f(self.t, self.y)
+        self.h = h_awal if h_awal is not None else self._h_awal()
+        # langkah terakhir yang diterima, untuk dense output
+        self._t_lama = self.t
+        self._y_lama = self.y.copy()
+        self._h_lama = 0.0
+        self._K = None
+
+    def _f(self, t, y):
+        self.n_eval += 1
+        return np.asarray(self.f(t, y), dtype=float)
+
+    def _norma(self, e, y, y_baru):
+        skala = self.atol + self.rtol * np.maximum(np.abs(y), np.abs(y_baru))
+        return math.sqrt(np.mean((e / skala) ** 2))
+
+    def _h_awal(self):
+        """Tebakan langkah awal (Hairer-Norsett-Wanner, II.4)."""
+        skala = self.atol + self.rtol * np.abs(self.y)
+        d0 = math.sqrt(np.mean((self.y / skala) ** 2))
+        d1 = math.sqrt(np.mean((self._k0 / skala) ** 2))
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        h0 = min(h0, self.h_maks)
+        k1 = self._f(self.t + h0, self.y + h0 * self._k0)
+        d2 = math.sqrt(np.mean(((k1 - self._k0) / skala) ** 2)) / h0
+        if max(d1, d2) <= 1e-15:
+            h1 = max(1e-6, h0 * 1e-3)
+        else:
+            h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+        return min(100 * h0, h1, self.h_maks)
+
+    def langkah(self, t_batas=np.inf):
+        """Ambil satu langkah yang diterima (menolak dan mengecilkan langkah kalau perlu)."""
+        h_usul = min(self.h, self.h_maks)
+        terpotong = t_batas - self.t <= h_usul     # langkah dipotong supaya pas di t_batas
+        h = t_batas - self.t if terpotong else h_usul
+        ditolak = False
+        while True:
+            K = np.empty((7, len(self.y)))
+            K[0] = self._k0
+            for i in range(1, 6):
+                K[i] = self._f(self.t + C[i] * h, self.y + h * (A[i] @ K[:i]))
+            y_baru = self.y + h * (B @ K[:6])
+            K[6] = self._f(self.t + h, y_baru)
+
+            err = self._norma(h * (E @ K), self.y, y_baru)
+            if err <= 1.0:
+                break
+            self.n_tolak += 1
+            ditolak = True
+            terpotong = False
+            h *= max(FAKTOR_MIN, FAKTOR_AMAN * err ** -0.2)
+
+        faktor = FAKTOR_MAKS if err == 0 else min(FAKTOR_MAKS, FAKTOR_AMAN * err ** -0.2)
+        if ditolak:
+            faktor = min(1.0, faktor)   # habis ditolak jangan langsung membesar lagi
+        # langkah yang dipotong pendek jangan ikut mengecilkan usulan langkah berikutnya
+        self.h = max(h_usul, h * faktor) if terpotong else h * faktor
+
+        self._t_lama, self._y_lama, self._h_lama, self._K = self.t, self.y, h, K
+        self.t = t_batas if terpotong else self.t + h
+        self.y = y_baru
+        self._k0 = K[6]
+        self.n_langkah += 1
+
+    def nilai(self, t):
+        """Dense output: y(t) untuk t di dalam langkah terakhir [t_lama, t]."""
+        if self._K is None or t == self.t:
+            return self.y.copy()
+        s = (t - self._t_lama) / self._h_lama
+        return self._y_lama + self._h_lama * (self._K.T @ (P @ [s, s * s, s ** 3, s ** 4]))
+
+    def maju_ke(self, t, tepat=False):
+        """
+        Integrasi sampai waktu t dan kembalikan y(t).
+        tepat=False : boleh melangkah melewati t, y(t) dari dense output (paling hemat).
+        tepat=True  : langkah terakhir dipotong supaya berhenti persis di t
+                      (perlu kalau f akan diganti, misal input kontrol zero-order hold).
+        """
+        if tepat:
+            while self.t < t:
+                self.langkah(t_batas=t)
+            return self.y.copy()
+        while self.t < t:
+            self.langkah()
+        if t < self._t_lama:
+            raise ValueError("t sudah lewat dari langkah terakhir, tidak bisa mundur")
+        return self.nilai(t)
+
+    def ganti_rhs(self, f, t=None):
+        """
+        Ganti f (misal torsi kontrol baru) mulai waktu t (default: waktu internal sekarang).
+        Kalau stepper sudah melangkah melewati t, keadaannya dimundurkan ke y(t) dari
+        dense output, jadi tidak perlu maju_ke(..., tepat=True) sebelumnya.
+        """
+        if t is not None and t != self.t:
+            if not self._t_lama <= t <= self.t:
+                raise ValueError("t harus di dalam langkah terakhir")
+            self.y = self.nilai(t)
+            self.t = float(t)
+            self._t_lama, self._y_lama, self._h_lama, self._K = self.t, self.y.copy(), 0.0, None
+        self.f = f
+        self._k0 = self._f(self.t, self.y)
+
+
+def dopri45(f, t_span, y0, t_eval=None, rtol=1e-6, atol=1e-9, h_maks=np.inf):
+    """
+    Integrasi f dari t_span[0] ke t_span[1]. Kalau t_eval diberikan, hasil di titik-titik
+    itu diambil dari dense output; kalau tidak, hasilnya di setiap titik langkah.
+    """
+    t0, t1 = t_span
+    ode = DormandPrince(f, t0, y0, rtol=rtol, atol=atol, h_maks=h_maks)
+    if t_eval is None:
+        ts, ys = [ode.t], [ode.y.copy()]
+        while ode.t < t1:
+            ode.langkah(t_batas=t1)
+            ts.append(ode.t)
+            ys.append(ode.y.copy())
+    else:
+        ts = np.asarray(t_eval, dtype=float)
+        ys = []
+        for t in ts:
+            while ode.t < t:
+                ode.langkah(t_batas=t1)   # jangan melangkah melewati ujung t_span
+            ys.append(ode.nilai(t))
+    return HasilODE(np.asarray(ts), np.array(ys), ode.n_langkah, ode.n_tolak, ode.n_eval)
+
+
+def rk4_tetap(f, t_span, y0, dt):
+    """RK4 langkah tetap (seperti rk4_step_manual di newone.py), untuk pembanding."""
+    t0, t1 = t_span
+    n = int(round((t1 - t0) / dt))
+    y = np.array(y0, dtype=float)
+    t = t0
+    for _ in range(n):
+        k1 = f(t, y)
+        k2 = f(t + 0.5 * dt, y + 0.5 * dt * k1)
+        k3 = f(t + 0.5 * dt, y + 0.5 * dt * k2)
+        k4 = f(t + dt, y + dt * k3)
+        y = y + (dt / 6.0) * (k1 + 2 * k2 + 2 * k3 + k4)
+        t += dt
+    return y, 4 * n
+
+
+def main(argv=None):
+    """Bandingkan RK4 langkah tetap vs RK45 adaptif pada pendulum fisik newone.py (tanpa gesekan)."""
+    m, l, g, b = 1.0, 1.0, 9.81, 0.0
+    J = 0.25 * m * l**2 + (1.0 / 12.0) * m * l**2
+
+    def f(t, y):
+        return np.array([y[1], (-m * g * (l / 2.0) * math.sin(y[0]) - b * y[1]) / J])
+
+    t_span = (0.0, 20.0)
+    y0 = [math.radians(170), 0.0]
+    acuan = dopri45(f, t_span, y0, rtol=1e-12, atol=1e-14).y[-1]
+
+    print(f"{'metode':<24} {'eval f':>8} {'error theta akhir':>18}")
+    for dt in (0.1, 0.05, 0.01, 0.005):
+        y, n_eval = rk4_tetap(f, t_span, y0, dt)
+        print(f"{f'RK4 dt={dt}':<24} {n_eval:8d} {abs(y[0] - acuan[0]):18.3e}")
+    for rtol in (1e-4, 1e-6, 1e-8):
+        h = dopri45(f, t_span, y0, rtol=rtol, atol=rtol * 1e-3)
+        print(f"{f'RK45 rtol={rtol:g}':<24} {h.n_eval:8d} {abs(h.y[-1, 0] - acuan[0]):18.3e}"
+              f"   ({h.n_langkah} langkah, {h.n_tolak} ditolak)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+"""
+Kernel loop numerik yang di-compile dengan numba kalau tersedia.
+
+Loop Python skalar yang memang dipanggil berulang saat skrip berjalan ditulis ulang
+di sini dalam bentuk yang bisa di-compile numba (array NumPy + loop biasa):
+
+    percepatan_jit / rk4_langkah_jit     <- newone.py (hitung_percepatan_manual, rk4_step_manual),
+                                            dipakai newone.rk4_step() kalau ADA_NUMBA
+    rk4_lintasan_jit                     <- newone.py, banyak langkah sekaligus
+    logika_segitiga_jit / mikir_pakai_fuzzy_jit <- metnum/kendali_fuzzy.py,
+                                            dipakai fuzzy.buat_otak() kalau ADA_NUMBA
+
+Tidak ada kernel untuk poly_regression / remove_baseline (tempCodeRunnerFile.py):
+main() di sana sudah memakai metnum.baseline.remove_baseline_fast (konvolusi, hampir
+linear), yang lebih cepat daripada fit ulang per sampel walaupun di-compile. Loop Euler
+finalprojectsms3.py juga tidak: satu langkah per frame dengan gaya PID yang berubah,
+jadi tidak ada loop panjang yang bisa dipindah ke kernel.
+
+Urutan operasinya sama dengan kode aslinya. Kalau numba tidak terpasang,
+decorator njit tidak melakukan apa-apa dan skrip memakai fungsi aslinya (ADA_NUMBA = False).
+
+Benchmark (waktu fungsi asli di skrip vs kernel, dan selisih hasilnya):
+    python -m metnum.jit_kernels
+"""
+
+import math
+import sys
+import time
+
+import numpy as np
+
+try:
+    from numba import njit
+    ADA_NUMBA = True
+except ImportError:
+    ADA_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Pengganti njit tanpa numba: kembalikan fungsinya apa adanya."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda f: f
+
+
+# ==========================================
+# Pendulum fisik RK4 (newone.py)
+# ==========================================
+
+@njit(cache=True)
+def percepatan_jit(theta_in, omega_in, m, l, g, b, I_cm, gesek):
+    """hitung_percepatan_manual dengan parameter eksplisit (gesek = use_friction.get())."""
+    J = (0.25 * m * (l**2)) + I_cm
+    torsi_gravitasi = -m * g * (l / 2.0) * math.sin(theta_in)
+    torsi_gesek = 0.0
+    if gesek:
+        torsi_gesek = -b * omega_in
+    total_torsi = torsi_gravitasi + torsi_gesek
+    return total_torsi / J
+
+
+@njit(cache=True)
+def rk4_langkah_jit(th, om, h, m, l, g, b, I_cm, gesek):
+    """Satu langkah rk4_step_manual; mengembalikan (theta, omega) baru."""
+    k1_omega = percepatan_jit(th, om, m, l, g, b, I_cm, gesek)
+    k1_theta = om
+
+    th_k2 = th + (0.5 * h * k1_theta)
+    om_k2 = om + (0.5 * h * k1_omega)
+    k2_omega = percepatan_jit(th_k2, om_k2, m, l, g, b, I_cm, gesek)
+    k2_theta = om_k2
+
+    th_k3 = th + (0.5 * h * k2_theta)
+    om_k3 = om + (0.5 * h * k2_omega)
+    k3_omega = percepatan_jit(th_k3, om_k3, m, l, g, b, I_cm, gesek)
+    k3_theta = om_k3
+
+    th_k4 = th + (h * k3_theta)
+    om_k4 = om + (h * k3_omega)
+    k4_omega = percepatan_jit(th_k4, om_k4, m, l, g, b, I_cm, gesek)
+    k4_theta = om_k4
+
+    theta = th + (h / 6.0) * (k1_theta + 2 * k2_theta + 2 * k3_theta + k4_theta)
+    omega = om + (h / 6.0) * (k1_omega + 2 * k2_omega + 2 * k3_omega + k4_omega)
+    return theta, omega
+
+
+@njit(cache=True)
+def rk4_lintasan_jit(theta, omega, h, n, m, l, g, b, I_cm, gesek):
+    """n langkah RK4 sekaligus; mengembalikan array theta dan omega (n+1,)."""
+    th = np.empty(n + 1)
+    om = np.empty(n + 1)
+    th[0] = theta
+    om[0] = omega
+    for i in range(n):
+        th[i + 1], om[i + 1] = rk4_langkah_jit(th[i], om[i], h, m, l, g, b, I_cm, gesek)
+    return th, om
+
+
+# ==========================================
+# Fuzzy (metnum/kendali_fuzzy.py)
+# ==========================================
+
+@njit(cache=True)
+def logika_segitiga_jit(nilai, kiri, tengah, kanan):
+    if nilai <= kiri or nilai >= kanan:
+        return 0.0
+    elif nilai <= tengah:
+        return (nilai - kiri) / (tengah - kiri)
+    else:
+        return (kanan - nilai) / (kanan - tengah)
+
+
+@njit(cache=True)
+def mikir_pakai_fuzzy_jit(sudut_derajat, kecepatan_jatuh, batas_miring, batas_jatuh, kekuatan):
+    n_sudut = min(max(sudut_derajat / batas_miring, -1.0), 1.0)
+    n_kecepatan = min(max(kecepatan_jatuh / batas_jatuh, -1.0), 1.0)
+
+    sudut_NB = logika_segitiga_jit(n_sudut, -1.5, -1.0, -0.5)
+    sudut_NS = logika_segitiga_jit(n_sudut, -1.0, -0.5, 0.0)
+    sudut_Z = logika_segitiga_jit(n_sudut, -0.5, 0.0, 0.5)
+    sudut_PS = logika_segitiga_jit(n_sudut, 0.0, 0.5, 1.0)
+    sudut_PB = logika_segitiga_jit(n_sudut, 0.5, 1.0, 1.5)
+
+    kecepatan_Z = logika_segitiga_jit(n_kecepatan, -0.5, 0.0, 0.5)
+    kecepatan_PB = logika_segitiga_jit(n_kecepatan, 0.5, 1.0, 1.5)
+    kecepatan_NB = logika_segitiga_jit(n_kecepatan, -1.5, -1.0, -0.5)
+    kecepatan_PS = logika_segitiga_jit(n_kecepatan, 0.0, 0.5, 1.0)
+    kecepatan_NS = logika_segitiga_jit(n_kecepatan, -1.0, -0.5, 0.0)
+
+    keputusan_PB = max(min(sudut_PB, kecepatan_Z), min(sudut_PS, kecepatan_PB))
+    keputusan_PS = max(min(sudut_PS, kecepatan_Z), min(sudut_Z, kecepatan_PS))
+    keputusan_Z = min(sudut_Z, kecepatan_Z)
+    keputusan_NS = max(min(sudut_NS, kecepatan_Z), min(sudut_Z, kecepatan_NS))
+    keputusan_NB = max(min(sudut_NB, kecepatan_Z), min(sudut_NS, kecepatan_NB))
+
+    total_bobot = keputusan_NB + keputusan_NS + keputusan_Z + keputusan_PS + keputusan_PB
+    if total_bobot == 0:
+        return 0.0
+
+    hasil_atas = (keputusan_NB * -kekuatan) + \
+                 (keputusan_NS * -kekuatan * 0.5) + \
+                 (keputusan_Z * 0) + \
+                 (keputusan_PS * kekuatan * 0.5) + \
+                 (keputusan_PB * kekuatan)
+    return hasil_atas / total_bobot
+
+
+@njit(cache=True)
+def fuzzy_grid_jit(sudut, kecepatan, batas_miring, batas_jatuh, kekuatan):
+    """mikir_pakai_fuzzy_jit untuk banyak titik (loop di dalam kernel)."""
+    hasil = np.empty(len(sudut))
+    for i in range(len(sudut)):
+        hasil[i] = mikir_pakai_fuzzy_jit(sudut[i], kecepatan[i], batas_miring, batas_jatuh, kekuatan)
+    return hasil
+
+
+# ==========================================
+# Benchmark
+# ==========================================
+
+def _rk4_newone(theta, omega, h, n):
+    """Referensi: n kali newone.rk4_step_manual (Python murni), lintasan (n+1,)."""
+    import newone
+
+    newone.theta, newone.omega, newone.t, newone.dt = theta, omega, 0.0, h
+    th = np.empty(n + 1)
+    om = np.empty(n + 1)
+    th[0], om[0] = theta, omega
+    for i in range(n):
+        newone.rk4_step_manual()
+        th[i + 1], om[i + 1] = newone.theta, newone.omega
+    return th, om
+
+
+def _fuzzy_asli(sudut, kecepatan):
+    """Referensi: kendali_fuzzy.mikir_pakai_fuzzy (Python murni) per titik."""
+    from metnum.kendali_fuzzy import mikir_pakai_fuzzy
+
+    return np.array([mikir_pakai_fuzzy(s, v) for s, v in zip(sudut.tolist(), kecepatan.tolist())])
+
+
+def _waktu(f, *args, ulang=3):
+    terbaik = np.inf
+    for _ in range(ulang):
+        t0 = time.perf_counter()
+        hasil = f(*args)
+        terbaik = min(terbaik, time.perf_counter() - t0)
+    return terbaik, hasil
+
+
+def _selisih(a, b):
+    if isinstance(a, tuple):
+        return max(_selisih(x, y) for x, y in zip(a, b))
+    return float(np.max(np.abs(np.asarray(a, dtype=float) - np.asarray(b, dtype=float))))
+
+
+def main(argv=None):
+    from metnum.integrator import rk4_tetap
+    from metnum.kendali_fuzzy import BATAS_JATUH, BATAS_MIRING_DERAJAT, KEKUATAN_MESIN
+
+    rng = np.random.default_rng(0)
+    sudut = rng.uniform(-40, 40, 20000)
+    kec = rng.uniform(-3, 3, 20000)
+
+    # (nama, fungsi asli di skrip, args-nya, kernel, args kernel)
+    rk4_awal = (math.radians(170), 0.0, 0.001, 20000)
+    kasus = [
+        ("rk4 newone (20000 langkah)", _rk4_newone, rk4_awal,
+         rk4_lintasan_jit, rk4_awal + (1.0, 1.0, 9.81, 0.5, 1.0 / 12.0, True)),
+        ("fuzzy mikir_pakai_fuzzy (20000 titik)", _fuzzy_asli, (sudut, kec),
+         fuzzy_grid_jit, (sudut, kec, BATAS_MIRING_DERAJAT, BATAS_JATUH, KEKUATAN_MESIN)),
+    ]
+    print(f"numba: {'ada' if ADA_NUMBA else 'TIDAK ADA (kernel jalan sebagai Python)'}")
+    print(f"{'kernel':<38} {'asli (s)':>11} {'jit (s)':>10} {'speedup':>8} {'selisih':>10}")
+    for nama, asli, args_asli, f, args in kasus:
+        if ADA_NUMBA:
+            f(*args)   # compile dulu, tidak ikut diukur
+        t_py, h_py = _waktu(asli, *args_asli, ulang=1)
+        t_jit, h_jit = _waktu(f, *args)
+        print(f"{nama:<38} {t_py:11.4f} {t_jit:10.4f} {t_py / t_jit:7.1f}x {_selisih(h_py, h_jit):10.2e}")
+
+    # cek silang dengan integrator umum di repo
+    J = 0.25 + 1.0 / 12.0
+    def f(_, y):
+        return np.array([y[1], (-9.81 * 0.5 * math.sin(y[0]) - 0.5 * y[1]) / J])
+    y_ref, _ = rk4_tetap(f, (0.0, 20.0), [math.radians(170), 0.0], 0.001)
+    th, om = rk4_lintasan_jit(*kasus[0][4])
+    print(f"cek silang rk4 vs integrator.rk4_tetap : {_selisih((th[-1], om[-1]), tuple(y_ref)):.2e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
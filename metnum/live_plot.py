@@ -0,0 +1,53 @@
+"""
+Helper grafik live matplotlib dengan riwayat berkapasitas tetap.
+
+Animasi di fuzzy.py dan finalprojectsms3.py menyimpan riwayat di list yang terus
+tumbuh (atau dipotong dengan pop(0)) dan menggeser xlim tiap frame, sehingga
+seluruh figure harus digambar ulang (tidak bisa blit). Di sini:
+
+- data disimpan di RingBuffer (kapasitas tetap), jadi set_data per frame
+  biayanya konstan berapapun lama sesi berjalan;
+- sumbu x dibuat RELATIF terhadap sampel terbaru (x - x_terbaru, di [-jendela, 0]),
+  jadi xlim tidak pernah berubah dan FuncAnimation(blit=True) cukup menggambar
+  ulang garisnya saja.
+
+Contoh:
+    live = PlotLive(garis, jendela=10.0, kapasitas=500)   # 10 detik terakhir
+    ...
+    live.tambah(t, sudut)
+    return live.perbarui(), ...
+"""
+
+import numpy as np
+
+from metnum.ringbuffer import RingBuffer
+
+
+class PlotLive:
+    """Satu Line2D yang menampilkan `kapasitas` sampel terakhir dalam jendela x yang menggulung."""
+
+    def __init__(self, garis, kapasitas, jendela=None):
+        self.garis = garis
+        self.jendela = jendela
+        self.buffer = RingBuffer(kapasitas, 2)
+        if jendela is not None:
+            # xlim tetap: kalau berubah tiap frame, blit tidak berlaku
+            garis.axes.set_xlim(-jendela, 0)
+
+    def tambah(self, x, y):
+        self.buffer.append((x, y))
+
+    def clear(self):
+        self.buffer.clear()
+
+    def perbarui(self):
+        """Pasang data buffer ke garis dan kembalikan artist-nya (untuk list blit)."""
+        data = self.buffer.data()
+        if len(data) == 0:
+            self.garis.set_data([], [])
+            return self.garis
+        x = np.array(data[:, 0])
+        if self.jendela is not None:
+            x -= x[-1]
+        self.garis.set_data(x, np.array(data[:, 1]))
+        return self.garis
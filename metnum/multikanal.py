@@ -0,0 +1,90 @@
+"""
+Pemrosesan multikanal abdomen1/2/3: kanal-kanal dengan sumbu waktu yang sama
+dimuat sebagai satu matriks Y (n_kanal, n_sampel).
+
+- detrend global : poly_detrend(t, Y, orde), satu QR basis Vandermonde untuk
+                   semua kanal (least squares multi-RHS)
+- per segmen     : segment_fits(Y, ...), satu R per (window, orde) dan satu solve
+                   untuk semua kanal x semua segmen
+
+Biaya K kanal jadi hampir sama dengan satu kanal (faktorisasi tidak diulang per kanal).
+
+Contoh:
+    python -m metnum.multikanal abdomen1.txt abdomen2.txt abdomen3.txt --order 5 \\
+        --window 900 --stride 100 --out hasil_multikanal
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+
+import numpy as np
+
+from metnum.detrend import poly_detrend
+from metnum.ecg_store import load_segment, nama_rekaman
+from metnum.segment_sweep import _kolom, segment_fits
+
+
+def load_kanal(paths, start=None, end=None):
+    """
+    Muat beberapa rekaman jadi (t, Y) dengan Y (n_kanal, n_sampel) float64.
+    t diambil dari kanal pertama; semua kanal harus sama panjang.
+    """
+    t = None
+    kanal = []
+    for path in paths:
+        tk, yk = load_segment(path, start, end)
+        if t is None:
+            t = np.array(tk)
+        elif len(yk) != len(t):
+            raise ValueError(f"{path}: {len(yk)} sampel, kanal pertama {len(t)} sampel")
+        kanal.append(yk)
+    return t, np.array(kanal, dtype=np.float64)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Detrend global dan per segmen untuk beberapa kanal sekaligus")
+    ap.add_argument("files", nargs="+", help="rekaman dengan sumbu waktu yang sama (abdomen1/2/3)")
+    ap.add_argument("--order", type=int, default=5)
+    ap.add_argument("--start", type=int, default=None)
+    ap.add_argument("--end", type=int, default=None)
+    ap.add_argument("--window", type=int, default=None, help="panjang segmen (tanpa ini hanya detrend global)")
+    ap.add_argument("--stride", type=int, default=100)
+    ap.add_argument("--out", default="hasil_multikanal")
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    nama = [nama_rekaman(p) for p in args.files]
+    t, Y = load_kanal(args.files, args.start, args.end)
+
+    t0 = time.perf_counter()
+    hasil = poly_detrend(t, Y, args.order)
+    print(f"detrend global {Y.shape[0]} kanal x {Y.shape[1]} sampel, orde {args.order}: "
+          f"{(time.perf_counter() - t0) * 1e3:.1f} ms")
+    for k, n in enumerate(nama):
+        print(f"  {n:<12} r2 = {hasil.r2[k]:.6f}")
+
+    kolom = ["t"] + [f"y_{n}" for n in nama] + [f"baseline_{n}" for n in nama] + [f"detrended_{n}" for n in nama]
+    np.savetxt(os.path.join(args.out, "detrend_multikanal.csv"),
+               np.column_stack([t, Y.T, hasil.baseline.T, hasil.y_detrended.T]),
+               delimiter=",", header=",".join(kolom), comments="")
+
+    if args.window:
+        # indeks segmen relatif ke Y; segmen pertama mulai di sampel 1 seperti segment_polyfit_results.csv
+        starts, r2, coeffs = segment_fits(Y, args.window, args.stride, args.order)
+        print(f"{len(starts)} segmen x {Y.shape[0]} kanal -> {args.out}")
+        for k, n in enumerate(nama):
+            path = os.path.join(args.out, f"{n}_order{args.order}_segment_polyfit_results.csv")
+            with open(path, "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(_kolom(args.order))
+                for s, r, c in zip(starts, r2[k], coeffs[k]):
+                    w.writerow([int(s), int(s) + args.window - 1, args.window, args.order, float(r)]
+                               + [float(v) for v in c])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
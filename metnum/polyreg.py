@@ -0,0 +1,191 @@
+"""
+Regresi polinomial versi NumPy (pengganti poly_regression / poly_eval di
+tempCodeRunnerFile.py dengan signature yang sama).
+
+- Matriks Vandermonde dibangun sekaligus dengan NumPy, bukan loop xi**k.
+- Sistem diselesaikan dengan QR (tanpa persamaan normal), jadi tidak ada
+  masalah pivot nol / pivot kecil seperti eliminasi Gauss tanpa pivoting.
+- x di-center dan di-scale ke [-1, 1] sebelum fit, sehingga fit orde 15
+  (code2.py) tetap well-conditioned.
+- Evaluasi pakai metode Horner untuk seluruh array sekaligus.
+- yv boleh 2-D (n_sampel, n_sinyal): semua sinyal difit dengan satu faktorisasi.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# Hasil fit dalam koordinat ter-skala: u = (x - center) / scale
+PolyFit = namedtuple("PolyFit", ["coeff", "center", "scale"])
+
+
+def _scaling(xv):
+    x_min = np.min(xv)
+    x_max = np.max(xv)
+    center = 0.5 * (x_min + x_max)
+    scale = 0.5 * (x_max - x_min)
+    if scale == 0:
+        scale = 1.0
+    return center, scale
+
+
+def vandermonde(u, degree):
+    """Matriks [1, u, u^2, ..., u^degree] (pangkat naik), dibangun dengan cumprod."""
+    u = np.asarray(u, dtype=float)
+    V = np.empty((len(u), degree + 1))
+    V[:, 0] = 1.0
+    if degree > 0:
+        V[:, 1:] = u[:, None]
+        np.cumprod(V[:, 1:], axis=1, out=V[:, 1:])
+    return V
+
+
+def lstsq_qr(V, y):
+    """Least squares min ||V c - y|| lewat faktorisasi QR (y boleh 1-D atau 2-D)."""
+    Q, R = np.linalg.qr(V)
+    return np.linalg.solve(R, Q.T @ y)
+
+
+def poly_fit(xv, yv, degree):
+    """
+    Fit polinomial dalam koordinat ter-skala.
+    Koefisien (pangkat naik) berlaku untuk u = (x - center) / scale.
+    """
+    xv = np.asarray(xv, dtype=float)
+    yv = np.asarray(yv, dtype=float)
+    center, scale = _scaling(xv)
+    V = vandermonde((xv - center) / scale, degree)
+    coeff = lstsq_qr(V, yv)
+    return PolyFit(coeff, center, scale)
+
+
+def unscale_coeff(coeff, center, scale):
+    """
+    Ubah koefisien untuk u = (x - center) / scale menjadi koefisien untuk x mentah.
+    Hati-hati: untuk orde tinggi hasilnya bisa sangat besar/kecil (ill-conditioned),
+    jadi evaluasi sebaiknya tetap pakai koordinat ter-skala.
+    """
+    coeff = np.asarray(coeff, dtype=float)
+    n = coeff.shape[0]
+    # (x - c)^k dalam pangkat x, dibangun berulang: p_{k+1} = p_k * (x - c)
+    T = np.zeros((n, n))
+    p = np.zeros(n)
+    p[0] = 1.0
+    for k in range(n):
+        T[:, k] = p / scale**k
+        p = np.roll(p, 1) - center * p
+    return T @ coeff
+
+
+def poly_regression(xv, yv, degree):
+    """
+    Regresi polinomial least squares. Signature sama dengan versi manual:
+    mengembalikan koefisien [c0, c1, ..., c_degree] untuk x mentah.
+    """
+    fit = poly_fit(xv, yv, degree)
+    return unscale_coeff(fit.coeff, fit.center, fit.scale)
+
+
+def poly_eval(coeff, x, center=0.0, scale=1.0):
+    """
+    Evaluasi polinomial (koefisien pangkat naik) dengan metode Horner.
+    x boleh skalar atau array. Kalau coeff 2-D (n_koef, n_sinyal), hasilnya
+    (len(x), n_sinyal). center/scale dipakai untuk koefisien dari poly_fit.
+    """
+    coeff = np.asarray(coeff, dtype=float)
+    u = (np.asarray(x, dtype=float) - center) / scale
+    if coeff.ndim > 1:
+        u = u[..., None]
+    y = np.zeros(np.broadcast_shapes(np.shape(u), coeff.shape[1:]))
+    for c in coeff[::-1]:
+        y = y * u + c
+    return y
+
+
+def fit_eval(fit, x):
+    """Evaluasi hasil poly_fit di x."""
+    return poly_eval(fit.coeff, x, fit.center, fit.scale)
+
+
+def to_polyfit_order(fit):
+    """Koefisien x mentah dengan urutan np.polyfit (pangkat tertinggi dulu)."""
+    return unscale_coeff(fit.coeff, fit.center, fit.scale)[::-1]
+
+
+# Hasil pemilihan orde: orde terpilih, fit-nya, dan skor untuk orde 0..max_order
+OrderSelection = namedtuple("OrderSelection", ["order", "fit", "scores", "criterion"])
+
+
+def _skor_qr(Q, R, yv, max_order):
+    """SSE dan koefisien untuk semua orde 0..max_order dari SATU faktorisasi QR."""
+    z = Q.T @ yv
+    # SSE orde penuh dari residu langsung, orde lebih rendah = + sum z_j^2 dari ekor;
+    # ||y||^2 - cumsum(z^2) kehilangan digit kalau y punya offset besar
+    r = yv - Q @ z
+    ekor = np.concatenate([np.cumsum((z * z)[::-1])[::-1][1:], [0.0]])
+    sse = np.dot(r, r) + ekor
+    coeffs = [np.linalg.solve(R[:k + 1, :k + 1], z[:k + 1]) for k in range(max_order + 1)]
+    return sse, coeffs
+
+
+def pilih_dari_sse(sse, N, St, criterion="bic", r2_tol=1e-3):
+    """
+    Orde terpilih dan skor semua orde dari SSE orde 0..max_order (tanpa data mentah,
+    jadi bisa dipakai juga oleh fit streaming). St = total variasi, untuk "r2".
+    """
+    p = np.arange(1, len(sse) + 1)
+    if criterion == "aic":
+        scores = N * np.log(np.maximum(sse, 1e-300) / N) + 2 * p
+        order = int(np.argmin(scores))
+    elif criterion == "bic":
+        scores = N * np.log(np.maximum(sse, 1e-300) / N) + p * np.log(N)
+        order = int(np.argmin(scores))
+    elif criterion == "r2":
+        scores = 1 - sse / St
+        order = int(np.flatnonzero(scores >= scores.max() - r2_tol)[0])
+    else:
+        raise ValueError("criterion harus 'aic', 'bic', atau 'r2'")
+    return order, scores
+
+
+def select_order(xv, yv, max_order, criterion="bic", folds=5, r2_tol=1e-3):
+    """
+    Pilih orde polinomial 0..max_order dalam satu kali jalan.
+
+    Kolom Vandermonde bersarang (orde k = k+1 kolom pertama), jadi QR dari matriks
+    orde max_order sudah memuat fit semua orde yang lebih rendah:
+    SSE_k = SSE_max + sum_{j>k} (Q^T y)_j^2.
+
+    criterion:
+      "aic" / "bic" : minimum N ln(SSE/N) + penalti jumlah koefisien
+      "r2"          : orde terkecil yang r^2-nya dalam r2_tol dari r^2 terbaik
+      "cv"          : k-fold cross-validation (fold selang-seling), satu QR per fold
+    """
+    xv = np.asarray(xv, dtype=float)
+    yv = np.asarray(yv, dtype=float)
+    N = len(xv)
+    center, scale = _scaling(xv)
+    V = vandermonde((xv - center) / scale, max_order)
+    Q, R = np.linalg.qr(V)
+    sse, coeffs = _skor_qr(Q, R, yv, max_order)
+
+    if criterion in ("aic", "bic", "r2"):
+        St = np.sum((yv - np.mean(yv)) ** 2)
+        order, scores = pilih_dari_sse(sse, N, St, criterion, r2_tol)
+    elif criterion == "cv":
+        fold = np.arange(N) % folds
+        mse = np.zeros(max_order + 1)
+        for f in range(folds):
+            latih = fold != f
+            Qf, Rf = np.linalg.qr(V[latih])
+            _, cf = _skor_qr(Qf, Rf, yv[latih], max_order)
+            uji = V[~latih]
+            for k in range(max_order + 1):
+                err = yv[~latih] - uji[:, :k + 1] @ cf[k]
+                mse[k] += np.sum(err * err)
+        scores = mse / N
+        order = int(np.argmin(scores))
+    else:
+        raise ValueError("criterion harus 'aic', 'bic', 'r2', atau 'cv'")
+
+    return OrderSelection(order, PolyFit(coeffs[order], center, scale), scores, criterion)
@@ -0,0 +1,334 @@
+"""
+Deteksi R-peak ala Pan-Tompkins yang berjalan sampel-per-sampel (real-time).
+
+Input: sinyal yang SUDAH dibandpass 8-20 Hz (output filter_signal / StreamingFIR
+dari metnum.qrs_filter). Tahapan per sampel, semuanya O(1):
+    turunan 5 titik -> kuadrat -> moving-window integration (150 ms)
+    -> deteksi puncak MWI + threshold adaptif (SPKI/NPKI di MWI, SPKF/NPKF di sinyal filter)
+    -> search-back kalau ada beat yang terlewat, tolak T-wave lewat kemiringan.
+Posisi R diambil dari |sinyal filter| maksimum di jendela MWI terakhir
+(deque monoton, amortized O(1)).
+
+Contoh:
+    python -m metnum.qrs_detect "Person_*.txt"
+    python -m metnum.qrs_detect Person_00.txt --benchmark
+"""
+
+import argparse
+import glob
+import sys
+import time
+from collections import deque, namedtuple
+
+import numpy as np
+
+HasilDeteksi = namedtuple("HasilDeteksi", ["peaks", "rr", "hr"])
+
+
+class _MaxDeque:
+    """Maksimum bergeser (sliding window max) dengan deque monoton."""
+
+    def __init__(self, lebar):
+        self.lebar = lebar
+        self.q = deque()   # (indeks, nilai), nilai menurun
+
+    def push(self, i, v):
+        q = self.q
+        while q and q[-1][1] <= v:
+            q.pop()
+        q.append((i, v))
+        if q[0][0] <= i - self.lebar:
+            q.popleft()
+
+    def argmax(self):
+        return self.q[0]
+
+
+class PanTompkins:
+    """
+    Detektor QRS streaming. Panggil update(x) untuk setiap sampel filter;
+    hasilnya indeks R-peak (int) kalau ada beat yang baru dipastikan, selain itu None.
+    Laporan beat terlambat sekitar 200 ms + satu jendela MWI dari posisi R sebenarnya.
+    """
+
+    def __init__(self, fs, learning_s=2.0):
+        self.fs = fs
+        self.n = -1
+        self.w = max(1, int(round(0.150 * fs)))       # lebar moving-window integration
+        self.refractory = int(round(0.200 * fs))
+        self.t_wave_window = int(round(0.360 * fs))
+
+        self._x = [0.0] * 4                             # 4 sampel sebelumnya (untuk turunan)
+        self._buf = [0.0] * self.w                      # ring buffer kuadrat turunan
+        self._k = 0
+        self._sum = 0.0
+        self._mwi_prev = 0.0
+        self._naik = False
+
+        self._abs_max = _MaxDeque(self.w + 4)           # untuk posisi R
+        self._slope_max = _MaxDeque(self.w + 4)         # untuk cek T-wave
+
+        # threshold adaptif
+        self.n_learn = int(learning_s * fs)
+        self._learn_max = 0.0
+        self._learn_sum = 0.0
+        self.spki = 0.0
+        self.npki = 0.0
+        self.threshold1 = 0.0
+        self._learn_fmax = 0.0
+        self._learn_fsum = 0.0
+        self.spkf = 0.0          # threshold kedua di |sinyal filter| (seperti Pan-Tompkins asli)
+        self.npkf = 0.0
+        self.threshold_f1 = 0.0
+
+        # riwayat beat
+        self.last_peak = None
+        self._last_mwi_idx = None
+        self._last_slope = 0.0
+        self._rr = deque(maxlen=8)
+        self._rr_sum = 0
+        self._kandidat = None     # puncak noise terbesar sejak beat terakhir (untuk search-back)
+        self._pending = None      # puncak MWI yang belum diputuskan
+
+    def prime(self, mwi_max, mwi_mean, f_max, f_mean):
+        """Set threshold awal langsung (melewati fase belajar)."""
+        self.spki = 0.25 * mwi_max
+        self.npki = 0.5 * mwi_mean
+        self.spkf = 0.25 * f_max
+        self.npkf = 0.5 * f_mean
+        self._update_threshold()
+        self.n_learn = 0
+
+    def _update_threshold(self):
+        self.threshold1 = self.npki + 0.25 * (self.spki - self.npki)
+        self.threshold_f1 = self.npkf + 0.25 * (self.spkf - self.npkf)
+
+    def _noise(self, peak, f_peak):
+        self.npki = 0.125 * peak + 0.875 * self.npki
+        self.npkf = 0.125 * f_peak + 0.875 * self.npkf
+        self._update_threshold()
+
+    def _rr_avg(self):
+        return self._rr_sum / len(self._rr) if self._rr else None
+
+    def _terima_beat(self, r_idx, mwi_idx, peak, f_peak, slope, searchback=False):
+        if self.last_peak is not None:
+            rr = r_idx - self.last_peak
+            if len(self._rr) == self._rr.maxlen:
+                self._rr_sum -= self._rr[0]
+            self._rr.append(rr)
+            self._rr_sum += rr
+        self.last_peak = r_idx
+        self._last_mwi_idx = mwi_idx
+        self._last_slope = slope
+        a = 0.25 if searchback else 0.125
+        self.spki = a * peak + (1 - a) * self.spki
+        self.spkf = a * f_peak + (1 - a) * self.spkf
+        self._update_threshold()
+        self._kandidat = None
+        return r_idx
+
+    def _puncak_mwi(self, idx, peak):
+        """
+        Puncak lokal MWI di indeks idx. MWI sering bergelombang di dalam satu QRS,
+        jadi puncak ditahan dulu (pending) dan diganti kalau ada puncak lebih tinggi
+        dalam jendela refractory; baru diklasifikasi setelah jendela itu lewat.
+        """
+        r_idx, f_peak = self._abs_max.argmax()
+        _, slope = self._slope_max.argmax()
+        p = self._pending
+        baru = (idx, peak, r_idx, f_peak, slope)
+        if p is not None and idx - p[0] >= self.refractory:
+            # pending sudah lewat jendelanya: klasifikasi dulu, puncak baru jadi pending
+            hasil = self._klasifikasi(*p)
+            self._pending = baru
+            return hasil
+        if p is None or peak > p[1]:
+            self._pending = baru
+        return None
+
+    def _klasifikasi(self, idx, peak, r_idx, f_peak, slope):
+        """Puncak MWI final: sinyal (beat), T-wave, atau noise."""
+        self._pending = None
+        if self.last_peak is not None and r_idx - self.last_peak < self.refractory:
+            return None
+
+        if peak > self.threshold1 and f_peak > self.threshold_f1:
+            if (self.last_peak is not None and r_idx - self.last_peak < self.t_wave_window
+                    and slope < 0.5 * self._last_slope):
+                # kemiringan kecil dekat beat sebelumnya -> anggap T-wave
+                self._noise(peak, f_peak)
+                return None
+            return self._terima_beat(r_idx, idx, peak, f_peak, slope)
+
+        self._noise(peak, f_peak)
+        if self._kandidat is None or peak > self._kandidat[2]:
+            self._kandidat = (r_idx, idx, peak, f_peak, slope)
+        return None
+
+    def update(self, x):
+        self.n += 1
+        n = self.n
+        x = float(x)
+
+        # 1. turunan 5 titik: (2x[n] + x[n-1] - x[n-3] - 2x[n-4]) * fs / 8
+        x1, x2, x3, x4 = self._x
+        d = (2.0 * x + x1 - x3 - 2.0 * x4) * self.fs * 0.125
+        self._x = [x, x1, x2, x3]
+
+        # 2. kuadrat, 3. moving-window integration (running sum di ring buffer)
+        s = d * d
+        k = self._k
+        self._sum += s - self._buf[k]
+        self._buf[k] = s
+        self._k = k + 1 if k + 1 < self.w else 0
+        mwi = self._sum / self.w
+
+        self._abs_max.push(n, abs(x))
+        self._slope_max.push(n, abs(d))
+
+        # fase belajar: kumpulkan max/mean MWI untuk threshold awal
+        if n < self.n_learn:
+            if mwi > self._learn_max:
+                self._learn_max = mwi
+            if abs(x) > self._learn_fmax:
+                self._learn_fmax = abs(x)
+            self._learn_sum += mwi
+            self._learn_fsum += abs(x)
+            if n == self.n_learn - 1:
+                self.prime(self._learn_max, self._learn_sum / self.n_learn,
+                           self._learn_fmax, self._learn_fsum / self.n_learn)
+            self._mwi_prev = mwi
+            return None
+
+        hasil = None
+        # 4. puncak MWI = titik di mana MWI berhenti naik
+        if mwi < self._mwi_prev and self._naik:
+            hasil = self._puncak_mwi(n - 1, self._mwi_prev)
+        self._naik = mwi > self._mwi_prev
+        self._mwi_prev = mwi
+        if hasil is None and self._pending is not None and n - self._pending[0] >= self.refractory:
+            hasil = self._klasifikasi(*self._pending)
+
+        # 5. search-back: lama tidak ada beat -> ambil kandidat noise terbesar
+        if hasil is None and self._kandidat is not None and self._rr:
+            if n - self.last_peak > 1.66 * self._rr_avg():
+                r_idx, idx, peak, f_peak, slope = self._kandidat
+                if peak > 0.5 * self.threshold1 and f_peak > 0.5 * self.threshold_f1:
+                    hasil = self._terima_beat(r_idx, idx, peak, f_peak, slope, searchback=True)
+                else:
+                    self._kandidat = None
+        return hasil
+
+    def flush(self):
+        """Akhir rekaman: putuskan puncak yang masih pending."""
+        if self._pending is None:
+            return None
+        return self._klasifikasi(*self._pending)
+
+
+def _mwi_awal(sinyal, fs, learning_s):
+    """MWI untuk beberapa detik pertama (vektorisasi), dipakai untuk threshold awal."""
+    w = max(1, int(round(0.150 * fs)))
+    x = np.asarray(sinyal[:int(learning_s * fs)], dtype=float)
+    xp = np.concatenate([np.zeros(4), x])
+    d = (2 * xp[4:] + xp[3:-1] - xp[1:-3] - 2 * xp[:-4]) * fs / 8
+    c = np.concatenate([np.zeros(w), np.cumsum(d * d)])
+    return (c[w:] - c[:-w]) / w, np.abs(x)
+
+
+def detect_r_peaks(filtered, fs, learning_s=2.0):
+    """
+    Jalankan PanTompkins pada seluruh sinyal yang sudah difilter.
+    Threshold awal dihitung dulu dari `learning_s` detik pertama (sejak onset sinyal),
+    supaya beat di awal rekaman juga terdeteksi. rr dalam detik, hr dalam bpm.
+    """
+    det = PanTompkins(fs, learning_s)
+    filtered = np.asarray(filtered, dtype=float)
+    # belajar mulai dari onset sinyal, supaya bagian datar di awal rekaman
+    # tidak membuat threshold awal ~0
+    aktif = np.flatnonzero(np.abs(filtered) > 0.1 * np.max(np.abs(filtered), initial=0.0))
+    onset = max(0, aktif[0] - 4) if len(aktif) else 0
+    mwi, fabs = _mwi_awal(filtered[onset:], fs, learning_s)
+    if len(mwi):
+        det.prime(mwi.max(), mwi.mean(), fabs.max(), fabs.mean())
+
+    update = det.update
+    peaks = [p for p in map(update, filtered.tolist()) if p is not None]
+    terakhir = det.flush()
+    if terakhir is not None:
+        peaks.append(terakhir)
+    peaks = np.array(peaks, dtype=int)
+    rr = np.diff(peaks) / fs
+    return HasilDeteksi(peaks, rr, 60.0 / rr)
+
+
+def sampling_rate(t, default=500.0):
+    """fs dari sumbu waktu; kalau t hanya indeks sampel (langkah 1), pakai default."""
+    if len(t) < 2:
+        return default
+    dt = np.median(np.diff(t))
+    return default if dt <= 0 or dt == 1.0 else 1.0 / dt
+
+
+def benchmark(filtered, fs, ulang=3):
+    """Throughput update() per sampel: (sampel/detik, kali real-time)."""
+    terbaik = float("inf")
+    data = np.asarray(filtered, dtype=float).tolist()
+    for _ in range(ulang):
+        det = PanTompkins(fs)
+        update = det.update
+        t0 = time.perf_counter()
+        for x in data:
+            update(x)
+        terbaik = min(terbaik, time.perf_counter() - t0)
+    per_detik = len(data) / terbaik
+    return per_detik, per_detik / fs
+
+
+def main(argv=None):
+    from metnum.ecg_io import load_ecg
+    from metnum.qrs_filter import design_bandpass, filter_signal
+
+    ap = argparse.ArgumentParser(description="Deteksi R-peak, RR, dan heart rate per rekaman")
+    ap.add_argument("pola", nargs="+", help="glob file, misal 'Person_*.txt'")
+    ap.add_argument("--fs", type=float, default=None, help="default: dari kolom waktu (500 Hz kalau tidak ada)")
+    ap.add_argument("--band", type=float, nargs=2, default=[8.0, 20.0])
+    ap.add_argument("--order", type=int, default=50)
+    ap.add_argument("--out", default=None, help="folder untuk CSV peak per file")
+    ap.add_argument("--benchmark", action="store_true", help="ukur throughput detektor")
+    args = ap.parse_args(argv)
+
+    paths = sorted({p for pola in args.pola for p in glob.glob(pola)})
+    if not paths:
+        ap.error("tidak ada file yang cocok")
+    if args.out:
+        import os
+        os.makedirs(args.out, exist_ok=True)
+
+    for path in paths:
+        t, y = load_ecg(path)
+        fs = args.fs or sampling_rate(t)
+        b = design_bandpass(fs, args.band[0], args.band[1], args.order)
+        filtered = filter_signal(b, y)
+        hasil = detect_r_peaks(filtered, fs)
+
+        hr = np.mean(hasil.hr) if len(hasil.hr) else float("nan")
+        print(f"{path}: {len(hasil.peaks)} beat, HR rata-rata {hr:.1f} bpm")
+
+        if args.out:
+            import os
+            nama = os.path.splitext(os.path.basename(path))[0]
+            rr = np.concatenate([[np.nan], hasil.rr])
+            np.savetxt(os.path.join(args.out, f"{nama}_rpeaks.csv"),
+                       np.column_stack([hasil.peaks, hasil.peaks / fs, rr, 60.0 / rr]),
+                       delimiter=",", header="index,t,rr,hr", comments="", fmt="%.10g")
+
+        if args.benchmark:
+            per_detik, kali = benchmark(filtered, fs)
+            print(f"    throughput {per_detik:,.0f} sampel/s = {kali:,.0f}x real-time @ {fs:g} Hz")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
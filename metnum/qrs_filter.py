@@ -0,0 +1,196 @@
+"""
+Filter bandpass FIR untuk deteksi QRS (inti dari testdps.py), termasuk mode streaming.
+
+Mode streaming membaca sinyal per chunk, membawa state filter (zi) antar chunk,
+dan mengoreksi group delay dengan MEMBUANG M output pertama (bukan np.roll,
+yang membuat ujung sinyal muncul lagi di awal). Memori tetap O(chunk) berapapun
+panjang rekamannya, dan hasilnya sama persis dengan filter_signal() untuk seluruh array.
+
+Contoh:
+    python -m metnum.qrs_filter dataset.txt dataset_qrs.csv --chunk 65536
+"""
+
+import argparse
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+# Mulai jumlah tap ini, konvolusi FFT (overlap-add) lebih cepat dari lfilter direct-form
+# (diukur untuk N = 1e6: lfilter ~ O(N*numtaps), overlap-add ~ O(N*log(numtaps))).
+FFT_MIN_TAPS = 128
+
+
+def _read_only(a):
+    a = np.array(a)
+    a.setflags(write=False)
+    return a
+
+
+@lru_cache(maxsize=256)
+def design_bandpass(fs=500.0, f_low=8.0, f_high=20.0, M=50, window="hamming"):
+    """
+    Koefisien FIR bandpass dengan numtaps = 2M + 1 (sama seperti testdps.py).
+    Hasil di-cache per (fs, band, order, window), jadi sweep cutoff/orde untuk banyak
+    rekaman tidak mendesain ulang filter yang sama. Array yang dikembalikan read-only.
+    """
+    from scipy.signal import firwin
+
+    numtaps = 2 * M + 1
+    return _read_only(firwin(numtaps, cutoff=[f_low, f_high], fs=fs, window=window, pass_zero=False))
+
+
+@lru_cache(maxsize=256)
+def frequency_response(fs=500.0, f_low=8.0, f_high=20.0, M=50, window="hamming", worN=8000):
+    """Respon frekuensi (freq_hz, h) dari design_bandpass, juga di-cache."""
+    from scipy.signal import freqz
+
+    w, h = freqz(design_bandpass(fs, f_low, f_high, M, window), worN=worN)
+    return _read_only(w * fs / (2 * np.pi)), _read_only(h)
+
+
+def choose_method(numtaps, n):
+    """'fft' kalau filternya cukup panjang (dan sinyalnya tidak lebih pendek dari filter)."""
+    return "fft" if numtaps >= FFT_MIN_TAPS and n >= numtaps else "direct"
+
+
+def apply_fir(coefficients, signal, method="auto"):
+    """
+    y = lfilter(b, 1, x), tapi bisa lewat konvolusi overlap-add (FFT).
+    method: "direct", "fft", atau "auto" (pilih yang lebih murah).
+    """
+    signal = np.asarray(signal, dtype=float)
+    if method == "auto":
+        method = choose_method(len(coefficients), len(signal))
+    if method == "fft":
+        from scipy.signal import oaconvolve
+
+        return oaconvolve(signal, coefficients)[:len(signal)]
+    if method == "direct":
+        from scipy.signal import lfilter
+
+        return lfilter(coefficients, 1.0, signal)
+    raise ValueError("method harus 'auto', 'direct', atau 'fft'")
+
+
+def group_delay(coefficients):
+    """Delay FIR fase linear, dalam sampel: (numtaps - 1) / 2."""
+    return int(0.5 * (len(coefficients) - 1))
+
+
+def filter_signal(coefficients, signal, method="auto"):
+    """
+    Filter seluruh array lalu koreksi delay: output ke-n = hasil filter di n + delay.
+    Sisi kanan diisi nol dulu (zero padding), jadi tidak ada sampel yang "melingkar".
+    """
+    signal = np.asarray(signal, dtype=float)
+    delay = group_delay(coefficients)
+    padded = np.concatenate([signal, np.zeros(delay)])
+    return apply_fir(coefficients, padded, method)[delay:]
+
+
+class StreamingFIR:
+    """
+    FIR yang diproses per chunk. Panggil process(chunk) berulang kali,
+    lalu flush() di akhir untuk mengeluarkan `delay` sampel terakhir.
+
+    method="direct" membawa state lfilter (zi) antar chunk; method="fft" memakai
+    overlap-add: ekor konvolusi (numtaps - 1 sampel) dibawa ke chunk berikutnya.
+    "auto" memilih berdasarkan panjang filter.
+    """
+
+    def __init__(self, coefficients, method="auto"):
+        self.b = np.asarray(coefficients, dtype=float)
+        self.delay = group_delay(self.b)
+        if method == "auto":
+            method = "fft" if len(self.b) >= FFT_MIN_TAPS else "direct"
+        if method not in ("direct", "fft"):
+            raise ValueError("method harus 'auto', 'direct', atau 'fft'")
+        self.method = method
+        self.zi = np.zeros(len(self.b) - 1)   # state lfilter / ekor overlap-add
+        self._sisa_buang = self.delay   # output awal yang masih harus dibuang
+
+    def _filter(self, chunk):
+        if self.method == "direct":
+            from scipy.signal import lfilter
+
+            y, self.zi = lfilter(self.b, 1.0, chunk, zi=self.zi)
+            return y
+
+        from scipy.signal import oaconvolve
+
+        n = len(chunk)
+        if n == 0:
+            return chunk
+        full = oaconvolve(chunk, self.b) if n >= len(self.b) else np.convolve(chunk, self.b)
+        full[:len(self.zi)] += self.zi
+        self.zi = full[n:]
+        return full[:n]
+
+    def process(self, chunk):
+        y = self._filter(np.asarray(chunk, dtype=float))
+        if self._sisa_buang:
+            buang = min(self._sisa_buang, len(y))
+            y = y[buang:]
+            self._sisa_buang -= buang
+        return y
+
+    def flush(self):
+        """Dorong nol sebanyak delay supaya sampel terakhir ikut keluar."""
+        return self.process(np.zeros(self.delay))
+
+
+def stream_filter_file(src, dst, coefficients, chunk_size=65536, method="auto"):
+    """
+    Filter file src (format apa saja yang dikenali ecg_io) ke CSV dst "t,y" secara bertahap.
+    Mengembalikan jumlah sampel yang ditulis.
+    """
+    from metnum.ecg_io import iter_chunks
+
+    fir = StreamingFIR(coefficients, method)
+    waktu_antri = np.zeros(0)   # waktu milik sampel yang outputnya belum keluar (<= delay + chunk)
+    n_tulis = 0
+    n_masuk = 0
+
+    def tulis(f, y):
+        nonlocal waktu_antri, n_tulis
+        n = len(y)
+        if n:
+            np.savetxt(f, np.column_stack([waktu_antri[:n], y]), delimiter=",", fmt="%.17g")
+            waktu_antri = waktu_antri[n:]
+            n_tulis += n
+
+    with open(dst, "w") as f:
+        f.write("t,y\n")
+        for chunk in iter_chunks(src, chunk_size):
+            if chunk.shape[1] == 1:
+                t = np.arange(n_masuk, n_masuk + len(chunk), dtype=float)
+                x = chunk[:, 0]
+            else:
+                t, x = chunk[:, 0], chunk[:, 1]
+            n_masuk += len(chunk)
+            waktu_antri = np.concatenate([waktu_antri, t])
+            tulis(f, fir.process(x))
+        tulis(f, fir.flush())
+    return n_tulis
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Bandpass FIR QRS secara streaming (memori konstan)")
+    ap.add_argument("src")
+    ap.add_argument("dst")
+    ap.add_argument("--fs", type=float, default=500.0)
+    ap.add_argument("--band", type=float, nargs=2, default=[8.0, 20.0], metavar=("F_LOW", "F_HIGH"))
+    ap.add_argument("--order", type=int, default=50, help="M, numtaps = 2M + 1")
+    ap.add_argument("--chunk", type=int, default=65536)
+    ap.add_argument("--method", choices=["auto", "direct", "fft"], default="auto")
+    args = ap.parse_args(argv)
+
+    b = design_bandpass(args.fs, args.band[0], args.band[1], args.order)
+    n = stream_filter_file(args.src, args.dst, b, args.chunk, args.method)
+    print(f"{n} sampel ditulis ke {args.dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
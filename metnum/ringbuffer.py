@@ -0,0 +1,136 @@
+"""
+Penyimpanan riwayat untuk grafik live (GUI Tk / matplotlib).
+
+- RingBuffer     : array NumPy berkapasitas tetap, append O(1), data lama tertimpa.
+                   Pengganti list + pop(0) yang O(n) tiap kali penuh.
+- DecimasiMinMax : ringkasan min/max per bin yang di-update per sampel (O(1)).
+                   Kalau bin sudah penuh, pasangan bin digabung (resolusi dibagi 2),
+                   jadi jumlah bin selalu <= kapasitas berapapun panjang simulasinya.
+- minmax_per_kolom : turunkan titik ke lebar layar (piksel), simpan min & max tiap kolom
+                   supaya puncak sinyal tidak hilang saat didecimasi.
+
+Biaya menggambar jadi sebanding dengan lebar layar, bukan panjang riwayat.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Buffer melingkar (kapasitas, n_kolom) float64."""
+
+    def __init__(self, kapasitas, n_kolom=2):
+        self._data = np.zeros((kapasitas, n_kolom))
+        self.kapasitas = kapasitas
+        self._tulis = 0       # posisi tulis berikutnya
+        self._isi = 0
+
+    def __len__(self):
+        return self._isi
+
+    def append(self, baris):
+        self._data[self._tulis] = baris
+        self._tulis = (self._tulis + 1) % self.kapasitas
+        if self._isi < self.kapasitas:
+            self._isi += 1
+
+    def extend(self, baris):
+        baris = np.asarray(baris, dtype=float).reshape(-1, self._data.shape[1])
+        if len(baris) >= self.kapasitas:
+            baris = baris[-self.kapasitas:]
+        n = len(baris)
+        ujung = min(n, self.kapasitas - self._tulis)
+        self._data[self._tulis:self._tulis + ujung] = baris[:ujung]
+        self._data[:n - ujung] = baris[ujung:]
+        self._tulis = (self._tulis + n) % self.kapasitas
+        self._isi = min(self._isi + n, self.kapasitas)
+
+    def clear(self):
+        self._tulis = 0
+        self._isi = 0
+
+    def terakhir(self):
+        """Baris paling baru."""
+        return self._data[self._tulis - 1]
+
+    def data(self):
+        """Isi buffer urut dari yang paling lama (salinan kalau buffer sudah berputar)."""
+        if self._isi < self.kapasitas:
+            return self._data[:self._isi]
+        return np.concatenate([self._data[self._tulis:], self._data[:self._tulis]])
+
+
+class DecimasiMinMax:
+    """
+    Ringkasan (t, y_min, y_max) per bin untuk sinyal yang datang satu per satu.
+    Tiap bin berisi `ukuran` sampel berturut-turut; ukuran digandakan setiap kali
+    jumlah bin mencapai kapasitas. t bin = t sampel pertamanya.
+    """
+
+    def __init__(self, kapasitas=2048):
+        self.kapasitas = kapasitas - kapasitas % 2
+        self._t = np.zeros(self.kapasitas)
+        self._min = np.zeros(self.kapasitas)
+        self._max = np.zeros(self.kapasitas)
+        self.clear()
+
+    def clear(self):
+        self.ukuran = 1
+        self._n_bin = 0
+        self._isi_bin = 0     # jumlah sampel di bin yang sedang diisi
+
+    def __len__(self):
+        return self._n_bin + (self._isi_bin > 0)
+
+    def append(self, t, y):
+        i = self._n_bin
+        if self._isi_bin == 0:
+            self._t[i] = t
+            self._min[i] = y
+            self._max[i] = y
+        else:
+            if y < self._min[i]: self._min[i] = y
+            if y > self._max[i]: self._max[i] = y
+        self._isi_bin += 1
+
+        if self._isi_bin == self.ukuran:
+            self._isi_bin = 0
+            self._n_bin += 1
+            if self._n_bin == self.kapasitas:
+                self._gabung()
+
+    def _gabung(self):
+        """Gabung bin berpasangan: resolusi jadi setengah, kapasitas terisi setengah."""
+        h = self.kapasitas // 2
+        self._t[:h] = self._t[0::2]
+        self._min[:h] = np.minimum(self._min[0::2], self._min[1::2])
+        self._max[:h] = np.maximum(self._max[0::2], self._max[1::2])
+        self._n_bin = h
+        self.ukuran *= 2
+
+    def data(self):
+        """(t, y_min, y_max) semua bin, termasuk bin yang belum penuh."""
+        n = len(self)
+        return self._t[:n], self._min[:n], self._max[:n]
+
+
+def minmax_per_kolom(px, y_min, y_max=None):
+    """
+    Turunkan titik (px urut naik, dalam piksel) ke paling banyak 2 titik per kolom piksel:
+    min dan max y di kolom itu. Mengembalikan (px, py) siap jadi polyline.
+    """
+    px = np.asarray(px, dtype=float)
+    y_min = np.asarray(y_min, dtype=float)
+    y_max = y_min if y_max is None else np.asarray(y_max, dtype=float)
+    if len(px) == 0:
+        return px, y_min
+
+    kolom = np.floor(px)
+    awal = np.concatenate([[0], np.flatnonzero(np.diff(kolom)) + 1])
+    lo = np.minimum.reduceat(y_min, awal)
+    hi = np.maximum.reduceat(y_max, awal)
+
+    x_out = np.repeat(kolom[awal], 2)
+    y_out = np.empty(2 * len(awal))
+    y_out[0::2] = lo
+    y_out[1::2] = hi
+    return x_out, y_out
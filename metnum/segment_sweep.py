@@ -0,0 +1,195 @@
+"""
+Sweep fit polinomial per segmen (windowed polyfit) untuk abdomen*.txt.
+
+Menghasilkan CSV dengan skema yang sama seperti segment_polyfit_results.csv:
+    start,end,window_size,order,r2,c_0,...,c_order
+dengan segmen y[start:end+1], t lokal = 0..window_size-1, dan koefisien
+berurutan seperti np.polyfit (pangkat tertinggi dulu).
+
+Semua jendela berukuran sama punya matriks desain yang sama, jadi:
+- QR dari matriks Vandermonde jendela dihitung SEKALI per (window, order);
+- momen sum u^k * y untuk SEMUA posisi jendela dihitung sekaligus dengan
+  korelasi FFT (bagian yang tumpang tindih antar jendela dipakai bersama);
+- tiap jendela tinggal dua solve segitiga kecil: O(order^2) per jendela,
+  bukan O(window).
+(Jumlah pangkat kumulatif sum t^k y dengan t absolut tidak dipakai karena untuk
+t ~ 20000 dan orde 5 pengurangannya kehilangan lebih dari separuh digit.)
+
+Hasil ditulis bertahap per kombinasi (window, stride); kalau sweep terputus,
+jalankan lagi perintah yang sama dan baris yang sudah ada akan dilewati.
+
+Contoh (membuat ulang segment_polyfit_results.csv):
+    python -m metnum.segment_sweep abdomen1.txt --windows 900 --strides 100 --orders 5 --stop 1800
+Contoh grid:
+    python -m metnum.segment_sweep abdomen1.txt abdomen2.txt abdomen3.txt \\
+        --windows 500 900 2000 --strides 50 100 --orders 3 5 7 --out hasil_segment
+"""
+
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from metnum.polyreg import unscale_coeff, vandermonde
+
+
+def _momen(y, u, order):
+    """
+    M[..., k, s] = sum_j u_j^k * y[..., s + j] untuk semua posisi awal s (korelasi lewat FFT).
+    y boleh 2-D (n_kanal, n_sampel): semua kanal dikorelasikan dalam satu panggilan.
+    """
+    from scipy.signal import fftconvolve
+
+    y = np.atleast_2d(y)
+    W = len(u)
+    M = np.empty((y.shape[0], order + 1, y.shape[1] - W + 1))
+    p = np.ones(W)
+    for k in range(order + 1):
+        M[:, k] = fftconvolve(y, p[None, ::-1], mode="valid", axes=1)
+        p = p * u
+    return M
+
+
+def segment_fits(y, window, stride, order, start=1, stop=None):
+    """
+    Fit semua segmen y[s:s+window] untuk s = start, start+stride, ... (s+window-1 <= stop).
+    Mengembalikan (starts, r2, coeffs) dengan coeffs (n_segmen, order+1) urutan np.polyfit.
+    y boleh 2-D (n_kanal, n_sampel): hasil r2 (n_kanal, n_segmen), coeffs (n_kanal, n_segmen, order+1).
+    Semua kanal dan semua segmen diselesaikan sebagai satu least squares multi-RHS
+    dengan R yang sama, jadi K kanal hampir sama murahnya dengan satu kanal.
+    """
+    y = np.asarray(y, dtype=float)
+    satu_kanal = y.ndim == 1
+    Y = y[None, :] if satu_kanal else y
+    K, N = Y.shape
+    stop = N - 1 if stop is None else min(stop, N - 1)
+
+    starts = np.arange(start, stop - window + 2, stride)
+    if len(starts) == 0:
+        kosong = np.zeros((K, 0))
+        r2 = kosong[0] if satu_kanal else kosong
+        coeffs = np.zeros((0, order + 1)) if satu_kanal else np.zeros((K, 0, order + 1))
+        return starts, r2, coeffs
+
+    # koordinat lokal ter-skala: t = 0..W-1  ->  u di [-1, 1]
+    c = 0.5 * (window - 1)
+    s = c if c > 0 else 1.0
+    u = (np.arange(window) - c) / s
+    _, R = np.linalg.qr(vandermonde(u, order))
+
+    # jumlah y dan y^2 per jendela dari cumsum (untuk St dan Sr)
+    rata = Y.mean(axis=1, keepdims=True)
+    Y = Y - rata   # r2 dan residual tidak berubah oleh offset konstan
+    nol = np.zeros((K, 1))
+    cs1 = np.concatenate([nol, np.cumsum(Y, axis=1)], axis=1)
+    cs2 = np.concatenate([nol, np.cumsum(Y * Y, axis=1)], axis=1)
+
+    n_seg = len(starts)
+    M = _momen(Y[:, :stop + 1], u, order)[:, :, starts]        # (K, order+1, n_segmen)
+    M = M.transpose(1, 0, 2).reshape(order + 1, K * n_seg)      # satu kolom per (kanal, segmen)
+    q = np.linalg.solve(R.T, M)                                 # Q^T y per jendela
+    a = np.linalg.solve(R, q)                                   # koefisien dalam u
+
+    sum_y = cs1[:, starts + window] - cs1[:, starts]
+    sum_y2 = cs2[:, starts + window] - cs2[:, starts]
+    Sr = sum_y2 - np.sum(q * q, axis=0).reshape(K, n_seg)
+    St = sum_y2 - sum_y**2 / window
+    r2 = 1 - Sr / St
+
+    a[0] += np.repeat(rata[:, 0], n_seg)          # kembalikan offset rata-rata yang tadi dikurangi
+    raw = unscale_coeff(a, c, s)                  # pangkat naik, untuk t lokal
+    coeffs = raw[::-1].T.reshape(K, n_seg, order + 1)
+
+    if satu_kanal:
+        return starts, r2[0], coeffs[0]
+    return starts, r2, coeffs
+
+
+def _kolom(order):
+    return ["start", "end", "window_size", "order", "r2"] + [f"c_{k}" for k in range(order + 1)]
+
+
+def _sudah_ada(path):
+    """
+    Kunci (start, end, window_size) yang sudah tertulis di CSV.
+    Baris terakhir yang terpotong (sweep dihentikan saat menulis) dibuang dulu.
+    """
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb+") as f:
+        isi = f.read()
+        if isi and not isi.endswith(b"\n"):
+            f.truncate(isi.rfind(b"\n") + 1)
+    with open(path, newline="") as f:
+        return {(int(b["start"]), int(b["end"]), int(b["window_size"])) for b in csv.DictReader(f)}
+
+
+def sweep_file(path, windows, strides, order, out_path, start=1, stop=None):
+    """Jalankan grid (windows x strides) untuk satu file dan satu orde. Mengembalikan jumlah baris baru."""
+    from metnum.ecg_io import load_ecg
+
+    _, y = load_ecg(path)
+    ada = _sudah_ada(out_path)
+    baru = 0
+    tulis_header = not os.path.exists(out_path) or os.path.getsize(out_path) == 0
+
+    with open(out_path, "a", newline="") as f:
+        w = csv.writer(f)
+        if tulis_header:
+            w.writerow(_kolom(order))
+        for window in windows:
+            for stride in strides:
+                stop_ = len(y) - 1 if stop is None else min(stop, len(y) - 1)
+                calon = np.arange(start, stop_ - window + 2, stride)
+                if all((int(s), int(s) + window - 1, window) in ada for s in calon):
+                    continue
+                starts, r2, coeffs = segment_fits(y, window, stride, order, start, stop)
+                for s, r, c in zip(starts, r2, coeffs):
+                    kunci = (int(s), int(s) + window - 1, window)
+                    if kunci in ada:
+                        continue
+                    w.writerow([kunci[0], kunci[1], window, order, float(r)] + [float(v) for v in c])
+                    ada.add(kunci)
+                    baru += 1
+                f.flush()   # satu kombinasi selesai -> aman kalau terputus setelah ini
+    return baru
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Sweep polyfit per segmen (windowed) dengan skema segment_polyfit_results.csv")
+    ap.add_argument("files", nargs="+")
+    ap.add_argument("--windows", type=int, nargs="+", default=[900])
+    ap.add_argument("--strides", type=int, nargs="+", default=[100])
+    ap.add_argument("--orders", type=int, nargs="+", default=[5])
+    ap.add_argument("--start", type=int, default=1, help="indeks sampel awal segmen pertama")
+    ap.add_argument("--stop", type=int, default=None, help="indeks sampel terakhir (inklusif) yang boleh dipakai")
+    ap.add_argument("--out", default="hasil_segment")
+    ap.add_argument("--workers", type=int, default=None)
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    jobs = []
+    for path in args.files:
+        nama = os.path.splitext(os.path.basename(path))[0]
+        for order in args.orders:
+            out_path = os.path.join(args.out, f"{nama}_order{order}_segment_polyfit_results.csv")
+            jobs.append((path, order, out_path))
+
+    gagal = 0
+    with ProcessPoolExecutor(max_workers=min(args.workers or os.cpu_count() or 1, len(jobs))) as pool:
+        tugas = {pool.submit(sweep_file, p, args.windows, args.strides, o, out, args.start, args.stop): out
+                 for p, o, out in jobs}
+        for fut in as_completed(tugas):
+            try:
+                print(f"{tugas[fut]}: {fut.result()} baris baru", flush=True)
+            except Exception as e:
+                gagal += 1
+                print(f"GAGAL {tugas[fut]}: {e}", file=sys.stderr, flush=True)
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Simulasi kereta-bandul + otak fuzzy tanpa layar (headless), banyak kondisi awal sekaligus.
+
+fuzzy.py menjalankan satu state per frame animasi (20 ms), jadi satu percobaan
+butuh waktu nyata. Di sini N state (N, 4) = [x, v, theta, omega] dijalankan
+bareng (lockstep) dengan fisika dan fuzzy versi array dari metnum.kendali_fuzzy,
+langkah Euler dan cek tembok sama persis dengan hitung_gerakan_fisika.
+
+Tiap baris boleh punya BATAS_MIRING_DERAJAT dan KEKUATAN_MESIN sendiri, sehingga
+peta kestabilan (sudut awal x batas miring x kekuatan) cukup satu kali simulasi.
+
+Contoh:
+    python -m metnum.simulasi_fuzzy --sudut -89 89 --n-sudut 1001 \\
+        --batas-miring 10 20 30 45 60 --kekuatan 5 10 20 40 --out peta_stabilitas.csv
+"""
+
+import argparse
+import csv
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from metnum.kendali_fuzzy import (
+    BATAS_MIRING_DERAJAT, KEKUATAN_MESIN,
+    hitung_gerakan_fisika_batch, mikir_pakai_fuzzy_batch,
+)
+
+SUDUT_JATUH_DERAJAT = 90.0   # Lewat dari ini bandul dianggap sudah jatuh (di bawah horizontal)
+SUDUT_TEGAK_DERAJAT = 1.0    # Di akhir simulasi harus sedekat ini ke tegak untuk dihitung berhasil
+
+# berhasil/jatuh per state, waktu jatuh (NaN kalau tidak jatuh), dan state di akhir simulasi
+HasilSimulasi = namedtuple("HasilSimulasi", ["berhasil", "jatuh", "waktu_jatuh", "state_akhir"])
+
+
+def simulasi_batch(sudut_awal_derajat, durasi=10.0, selisih_waktu=0.02,
+                   batas_miring=None, kekuatan=None, otak=None):
+    """
+    Jalankan N simulasi sekaligus dari kereta diam di x = 0 dengan bandul miring
+    sudut_awal_derajat (array N). batas_miring / kekuatan boleh skalar atau array N.
+    otak(sudut_derajat, kecepatan_jatuh) opsional, misal TabelFuzzy dengan setting
+    yang sama; defaultnya mikir_pakai_fuzzy_batch. otak sudah membawa settingnya
+    sendiri, jadi tidak boleh dipakai bersama batas_miring / kekuatan (ValueError).
+
+    State yang sudah jatuh tidak dihitung lagi; simulasi berhenti lebih awal kalau
+    semua state sudah jatuh.
+    """
+    if otak is not None and (batas_miring is not None or kekuatan is not None):
+        raise ValueError("otak sudah punya batas_miring/kekuatan sendiri; jangan isi keduanya")
+    sudut = np.atleast_1d(np.asarray(sudut_awal_derajat, dtype=float))
+    N = len(sudut)
+    batas_miring = np.broadcast_to(BATAS_MIRING_DERAJAT if batas_miring is None else batas_miring, (N,))
+    kekuatan = np.broadcast_to(KEKUATAN_MESIN if kekuatan is None else kekuatan, (N,))
+
+    state = np.zeros((N, 4))
+    state[:, 2] = np.radians(sudut)
+    jatuh = np.zeros(N, dtype=bool)
+    waktu_jatuh = np.full(N, np.nan)
+    batas_jatuh = np.radians(SUDUT_JATUH_DERAJAT)
+    batas_tegak = np.radians(SUDUT_TEGAK_DERAJAT)
+
+    aktif = np.arange(N)
+    n_langkah = int(round(durasi / selisih_waktu))
+    for k in range(n_langkah):
+        s = state[aktif]
+        theta_deg = np.degrees(s[:, 2])
+        if otak is None:
+            gaya = mikir_pakai_fuzzy_batch(theta_deg, s[:, 3], batas_miring[aktif], None, kekuatan[aktif])
+        else:
+            gaya = otak(theta_deg, s[:, 3])
+        s = hitung_gerakan_fisika_batch(s, gaya, selisih_waktu)
+        state[aktif] = s
+
+        baru_jatuh = np.abs(s[:, 2]) > batas_jatuh
+        if np.any(baru_jatuh):
+            idx = aktif[baru_jatuh]
+            jatuh[idx] = True
+            waktu_jatuh[idx] = (k + 1) * selisih_waktu
+            aktif = aktif[~baru_jatuh]
+            if len(aktif) == 0:
+                break
+
+    berhasil = ~jatuh & (np.abs(state[:, 2]) < batas_tegak)
+    return HasilSimulasi(berhasil, jatuh, waktu_jatuh, state)
+
+
+def peta_stabilitas(sudut_awal_derajat, nilai_batas_miring, nilai_kekuatan, **kwargs):
+    """
+    Grid lengkap sudut awal x BATAS_MIRING_DERAJAT x KEKUATAN_MESIN dalam satu simulasi batch.
+    Mengembalikan HasilSimulasi dengan field berbentuk (n_batas, n_kekuatan, n_sudut).
+    """
+    B, K, S = np.meshgrid(np.asarray(nilai_batas_miring, dtype=float),
+                          np.asarray(nilai_kekuatan, dtype=float),
+                          np.asarray(sudut_awal_derajat, dtype=float), indexing="ij")
+    hasil = simulasi_batch(S.ravel(), batas_miring=B.ravel(), kekuatan=K.ravel(), **kwargs)
+    bentuk = S.shape
+    return HasilSimulasi(hasil.berhasil.reshape(bentuk), hasil.jatuh.reshape(bentuk),
+                         hasil.waktu_jatuh.reshape(bentuk), hasil.state_akhir.reshape(bentuk + (4,)))
+
+
+def rentang_stabil(sudut, berhasil):
+    """Rentang sudut awal berhasil terlebar yang memuat 0 derajat, (min, max) atau None."""
+    i0 = int(np.argmin(np.abs(sudut)))
+    if not berhasil[i0]:
+        return None
+    kiri = i0
+    while kiri > 0 and berhasil[kiri - 1]:
+        kiri -= 1
+    kanan = i0
+    while kanan < len(sudut) - 1 and berhasil[kanan + 1]:
+        kanan += 1
+    return sudut[kiri], sudut[kanan]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Peta kestabilan kereta-bandul fuzzy (headless, batch)")
+    ap.add_argument("--sudut", type=float, nargs=2, default=[-89.0, 89.0], metavar=("MIN", "MAX"))
+    ap.add_argument("--n-sudut", type=int, default=1001)
+    ap.add_argument("--batas-miring", type=float, nargs="+", default=[BATAS_MIRING_DERAJAT])
+    ap.add_argument("--kekuatan", type=float, nargs="+", default=[KEKUATAN_MESIN])
+    ap.add_argument("--durasi", type=float, default=10.0, help="detik simulasi")
+    ap.add_argument("--dt", type=float, default=0.02)
+    ap.add_argument("--out", default=None, help="CSV per kondisi awal (opsional)")
+    args = ap.parse_args(argv)
+
+    sudut = np.linspace(args.sudut[0], args.sudut[1], args.n_sudut)
+    t0 = time.perf_counter()
+    hasil = peta_stabilitas(sudut, args.batas_miring, args.kekuatan,
+                            durasi=args.durasi, selisih_waktu=args.dt)
+    lama = time.perf_counter() - t0
+    print(f"{hasil.berhasil.size} simulasi, {lama:.2f} s")
+
+    print(f"{'batas_miring':>12} {'kekuatan':>9} {'berhasil':>9} {'jatuh':>7}  rentang stabil (derajat)")
+    for a, b in enumerate(args.batas_miring):
+        for c, k in enumerate(args.kekuatan):
+            ok = hasil.berhasil[a, c]
+            r = rentang_stabil(sudut, ok)
+            teks = "-" if r is None else f"{r[0]:.2f} .. {r[1]:.2f}"
+            print(f"{b:12g} {k:9g} {ok.mean():9.1%} {hasil.jatuh[a, c].mean():7.1%}  {teks}")
+
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["batas_miring", "kekuatan", "sudut_awal", "berhasil", "jatuh", "waktu_jatuh"])
+            for a, b in enumerate(args.batas_miring):
+                for c, k in enumerate(args.kekuatan):
+                    for i, s in enumerate(sudut):
+                        w.writerow([b, k, s, int(hasil.berhasil[a, c, i]), int(hasil.jatuh[a, c, i]),
+                                    "" if np.isnan(hasil.waktu_jatuh[a, c, i]) else hasil.waktu_jatuh[a, c, i]])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
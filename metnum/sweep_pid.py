@@ -0,0 +1,196 @@
+"""
+Sweep parameter PID untuk pendulum aqil.py tanpa GUI.
+
+aqil.py (dengan PAKAI_PID = True atau simulasi(pakai_pid=True)) menghitung satu
+lintasan 10 detik untuk satu set (Kp, Ki, Kd). Di sini seluruh grid (Kp, Ki, Kd,
+sudut awal) disimulasikan bersamaan sebagai array state (N,), dengan PID diskrit
+dan langkah Euler yang sama persis dengan loop di aqil.py (PID_control + theta_dot
+dulu, lalu theta pakai theta_dot baru).
+
+Metrik dihitung sambil jalan (tanpa menyimpan lintasan):
+    overshoot_persen : simpangan terbesar melewati setpoint, % dari error awal
+    settling_time    : waktu terakhir |error| di luar pita 2% error awal
+                       (inf kalau sampai t_max belum masuk pita)
+    iae, ise         : integral |e| dt dan e^2 dt
+
+Grid dibagi per potongan ke beberapa proses (ProcessPoolExecutor).
+
+Contoh (11 x 6 x 11 gain x 3 sudut awal = 2178 simulasi):
+    python -m metnum.sweep_pid --kp 0 50 11 --ki 0 5 6 --kd 0 10 11 --sudut 30 90 150 \\
+        --out sweep_pid.csv
+"""
+
+import argparse
+import csv
+import math
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Parameter fisis sama dengan aqil.py
+M = 1.0
+L = 1.0
+G = 9.81
+C_GESEK = 0.2
+I_CM = (1 / 12) * M * L**2
+A = (1 / 4) * M * L**2 + I_CM
+B = (M * G * L) / 2
+
+PITA_SETTLING = 0.02
+
+HasilPID = namedtuple("HasilPID", ["overshoot_persen", "settling_time", "iae", "ise", "theta_akhir"])
+
+
+def simulasi_pid_batch(Kp, Ki, Kd, theta0, dt=0.02, t_max=10.0, setpoint=0.0, simpan_lintasan=False):
+    """
+    Simulasikan N pendulum sekaligus. Kp, Ki, Kd, theta0 (radian) di-broadcast ke (N,).
+    Mengembalikan HasilPID berisi array (N,); dengan simpan_lintasan=True juga
+    lintasan theta (n_waktu, N).
+    """
+    Kp, Ki, Kd, theta0 = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                               for v in (Kp, Ki, Kd, theta0)))
+    N = Kp.shape[0]
+    n_waktu = len(np.arange(0, t_max, dt))
+
+    theta = theta0.copy()
+    theta_dot = np.zeros(N)
+    integral = np.zeros(N)
+    prev_error = np.zeros(N)
+
+    e0 = np.abs(setpoint - theta0)
+    arah = np.sign(theta0 - setpoint)          # sisi awal; overshoot = lewat ke sisi sebaliknya
+    pita = PITA_SETTLING * np.where(e0 > 0, e0, 1.0)
+    lewat_maks = np.zeros(N)
+    terakhir_di_luar = np.full(N, -1)
+    iae = np.zeros(N)
+    ise = np.zeros(N)
+    lintasan = np.empty((n_waktu, N)) if simpan_lintasan else None
+
+    for i in range(n_waktu):
+        if simpan_lintasan:
+            lintasan[i] = theta
+        e = setpoint - theta
+        iae += np.abs(e) * dt
+        ise += e * e * dt
+        np.maximum(lewat_maks, -(theta - setpoint) * arah, out=lewat_maks)
+        terakhir_di_luar[np.abs(e) > pita] = i
+        if i == n_waktu - 1:
+            break
+
+        # PID_control (aqil.py)
+        error = setpoint - theta
+        integral += error * dt
+        derivative = (error - prev_error) / dt
+        prev_error = error
+        tau = Kp * error + Ki * integral + Kd * derivative
+
+        # Rumus gerak + Euler (aqil.py)
+        theta_ddot = (tau - B * np.sin(theta) - C_GESEK * theta_dot) / A
+        theta_dot = theta_dot + theta_ddot * dt
+        theta = theta + theta_dot * dt
+
+    overshoot = 100.0 * lewat_maks / np.where(e0 > 0, e0, 1.0)
+    settling = np.where(terakhir_di_luar == n_waktu - 1, np.inf, (terakhir_di_luar + 1) * dt)
+    hasil = HasilPID(overshoot, settling, iae, ise, theta)
+    return (hasil, lintasan) if simpan_lintasan else hasil
+
+
+def _potongan(args):
+    Kp, Ki, Kd, theta0, dt, t_max = args
+    return simulasi_pid_batch(Kp, Ki, Kd, theta0, dt=dt, t_max=t_max)
+
+
+def sweep_grid(nilai_kp, nilai_ki, nilai_kd, sudut_awal_derajat, dt=0.02, t_max=10.0,
+               workers=None, ukuran_potongan=2048):
+    """
+    Grid lengkap Kp x Ki x Kd x sudut awal. Mengembalikan (grid, hasil) dengan grid
+    dict berisi array datar Kp, Ki, Kd, sudut_awal dan hasil HasilPID berbentuk sama.
+    """
+    Kp, Ki, Kd, S = (v.ravel() for v in np.meshgrid(np.asarray(nilai_kp, dtype=float),
+                                                      np.asarray(nilai_ki, dtype=float),
+                                                      np.asarray(nilai_kd, dtype=float),
+                                                      np.asarray(sudut_awal_derajat, dtype=float),
+                                                      indexing="ij"))
+    theta0 = np.radians(S)
+    potongan = [(Kp[a:a + ukuran_potongan], Ki[a:a + ukuran_potongan], Kd[a:a + ukuran_potongan],
+                 theta0[a:a + ukuran_potongan], dt, t_max)
+                for a in range(0, len(Kp), ukuran_potongan)]
+
+    workers = min(workers or os.cpu_count() or 1, len(potongan))
+    if workers <= 1:
+        bagian = [_potongan(p) for p in potongan]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            bagian = list(pool.map(_potongan, potongan))
+
+    hasil = HasilPID(*(np.concatenate([getattr(b, f) for b in bagian]) for f in HasilPID._fields))
+    return {"Kp": Kp, "Ki": Ki, "Kd": Kd, "sudut_awal": S}, hasil
+
+
+def ringkas_per_gain(grid, hasil):
+    """
+    Gabungkan semua sudut awal untuk tiap set gain: overshoot & settling terburuk,
+    IAE & ISE rata-rata. Diurutkan dari IAE rata-rata terkecil (yang settle dulu).
+    """
+    kunci = np.column_stack([grid["Kp"], grid["Ki"], grid["Kd"]])
+    unik, inv = np.unique(kunci, axis=0, return_inverse=True)
+    inv = inv.ravel()
+    n = len(unik)
+    hitung = np.bincount(inv, minlength=n)
+    os_maks = np.full(n, -np.inf)
+    np.maximum.at(os_maks, inv, hasil.overshoot_persen)
+    ts_maks = np.full(n, -np.inf)
+    np.maximum.at(ts_maks, inv, hasil.settling_time)
+    iae = np.bincount(inv, hasil.iae, minlength=n) / hitung
+    ise = np.bincount(inv, hasil.ise, minlength=n) / hitung
+    urutan = np.lexsort((iae, ~np.isfinite(ts_maks)))
+    return unik[urutan], os_maks[urutan], ts_maks[urutan], iae[urutan], ise[urutan]
+
+
+def _rentang(teks):
+    a, b, n = teks
+    return np.linspace(float(a), float(b), int(n))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Sweep Kp/Ki/Kd dan sudut awal untuk pendulum PID (aqil.py)")
+    ap.add_argument("--kp", nargs=3, default=["0", "50", "11"], metavar=("MIN", "MAX", "N"))
+    ap.add_argument("--ki", nargs=3, default=["0", "5", "6"], metavar=("MIN", "MAX", "N"))
+    ap.add_argument("--kd", nargs=3, default=["0", "10", "11"], metavar=("MIN", "MAX", "N"))
+    ap.add_argument("--sudut", type=float, nargs="+", default=[90.0], help="sudut awal (derajat)")
+    ap.add_argument("--dt", type=float, default=0.02)
+    ap.add_argument("--t-max", type=float, default=10.0)
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--top", type=int, default=10, help="jumlah set gain terbaik yang dicetak")
+    ap.add_argument("--out", default=None, help="CSV per simulasi (opsional)")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    grid, hasil = sweep_grid(_rentang(args.kp), _rentang(args.ki), _rentang(args.kd), args.sudut,
+                             dt=args.dt, t_max=args.t_max, workers=args.workers)
+    print(f"{len(grid['Kp'])} simulasi, {time.perf_counter() - t0:.2f} s")
+
+    gain, os_maks, ts_maks, iae, ise = ringkas_per_gain(grid, hasil)
+    print(f"{'Kp':>8} {'Ki':>8} {'Kd':>8} {'overshoot%':>11} {'settling':>9} {'IAE':>9} {'ISE':>9}")
+    for k in range(min(args.top, len(gain))):
+        kp, ki, kd = gain[k]
+        print(f"{kp:8.3g} {ki:8.3g} {kd:8.3g} {os_maks[k]:11.2f} {ts_maks[k]:9.2f} {iae[k]:9.4f} {ise[k]:9.4f}")
+
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["Kp", "Ki", "Kd", "sudut_awal", "overshoot_persen", "settling_time", "iae", "ise"])
+            for i in range(len(grid["Kp"])):
+                w.writerow([grid["Kp"][i], grid["Ki"][i], grid["Kd"][i], grid["sudut_awal"][i],
+                            hasil.overshoot_persen[i],
+                            "" if math.isinf(hasil.settling_time[i]) else hasil.settling_time[i],
+                            hasil.iae[i], hasil.ise[i]])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
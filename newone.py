@@ -1,5 +1,11 @@
-import tkinter as tk
 import math
+import time
+
+import numpy as np
+
+from metnum.integrator import DormandPrince
+from metnum.jit_kernels import ADA_NUMBA, rk4_langkah_jit
+from metnum.ringbuffer import DecimasiMinMax, minmax_per_kolom
 
 # ==========================================
 # 1. KONFIGURASI VARIABEL GLOBAL
@@ -21,7 +27,25 @@ theta = 0.0      # Sudut (Radian)
 omega = 0.0      # Kecepatan Sudut (Rad/s)
 dt = 0.01        # Time Sampling
 running = False
-data_history = [] 
+ringkasan_grafik = DecimasiMinMax(4096)  # min/max per bin sejak t = 0, untuk digambar
+garis_grafik = None                      # item line di canvas_graph, di-update in-place
+label_waktu = None
+
+# Metode integrasi: "rk4" (langkah tetap dt) atau "rk45" (Dormand-Prince adaptif,
+# dt hanya jadi jarak antar frame; langkah internal diatur dari toleransi)
+METODE_INTEGRASI = "rk4"
+TOLERANSI_RK45 = 1e-6
+ode = None
+
+# Loop waktu-nyata: fisika maju sebanyak yang dibutuhkan jam dinding (akumulator
+# langkah tetap dt), gambar di-render paling banyak FPS_MAKS kali per detik
+FPS_MAKS = 60
+MAKS_LANGKAH_PER_FRAME = 20000   # Batas aman kalau fisika tidak sanggup real-time
+akumulator = 0.0                 # Sisa waktu nyata yang belum disimulasikan (s)
+waktu_nyata_terakhir = 0.0
+nomor_frame = 0
+lapor_t, lapor_nyata = 0.0, 0.0  # Titik acuan untuk hitung kecepatan simulasi
+label_kecepatan = None
 
 # Variabel GUI
 root = None
@@ -39,12 +63,16 @@ scale = 180
 # 2. RUMUS FISIKA & NUMERIK (MANUAL)
 # ==========================================
 
+def pakai_gesekan():
+    """Status checkbox "Gunakan Gesekan"; kalau di-import tanpa GUI, gesekan dipakai."""
+    return True if use_friction is None else use_friction.get()
+
 def hitung_percepatan_manual(theta_in, omega_in):
     """
     Menghitung alpha (percepatan sudut) secara manual.
     Referensi: PDF Halaman 12 - Persamaan Lagrange
     """
-    global m, l, g, b, I_cm, use_friction
+    global m, l, g, b, I_cm
     
     # 1. Momen Inersia Total (J)
     # Rumus: (1/4 * m * l^2) + I
@@ -56,7 +84,7 @@ def hitung_percepatan_manual(theta_in, omega_in):
     
     # 3. Torsi Gesekan (Opsional)
     torsi_gesek = 0.0
-    if use_friction.get():
+    if pakai_gesekan():
         torsi_gesek = -b * omega_in
         
     # 4. Percepatan Sudut (Alpha) = Torsi Total / Inersia
@@ -105,6 +133,28 @@ def rk4_step_manual():
     # Update Waktu
     t += h
 
+def rk4_step():
+    """
+    Satu langkah RK4 dt. Kalau numba terpasang, langkah yang sama dijalankan versi
+    compiled (metnum/jit_kernels.py); kalau tidak, rk4_step_manual di atas.
+    """
+    global theta, omega, t
+    if not ADA_NUMBA:
+        rk4_step_manual()
+        return
+    theta, omega = rk4_langkah_jit(theta, omega, dt, m, l, g, b, I_cm, pakai_gesekan())
+    t += dt
+
+def turunan(t_in, y):
+    """Sistem orde 1 untuk integrator adaptif: y = [theta, omega]."""
+    return [y[1], hitung_percepatan_manual(y[0], y[1])]
+
+def rk45_step():
+    """Maju satu frame (dt) dengan Dormand-Prince adaptif; nilai di t+dt dari dense output."""
+    global theta, omega, t
+    t += dt
+    theta, omega = ode.maju_ke(t)
+
 
 #VISUAL
 def draw_pendulum(theta_rad):
@@ -181,9 +231,11 @@ def draw_grid_labels(event=None):
 def update_graph():
     """
     Menggambar garis grafik (plot) data history.
+    Garis dan label waktu dibuat sekali lalu hanya koordinatnya yang diganti.
+    Titik diturunkan ke min/max per kolom piksel, jadi biayanya sebanding lebar
+    grafik, bukan panjang history.
     """
-    canvas_graph.delete("plot")
-    canvas_graph.delete("dynamic_labels")
+    global garis_grafik, label_waktu
     
     w = canvas_graph.winfo_width()
     h = canvas_graph.winfo_height()
@@ -197,42 +249,47 @@ def update_graph():
     graph_h = h - margin_bottom - margin_top
     cy = margin_top + (graph_h / 2)
     
-    if len(data_history) < 2: return
+    if len(ringkasan_grafik) < 2: return
 
     # Auto Scale Waktu
-    t_max = data_history[-1][0]
-    t_scale = max(10.0, t_max)
+    t_scale = max(10.0, t)
     
-    points = []
-    for t_val, theta_deg in data_history:
-        # Mapping Waktu (X)
-        px = margin_left + (t_val / t_scale) * graph_w
-        
-        # Mapping Sudut (Y)
-        py = cy - (theta_deg / 180.0) * (graph_h / 2) * 0.9
-        
-        points.append(px)
-        points.append(py)
+    t_bin, deg_min, deg_max = ringkasan_grafik.data()
+    # Mapping Waktu (X), lalu sisakan min & max tiap kolom piksel
+    px = margin_left + (t_bin / t_scale) * graph_w
+    px, deg = minmax_per_kolom(px, deg_min, deg_max)
+    # Mapping Sudut (Y)
+    py = cy - (deg / 180.0) * (graph_h / 2) * 0.9
     
-    # Gambar Garis Biru Grafik
+    points = np.empty(2 * len(px))
+    points[0::2] = px
+    points[1::2] = py
+    
+    # Gambar Garis Biru Grafik (update koordinat item yang sudah ada)
     if len(points) >= 4:
-        canvas_graph.create_line(points, fill="blue", width=2, tags="plot")
+        if garis_grafik is None:
+            garis_grafik = canvas_graph.create_line(0, 0, 0, 0, fill="blue", width=2, tags="plot")
+        canvas_graph.coords(garis_grafik, points.tolist())
         
     # Gambar Label Waktu Berjalan (Dinamis)
-    label_x_pos = margin_left + (t_max / t_scale) * graph_w
+    label_x_pos = margin_left + (t / t_scale) * graph_w
     
     limit_x = w - margin_right - 60
     if label_x_pos > limit_x: label_x_pos = limit_x
         
-    canvas_graph.create_text(label_x_pos, h - margin_bottom + 5, 
-                             text=f"{t_max:.1f}", anchor="n", fill="blue", font=("Arial", 8), tags="dynamic_labels")
+    if label_waktu is None:
+        label_waktu = canvas_graph.create_text(label_x_pos, h - margin_bottom + 5, anchor="n",
+                                               fill="blue", font=("Arial", 8), tags="dynamic_labels")
+    canvas_graph.coords(label_waktu, label_x_pos, h - margin_bottom + 5)
+    canvas_graph.itemconfig(label_waktu, text=f"{t:.1f}")
 
 # ==========================================
 # 4. KONTROL UTAMA (LOOP)
 # ==========================================
 
 def start_sim():
-    global theta, omega, t, dt, running, data_history
+    global theta, omega, t, dt, running, ode
+    global akumulator, waktu_nyata_terakhir, nomor_frame, lapor_t, lapor_nyata
     try:
         val_dt = float(entry_dt.get())
         val_deg = float(entry_theta.get())
@@ -251,8 +308,15 @@ def start_sim():
         theta = math.radians(val_deg)
         omega = 0.0
         t = 0.0
+        if METODE_INTEGRASI == "rk45":
+            ode = DormandPrince(turunan, t, [theta, omega], rtol=TOLERANSI_RK45, atol=TOLERANSI_RK45 * 1e-3)
         running = True
-        data_history = []
+        ringkasan_grafik.clear()
+
+        akumulator = 0.0
+        nomor_frame = 0
+        waktu_nyata_terakhir = time.perf_counter()
+        lapor_t, lapor_nyata = t, waktu_nyata_terakhir
         
         run_loop()
     except ValueError:
@@ -262,33 +326,59 @@ def stop_sim():
     global running
     running = False
 
+def langkah_fisika():
+    """Satu langkah fisika dt + simpan datanya ke history grafik."""
+    # 1. Hitung Fisika
+    if METODE_INTEGRASI == "rk45":
+        rk45_step()
+    else:
+        rk4_step()
+    
+    # 2. Simpan Data
+    deg = math.degrees(theta)
+    
+    # Opsional: Normalisasi data grafik juga biar grafiknya tidak 'terbang' kalau berputar
+    # Jika bandul berputar penuh (looping), grafik akan tetap di range -180 s/d 180
+    deg_graph = (deg + 180) % 360 - 180
+    
+    ringkasan_grafik.append(t, deg_graph)
+
 def run_loop():
-    global t, theta, running
+    global running, akumulator, waktu_nyata_terakhir, nomor_frame, lapor_t, lapor_nyata
     
     if running:
-        # 1. Hitung Fisika
-        rk4_step_manual()
-        
-        # 2. Simpan Data
-        deg = math.degrees(theta)
-        
-        # Opsional: Normalisasi data grafik juga biar grafiknya tidak 'terbang' kalau berputar
-        # Jika bandul berputar penuh (looping), grafik akan tetap di range -180 s/d 180
-        deg_graph = (deg + 180) % 360 - 180
-        
-        data_history.append((t, deg_graph))
+        awal_frame = time.perf_counter()
+        akumulator += awal_frame - waktu_nyata_terakhir
+        waktu_nyata_terakhir = awal_frame
+
+        # 1-2. Fisika: kejar jam dinding dengan langkah tetap dt
+        n_langkah = int(akumulator / dt)
+        if n_langkah > MAKS_LANGKAH_PER_FRAME:
+            # tidak sanggup real-time: buang sisa waktu (kelihatan di laporan kecepatan)
+            n_langkah = MAKS_LANGKAH_PER_FRAME
+            akumulator = 0.0
+        else:
+            akumulator -= n_langkah * dt
+        for _ in range(n_langkah):
+            langkah_fisika()
         
-        # Hapus data lama jika terlalu banyak
-        if len(data_history) > 100000: data_history.pop(0)
-        
-        # 3. Update Visual
+        # 3. Update Visual (sekali per frame, berapapun langkah fisikanya)
         draw_pendulum(theta)
+        nomor_frame += 1
         
-        if len(data_history) % 3 == 0:
+        if nomor_frame % 3 == 0:
             update_graph()
+
+        # Laporan kecepatan simulasi (waktu simulasi / waktu nyata), tiap ~0.5 s
+        sekarang = time.perf_counter()
+        if sekarang - lapor_nyata >= 0.5:
+            rasio = (t - lapor_t) / (sekarang - lapor_nyata)
+            label_kecepatan.config(text=f"Kecepatan sim: {rasio:.2f}x real-time")
+            lapor_t, lapor_nyata = t, sekarang
             
-        # 4. Schedule Frame Berikutnya
-        delay = int(dt * 1000)
+        # 4. Schedule Frame Berikutnya (dibatasi FPS_MAKS)
+        sisa = 1.0 / FPS_MAKS - (sekarang - awal_frame)
+        delay = int(sisa * 1000)
         if delay < 1: delay = 1
         root.after(delay, run_loop)
 
@@ -296,53 +386,64 @@ def run_loop():
 # 5. SETUP GUI (TAMPILAN)
 # ==========================================
 
-root = tk.Tk()
-root.title("Simulasi Physical Pendulum (Normalized)")
-root.geometry("1100x600")
+def main():
+    global root, canvas_anim, canvas_graph, entry_dt, entry_theta, use_friction, label_kecepatan
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.title("Simulasi Physical Pendulum (Normalized)")
+    root.geometry("1100x600")
+
+    # --- FRAME KIRI (ANIMASI) ---
+    frame_anim = tk.Frame(root, width=500, bg="white", relief="sunken", bd=2)
+    frame_anim.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+    canvas_anim = tk.Canvas(frame_anim, bg="white")
+    canvas_anim.pack(fill=tk.BOTH, expand=True)
+
+    # --- FRAME TENGAH (KONTROL) ---
+    frame_control = tk.Frame(root, width=200, bg="#f0f0f0")
+    frame_control.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=10)
 
-# --- FRAME KIRI (ANIMASI) ---
-frame_anim = tk.Frame(root, width=500, bg="white", relief="sunken", bd=2)
-frame_anim.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+    tk.Label(frame_control, text="Time Sampling, dt").pack(pady=(30, 0))
+    entry_dt = tk.Entry(frame_control, width=10, justify='center')
+    entry_dt.insert(0, "0.01")
+    entry_dt.pack(pady=5)
 
-canvas_anim = tk.Canvas(frame_anim, bg="white")
-canvas_anim.pack(fill=tk.BOTH, expand=True)
+    tk.Label(frame_control, text="Teta awal (deg)").pack(pady=(10, 0))
+    entry_theta = tk.Entry(frame_control, width=10, justify='center')
+    entry_theta.insert(0, "90")
+    entry_theta.pack(pady=5)
 
-# --- FRAME TENGAH (KONTROL) ---
-frame_control = tk.Frame(root, width=200, bg="#f0f0f0")
-frame_control.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=10)
+    btn_start = tk.Button(frame_control, text="Start", bg="#ddffdd", command=start_sim, width=15, height=2)
+    btn_start.pack(pady=(30, 10))
 
-tk.Label(frame_control, text="Time Sampling, dt").pack(pady=(30, 0))
-entry_dt = tk.Entry(frame_control, width=10, justify='center')
-entry_dt.insert(0, "0.01")
-entry_dt.pack(pady=5)
+    btn_stop = tk.Button(frame_control, text="Stop", bg="#ffdddd", command=stop_sim, width=15, height=2)
+    btn_stop.pack(pady=5)
 
-tk.Label(frame_control, text="Teta awal (deg)").pack(pady=(10, 0))
-entry_theta = tk.Entry(frame_control, width=10, justify='center')
-entry_theta.insert(0, "90")
-entry_theta.pack(pady=5)
+    use_friction = tk.BooleanVar(value=True)
+    tk.Checkbutton(frame_control, text="Gunakan Gesekan", variable=use_friction).pack(pady=20)
 
-btn_start = tk.Button(frame_control, text="Start", bg="#ddffdd", command=start_sim, width=15, height=2)
-btn_start.pack(pady=(30, 10))
+    label_kecepatan = tk.Label(frame_control, text="Kecepatan sim: -")
+    label_kecepatan.pack(pady=5)
 
-btn_stop = tk.Button(frame_control, text="Stop", bg="#ffdddd", command=stop_sim, width=15, height=2)
-btn_stop.pack(pady=5)
+    # --- FRAME KANAN (GRAFIK) ---
+    frame_graph = tk.Frame(root, width=500, bg="white", relief="sunken", bd=2)
+    frame_graph.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-use_friction = tk.BooleanVar(value=True)
-tk.Checkbutton(frame_control, text="Gunakan Gesekan", variable=use_friction).pack(pady=20)
+    tk.Label(frame_graph, text="Grafik Theta vs Time", bg="white", font=("Arial", 10, "bold")).pack()
+    canvas_graph = tk.Canvas(frame_graph, bg="white")
+    canvas_graph.pack(fill=tk.BOTH, expand=True)
 
-# --- FRAME KANAN (GRAFIK) ---
-frame_graph = tk.Frame(root, width=500, bg="white", relief="sunken", bd=2)
-frame_graph.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+    # BINDING PENTING: Agar Grid Responsif saat Resize
+    canvas_graph.bind("<Configure>", draw_grid_labels)
 
-tk.Label(frame_graph, text="Grafik Theta vs Time", bg="white", font=("Arial", 10, "bold")).pack()
-canvas_graph = tk.Canvas(frame_graph, bg="white")
-canvas_graph.pack(fill=tk.BOTH, expand=True)
+    # Gambar awal saat aplikasi dibuka
+    draw_pendulum(math.radians(90))
 
-# BINDING PENTING: Agar Grid Responsif saat Resize
-canvas_graph.bind("<Configure>", draw_grid_labels)
+    # Jalankan Aplikasi
+    root.mainloop()
 
-# Gambar awal saat aplikasi dibuka
-draw_pendulum(math.radians(90))
 
-# Jalankan Aplikasi
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,10 @@
 import math
-import matplotlib.pyplot as plt
+from metnum.baseline import remove_baseline_fast
+from metnum.ecg_io import load_ecg
 
 def load_data(filename):
-    t = []
-    x = []
-    with open(filename, 'r') as f:
-        for line in f:
-            parts = line.strip().split()
-            if len(parts) == 2:
-                t.append(float(parts[0]))
-                x.append(float(parts[1]))
-    return t, x
+    # format dideteksi otomatis, hasil parsing di-cache ke .npy (lihat metnum/ecg_io.py)
+    return load_ecg(filename)
 
 # POLYNOMIAL REGRESSION (MANUAL - NORMAL EQUATION)
 
@@ -102,64 +96,74 @@ def remove_baseline(t, x, window, degree):
 
 
 # MAIN PROGRAM
-
-filename = "FetalECG.txt"
-t, x = load_data(filename)
-
-window = 200        
-degree = 3          
-
-corrected, baseline, half = remove_baseline(t, x, window, degree)
-
-
-# PLOTTING
-
-plt.figure(figsize=(14, 10))
-
-#subplot1
-plt.subplot(3, 1, 1)
-plt.plot(t, x, color="blue")
-plt.title("Sinyal Fetal ECG Asli")
-plt.xlabel("Waktu (s)")
-plt.ylabel("Amplitudo")
-plt.grid(True)
-
-#subplot2
-plt.subplot(3, 1, 2)
-
-plt.plot(
-    t[half:-half],
-    x[half:-half],
-    color="blue",
-    linewidth=1.2,
-    label="Original ECG"
-)
-
-plt.plot(
-    t[half:-half],
-    baseline[half:-half],
-    color="orange",
-    linewidth=2.5,
-    label=f"Baseline (orde {degree})"
-)
-
-plt.title("Baseline Estimation (Low Order, Local)")
-plt.xlabel("Waktu (s)")
-plt.ylabel("Amplitudo")
-plt.legend()
-plt.grid(True)
-
-# subplot3
-plt.subplot(3, 1, 3)
-plt.plot(
-    t[half:-half],
-    corrected[half:-half],
-    color="green"
-)
-plt.title("Sinyal Setelah Baseline Wander Dihilangkan")
-plt.xlabel("Waktu (s)")
-plt.ylabel("Amplitudo")
-plt.grid(True)
-
-plt.tight_layout()
-plt.show()
+# (dalam main() supaya poly_regression dkk. bisa di-import tanpa membaca data / membuka plot)
+
+def main():
+    import matplotlib.pyplot as plt
+
+    filename = "FetalECG.txt"
+    t, x = load_data(filename)
+
+    window = 200        
+    degree = 3          
+
+    # remove_baseline di atas masih disimpan sebagai referensi (fit ulang tiap sampel, lambat).
+    # Versi cepat memberi hasil yang sama dalam waktu hampir linear.
+    corrected, baseline, half = remove_baseline_fast(t, x, window, degree)
+
+
+    # PLOTTING
+
+    plt.figure(figsize=(14, 10))
+
+    #subplot1
+    plt.subplot(3, 1, 1)
+    plt.plot(t, x, color="blue")
+    plt.title("Sinyal Fetal ECG Asli")
+    plt.xlabel("Waktu (s)")
+    plt.ylabel("Amplitudo")
+    plt.grid(True)
+
+    #subplot2
+    plt.subplot(3, 1, 2)
+
+    plt.plot(
+        t[half:-half],
+        x[half:-half],
+        color="blue",
+        linewidth=1.2,
+        label="Original ECG"
+    )
+
+    plt.plot(
+        t[half:-half],
+        baseline[half:-half],
+        color="orange",
+        linewidth=2.5,
+        label=f"Baseline (orde {degree})"
+    )
+
+    plt.title("Baseline Estimation (Low Order, Local)")
+    plt.xlabel("Waktu (s)")
+    plt.ylabel("Amplitudo")
+    plt.legend()
+    plt.grid(True)
+
+    # subplot3
+    plt.subplot(3, 1, 3)
+    plt.plot(
+        t[half:-half],
+        corrected[half:-half],
+        color="green"
+    )
+    plt.title("Sinyal Setelah Baseline Wander Dihilangkan")
+    plt.xlabel("Waktu (s)")
+    plt.ylabel("Amplitudo")
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,72 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
+from metnum.ecg_store import load_segment
+from metnum.polyreg import select_order
 
 
-data = pd.read_csv("abdomen1.txt", header=None)
-y = data.iloc[:, 0].values
+def main():
+    import matplotlib.pyplot as plt
 
-#segment analisis
-start = 1
-end = 1000 
-y = y[start:end]
+    #segment analisis
+    #sweep banyak segmen/window/orde sekaligus (hasil kayak segment_polyfit_results.csv):
+    #python -m metnum.segment_sweep abdomen1.txt abdomen2.txt abdomen3.txt --windows 900 --strides 100 --orders 5
+    #abdomen1/2/3 sekaligus sebagai satu matriks (faktorisasi dipakai bersama semua kanal):
+    #python -m metnum.multikanal abdomen1.txt abdomen2.txt abdomen3.txt --order 5 --window 900 --stride 100
+    #pisah ECG ibu/janin + HR janin per blok 10 detik (fs 1000 Hz):
+    #python -m metnum.fetal_ecg abdomen1.txt abdomen2.txt abdomen3.txt --out fetal_hr.csv
+    start = 1
+    end = 1000 
+    #cuma y[start:end] yang dibaca kalau sudah ada store (python -m metnum.ecg_store build *.txt)
+    _, y = load_segment("abdomen1.txt", start, end)
 
-t = np.arange(len(y))
+    t = np.arange(len(y))
 
-order = 5
-coeffs = np.polyfit(t, y, order)
-baseline = np.polyval(coeffs, t)
-y_detrended = y - baseline
+    order = 5
+    pilih_orde = None #isi "bic" / "aic" / "r2" / "cv" biar orde dipilih otomatis (maksimum = order di atas)
 
+    if pilih_orde:
+        pilihan = select_order(t, y, order, criterion=pilih_orde)
+        print("Skor", pilih_orde, "per orde =", pilihan.scores)
+        order = pilihan.order
 
-Sr = np.sum((y - baseline) ** 2)
-St = np.sum((y - np.mean(y)) ** 2)
-r2 = 1 - Sr / St
+    coeffs = np.polyfit(t, y, order)
+    baseline = np.polyval(coeffs, t)
+    y_detrended = y - baseline
 
-print("Order polynomial =", order)
-print("Koefisien regresi =", coeffs)
-print("Nilai r^2 =", r2)
 
-plt.figure(figsize=(13,8))
+    Sr = np.sum((y - baseline) ** 2)
+    St = np.sum((y - np.mean(y)) ** 2)
+    r2 = 1 - Sr / St
 
-plt.subplot(3,1,1)
-plt.plot(t, y, label="Original ECG")
-plt.title("Original ECG") 
-plt.legend()
-plt.grid(True)
+    print("Order polynomial =", order)
+    print("Koefisien regresi =", coeffs)
+    print("Nilai r^2 =", r2)
 
+    plt.figure(figsize=(13,8))
 
-plt.subplot(3,1,2)
-plt.plot(t, y, label="Original")
-plt.plot(t, baseline, linewidth=2, label=f"Baseline Polyfit (Order {order})")
-plt.title(f"Baseline Fitting (order={order}) - R²={r2:.4f}")
-plt.legend()
-plt.grid(True)
+    plt.subplot(3,1,1)
+    plt.plot(t, y, label="Original ECG")
+    plt.title("Original ECG") 
+    plt.legend()
+    plt.grid(True)
 
 
-plt.subplot(3,1,3)
-plt.plot(t, y_detrended, label="Detrended ECG")
-plt.title("Detrended ECG")
-plt.legend()
-plt.grid(True)
+    plt.subplot(3,1,2)
+    plt.plot(t, y, label="Original")
+    plt.plot(t, baseline, linewidth=2, label=f"Baseline Polyfit (Order {order})")
+    plt.title(f"Baseline Fitting (order={order}) - R²={r2:.4f}")
+    plt.legend()
+    plt.grid(True)
 
-plt.tight_layout()
-plt.show()
+
+    plt.subplot(3,1,3)
+    plt.plot(t, y_detrended, label="Detrended ECG")
+    plt.title("Detrended ECG")
+    plt.legend()
+    plt.grid(True)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()